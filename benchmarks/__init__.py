@@ -0,0 +1 @@
+# Benchmarks for DaaS Contract Aggregator
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Benchmark API concurrency with async versus blocking database sessions.
+
+Fills a temporary SQLite database with ``--rows`` contracts and drives the
+app in-process (one event loop, like one uvicorn worker) with ``--clients``
+concurrent clients. Each client fetches contracts by id and, every
+``--search-every`` requests, runs a slow unindexed agency search with an
+exact total. The same load runs against the real endpoints (``AsyncSession``)
+and against ``async def`` handlers that query a sync ``Session``, as the API
+did before, where every query blocks the event loop.
+
+``--latency-ms`` adds a round trip to every statement, in the thread that
+runs it, to stand in for a database server on another host.
+
+Usage: python -m benchmarks.bench_api [--rows 50000] [--clients 32] [--latency-ms 1]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import httpx
+from fastapi import Depends, FastAPI, HTTPException
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.api import main as api
+from src.api.auth import Principal, get_current_user
+from src.config import settings
+from src.models import Base, Contract, ContractStatus, DataSource, Subscription, User
+from src.models.database import close_async_engine, get_async_engine
+from src.processors.stats import StatsRollup
+
+STATES = ["TX", "OK", "CA", "NY", "FL", "WA", "OR", "NM"]
+AGENCIES = ["Transportation", "Health", "Parks", "Water", "Education", "Corrections"]
+
+
+def add_latency(engine, seconds: float, is_async: bool = False):
+    """Sleep ``seconds`` for every statement the engine's connections run."""
+
+    def round_trip(statement):
+        time.sleep(seconds)
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        if is_async:
+            # aiosqlite runs the callback (and the sleep) on its connection thread
+            dbapi_connection.run_async(lambda conn: conn.set_trace_callback(round_trip))
+        else:
+            dbapi_connection.set_trace_callback(round_trip)
+
+
+def blocking_app(session_factory) -> FastAPI:
+    """The contract endpoints as they were: async handlers on a sync session."""
+    app = FastAPI()
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @app.get("/contracts")
+    async def search_contracts(agency: str, total_mode: str, db: Session = Depends(get_db)):
+        filters = dict.fromkeys(
+            ["keyword", "state", "category", "min_value", "max_value", "due_after"]
+            + ["due_before", "status", "naics_code"]
+        )
+        filters.update(agency=agency, collapse_duplicates=False)
+        return api._search_contracts(db, filters, "due_date", 1, 50, 50, None, total_mode)
+
+    @app.get("/contracts/{contract_id}")
+    async def get_contract(contract_id: int, db: Session = Depends(get_db)):
+        contract = db.get(Contract, contract_id)
+        if contract is None:
+            raise HTTPException(status_code=404)
+        return {"id": contract.id, "title": contract.title}
+
+    return app
+
+
+async def drive(app, args) -> tuple:
+    """Run the load for ``--seconds``; return (requests/s, p50 and p95 ms by id, searches)."""
+    transport = httpx.ASGITransport(app=app)
+    latencies, searches = [], 0
+    deadline = time.perf_counter() + args.seconds
+
+    async def client(seed):
+        nonlocal searches
+        rng = random.Random(seed)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+            n = 0
+            while time.perf_counter() < deadline:
+                n += 1
+                if n % args.search_every == 0:
+                    params = {"agency": rng.choice(AGENCIES)[:4], "total_mode": "exact"}
+                    (await http.get("/contracts", params=params)).raise_for_status()
+                    searches += 1
+                    continue
+                begin = time.perf_counter()
+                response = await http.get(f"/contracts/{rng.randrange(1, args.rows + 1)}")
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - begin)
+
+    begin = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(args.clients)))
+    elapsed = time.perf_counter() - begin
+    await close_async_engine()
+    cuts = statistics.quantiles(latencies, n=20)
+    return (len(latencies) + searches) / elapsed, cuts[9] * 1000, cuts[-1] * 1000, searches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--search-every", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    start = datetime(2024, 1, 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        # A sync pool wait would block the event loop, so never make one wait
+        engine = create_engine(f"sqlite:///{path}", pool_size=args.clients)
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(bind=engine)
+        db = session_factory()
+        db.execute(
+            insert(DataSource),
+            [{"name": "s", "base_url": "https://s.gov", "scraper_class": "TexasScraper"}],
+        )
+        db.execute(
+            insert(Contract.__table__),
+            [
+                {
+                    "external_id": str(i),
+                    "source_id": 1,
+                    "url": f"https://x.gov/{i}",
+                    "title": f"Contract {i}",
+                    "state": rng.choice(STATES),
+                    "agency": f"Department of {rng.choice(AGENCIES)}",
+                    "status": rng.choice(list(ContractStatus)).name,
+                    "due_date": start + timedelta(hours=rng.randrange(24 * 365)),
+                }
+                for i in range(args.rows)
+            ],
+        )
+        db.commit()
+        StatsRollup(db).rebuild()
+        db.close()
+        engine.dispose()
+
+        unlimited = Subscription(id=1, api_calls_per_day=10**9)
+        principal = Principal(User(id=1, email="bench@example.com", subscription=unlimited))
+        settings.database_url = f"sqlite:///{path}"
+        api.app.dependency_overrides[get_current_user] = lambda: principal
+        add_latency(engine, args.latency_ms / 1000)
+        add_latency(get_async_engine().sync_engine, args.latency_ms / 1000, is_async=True)
+
+        apps = [("blocking", blocking_app(session_factory)), ("async", api.app)]
+        for name, app in apps:
+            throughput, p50, p95, searches = asyncio.run(drive(app, args))
+            print(
+                f"{name:>8}: {throughput:7.0f} req/s  by id p50 {p50:6.1f} ms  p95 {p95:6.1f} ms"
+                f"  ({searches} searches, {args.clients} clients)"
+            )
+
+        api.app.dependency_overrides.clear()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
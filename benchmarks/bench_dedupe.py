@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark MinHash LSH duplicate detection against the pairwise scan.
+
+Fills a temporary SQLite database with ``rows`` synthetic contracts spread
+over four sources, a tenth of them near-duplicates of another source's
+contract, and times DuplicateDetector. The old all-pairs Jaccard scan is
+timed too for sizes up to ``--pairwise-max``.
+
+Usage: python -m benchmarks.bench_dedupe [--rows 10000 100000] [--pairwise-max 5000]
+"""
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.models import Base, Contract, ContractStatus, DataSource
+from src.processors.dedupe import DuplicateDetector, jaccard, title_shingles
+
+WORDS = (
+    "road bridge repair paving signal county state phase highway water sewer "
+    "janitorial services software license maintenance construction consulting "
+    "engineering design survey equipment vehicle fleet office supplies security "
+    "training medical laboratory roofing hvac electrical plumbing landscaping"
+).split() + [f"term{i}" for i in range(400)]
+
+
+def synthetic_rows(rows: int, seed: int = 7):
+    """Build contract rows; every tenth row copies an earlier one from another source."""
+    rng = random.Random(seed)
+    result = []
+    for i in range(rows):
+        if i % 10 == 9:
+            original = result[rng.randrange(len(result))]
+            title = original["title"].split()
+            title[rng.randrange(len(title))] = rng.choice(WORDS)
+            row = dict(original, title=" ".join(title), source_id=original["source_id"] % 4 + 1)
+        else:
+            row = {
+                "title": " ".join(rng.sample(WORDS, 8)) + f" {i}",
+                "agency": f"Agency {rng.randrange(50)}",
+                "due_date": datetime(2030, 1, 1) + timedelta(days=rng.randrange(365)),
+                "source_id": rng.randrange(4) + 1,
+            }
+        row.update(external_id=str(i), url=f"https://x.gov/{i}", status=ContractStatus.OPEN)
+        result.append(row)
+    return result
+
+
+def pairwise(db):
+    """The previous find_duplicates: every pair of contracts."""
+    contracts = db.query(Contract).all()
+    found = 0
+    for i, first in enumerate(contracts):
+        for second in contracts[i + 1:]:
+            if first.source_id == second.source_id:
+                continue
+            if jaccard(title_shingles(first.title), title_shingles(second.title)) >= 0.8:
+                if first.agency == second.agency or first.due_date == second.due_date:
+                    found += 1
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--pairwise-max", type=int, default=5_000)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+            Base.metadata.create_all(bind=engine)
+            db = sessionmaker(bind=engine)()
+            db.add_all(
+                DataSource(name=f"s{i}", base_url=f"https://s{i}.gov", scraper_class="TexasScraper")
+                for i in range(4)
+            )
+            db.commit()
+            db.execute(insert(Contract), synthetic_rows(rows))
+            db.commit()
+
+            start = time.perf_counter()
+            found = len(DuplicateDetector(db).find_duplicates())
+            elapsed = time.perf_counter() - start
+            line = f"{rows:>8} rows: LSH {elapsed:7.2f} s ({found} duplicates)"
+
+            if rows <= args.pairwise_max:
+                start = time.perf_counter()
+                found = pairwise(db)
+                line += f"  pairwise {time.perf_counter() - start:7.2f} s ({found} duplicates)"
+            print(line)
+
+            db.close()
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
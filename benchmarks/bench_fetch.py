@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark the pooled async HTTP client against the thread executor path.
+
+Serves a small page from a local threaded HTTP server with artificial latency
+and fetches it concurrently through both code paths.
+
+Usage: python -m benchmarks.bench_fetch [--requests 200] [--concurrency 20]
+"""
+import argparse
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from src.scrapers.http_client import HTTPClientPool
+
+PAGE = b"<html><body>" + b"<div class='row'>listing</div>" * 200 + b"</body></html>"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.05
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def _run_executor(url: str, total: int, concurrency: int) -> float:
+    """Fetch via requests.Session in the default executor (legacy path)."""
+    session = requests.Session()
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def fetch():
+        async with semaphore:
+            response = await loop.run_in_executor(None, lambda: session.get(url, timeout=30))
+            response.raise_for_status()
+            return response.text
+
+    start = time.perf_counter()
+    await asyncio.gather(*(fetch() for _ in range(total)))
+    elapsed = time.perf_counter() - start
+    session.close()
+    return elapsed
+
+
+async def _run_pooled(url: str, total: int, concurrency: int) -> float:
+    """Fetch via the shared pooled async client."""
+    pool = HTTPClientPool(max_connections=concurrency, max_connections_per_host=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch():
+        async with semaphore:
+            response = await pool.get(url)
+            response.raise_for_status()
+            return response.text
+
+    start = time.perf_counter()
+    await asyncio.gather(*(fetch() for _ in range(total)))
+    elapsed = time.perf_counter() - start
+    await pool.aclose()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    _Handler.latency = args.latency
+    ThreadingHTTPServer.request_queue_size = 128
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/listing"
+
+    try:
+        for name, runner in (("executor", _run_executor), ("pooled", _run_pooled)):
+            elapsed = asyncio.run(runner(url, args.requests, args.concurrency))
+            print(
+                f"{name:>9}: {args.requests} requests in {elapsed:.2f}s "
+                f"({args.requests / elapsed:.0f} req/s)"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
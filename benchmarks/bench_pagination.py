@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark OFFSET pagination against keyset cursors for contract listings.
+
+Fills a temporary SQLite database with ``--rows`` contracts and times
+fetching a page at increasing depths both ways. About 10% of contracts
+have no due date, so the deepest default page lands among them.
+
+Usage: python -m benchmarks.bench_pagination [--rows 200000] [--pages 1 100 1000 3000 3900]
+"""
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.models import Base, Contract, ContractStatus, DataSource
+from src.processors.pagination import CONTRACT_ORDER, keyset_page
+
+
+def best_of(function, repeat: int) -> float:
+    """Best wall time of several calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 100, 1000, 3000, 3900])
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    start = datetime(2024, 1, 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        db.execute(
+            insert(DataSource),
+            [{"name": "s", "base_url": "https://s.gov", "scraper_class": "TexasScraper"}],
+        )
+        db.execute(
+            insert(Contract.__table__),
+            [
+                {
+                    "external_id": str(i),
+                    "source_id": 1,
+                    "url": f"https://x.gov/{i}",
+                    "title": f"Contract {i}",
+                    "status": ContractStatus.OPEN.name,
+                    "due_date": (
+                        start + timedelta(hours=rng.randrange(24 * 365))
+                        if rng.random() < 0.9
+                        else None
+                    ),
+                }
+                for i in range(args.rows)
+            ],
+        )
+        db.commit()
+
+        query = db.query(Contract)
+        ordered_ids = [row.id for row in query.with_entities(Contract.id).order_by(*CONTRACT_ORDER)]
+        for page in args.pages:
+            offset = (page - 1) * args.page_size
+            if offset >= len(ordered_ids):
+                continue
+            offset_time = best_of(
+                lambda: query.order_by(*CONTRACT_ORDER)
+                .offset(offset)
+                .limit(args.page_size)
+                .all(),
+                args.repeat,
+            )
+            after = None
+            if offset:
+                previous = db.get(Contract, ordered_ids[offset - 1])
+                after = (previous.due_date, previous.id)
+            cursor_time = best_of(lambda: keyset_page(query, after, args.page_size), args.repeat)
+            print(
+                f"page {page:>5}: offset {offset_time * 1000:7.2f} ms  "
+                f"cursor {cursor_time * 1000:6.2f} ms"
+            )
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark the lxml fast-path parser against BeautifulSoup on listing pages.
+
+Pages are read from ``--pages-dir`` when given (files named after the scraper
+class, e.g. ``CaliforniaScraper-1.html``); otherwise synthetic pages with
+``--rows`` listings each are generated from the templates below.
+
+Usage: python -m benchmarks.bench_parse [--rows 200] [--repeat 5] [--pages-dir DIR]
+"""
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from src.scrapers import SCRAPER_REGISTRY
+
+ROW_TEMPLATES = {
+    "CaliforniaScraper": (
+        '<table id="BidSearchResults"><tr><th>Bid</th></tr>{rows}</table>',
+        '<tr><td><a href="/event/{i}">{i}</a></td><td>Title {i}</td><td>Agency {i}</td>'
+        "<td>01/02/2024</td><td>02/15/2030</td><td>${i},000.00</td></tr>",
+    ),
+    "TexasScraper": (
+        "{rows}",
+        '<div class="opportunity-item"><span class="solicitation-number">TX-{i}</span>'
+        '<a class="title-link" href="/esbd/{i}">Title {i}</a><span class="agency">TxDOT</span>'
+        '<p class="summary">Summary {i}</p><span class="posted-date">2024-01-05</span>'
+        '<span class="closing-date">2030-03-01</span><span class="category">Services</span>'
+        '<span class="estimated-value">${i}</span></div>',
+    ),
+    "NewYorkScraper": (
+        "{rows}",
+        '<div class="advertisement"><span class="ad-number">NY-{i}</span><h2>Title {i}</h2>'
+        '<a class="detail-link" href="ad.cfm?id={i}">Details</a><div class="agency">NYSDOT</div>'
+        '<div class="description">Description {i}</div>'
+        '<span class="publication-date">2024-02-01</span><span class="due-date">2030-02-01</span>'
+        '<span class="contract-type">Construction</span>'
+        '<span class="estimated-amount">${i}</span><div class="contact-info">'
+        '<span class="contact-name">Jane Roe</span> jane@ny.gov (518) 555-0100</div></div>',
+    ),
+    "SAMGovScraper": (
+        "{rows}",
+        '<div class="opportunity-card"><span data-testid="notice-id">N-{i}</span>'
+        '<a class="opportunity-title" href="/opp/{i}/view">Title {i}</a>'
+        '<span data-testid="agency">Army</span><span data-testid="posted-date">Jan 4, 2024</span>'
+        '<span data-testid="response-deadline">Mar 1, 2030</span>'
+        '<span data-testid="naics">334511</span><p class="opportunity-description">D {i}</p>'
+        "</div>",
+    ),
+}
+
+
+def synthetic_pages(rows: int):
+    """Build one synthetic listing page per scraper."""
+    pages = {}
+    for name, (wrapper, row) in ROW_TEMPLATES.items():
+        body = wrapper.format(rows="".join(row.format(i=i) for i in range(rows)))
+        pages[name] = [f"<html><head><title>x</title></head><body>{body}</body></html>"]
+    return pages
+
+
+def saved_pages(directory: Path):
+    """Load saved listing pages grouped by scraper class name."""
+    pages = {}
+    for path in sorted(directory.glob("*.html")):
+        name = path.stem.split("-")[0]
+        if name in SCRAPER_REGISTRY:
+            pages.setdefault(name, []).append(path.read_text(encoding="utf-8", errors="replace"))
+    return pages
+
+
+def time_backend(scraper, pages, backend: str, repeat: int):
+    """Return (best seconds per pass, contracts parsed) for a backend."""
+    scraper.parser_backend = backend
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = sum(len(asyncio.run(scraper.parse_listing_page(html))) for html in pages)
+        best = min(best, time.perf_counter() - start)
+    return best, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--pages-dir", type=Path)
+    args = parser.parse_args()
+
+    pages = saved_pages(args.pages_dir) if args.pages_dir else synthetic_pages(args.rows)
+
+    for name, html_pages in pages.items():
+        scraper = SCRAPER_REGISTRY[name](source_id=1)
+        slow, slow_count = time_backend(scraper, html_pages, "bs4", args.repeat)
+        fast, fast_count = time_backend(scraper, html_pages, "lxml", args.repeat)
+        assert slow_count == fast_count, f"{name}: backends disagree"
+        print(
+            f"{name:>18}: bs4 {slow * 1000:7.1f} ms  lxml {fast * 1000:7.1f} ms  "
+            f"speedup {slow / fast:4.1f}x  ({fast_count} contracts)"
+        )
+
+
+if __name__ == "__main__":
+    main()
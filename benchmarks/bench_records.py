@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark ScrapedContract records against ORM Contract objects.
+
+Builds ``--rows`` contracts from scraped-looking dicts both ways and reports
+construction time and peak memory (tracemalloc) for each.
+
+Usage: python -m benchmarks.bench_records [--rows 100000]
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from datetime import datetime
+
+from src.models import Contract, ContractStatus, ScrapedContract
+
+
+def scraped_data(rows: int):
+    """Build dicts shaped like a scraper's parse_listing output."""
+    return [
+        {
+            "external_id": f"TX-{i}",
+            "url": f"https://txsmartbuy.com/esbd/{i}",
+            "title": f"Road maintenance contract {i}",
+            "description": "Routine maintenance of state highways " * 3,
+            "agency": "TxDOT",
+            "estimated_value": float(i * 100),
+            "posted_date": datetime(2024, 1, 5),
+            "due_date": datetime(2030, 3, 1),
+            "status": ContractStatus.OPEN,
+            "category": "Services",
+            "raw_data": {"solicitation": f"TX-{i}", "agency": "TxDOT"},
+        }
+        for i in range(rows)
+    ]
+
+
+def build_orm(data):
+    """The previous create_contract_from_data: ORM objects with JSON raw_data."""
+    contracts = []
+    for item in data:
+        fields = {key: value for key, value in item.items() if key != "raw_data"}
+        contract = Contract(
+            source_id=1,
+            raw_data=json.dumps(item["raw_data"]),
+            last_scraped_at=datetime.utcnow(),
+            **fields,
+        )
+        contract.content_hash = contract.compute_content_hash()
+        contracts.append(contract)
+    return contracts
+
+
+def build_records(data):
+    """The current create_contract_from_data: slotted records."""
+    records = []
+    for item in data:
+        record = ScrapedContract(source_id=1, last_scraped_at=datetime.utcnow(), **item)
+        record.content_hash = record.compute_content_hash()
+        records.append(record)
+    return records
+
+
+def measure(build, data):
+    """Return (seconds, peak MiB) for building all contracts."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(data)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    data = scraped_data(args.rows)
+    orm_time, orm_mem = measure(build_orm, data)
+    record_time, record_mem = measure(build_records, data)
+    print(f"ORM Contract:    {orm_time:6.2f} s  peak {orm_mem:7.1f} MiB")
+    print(f"ScrapedContract: {record_time:6.2f} s  peak {record_mem:7.1f} MiB")
+    print(f"speedup {orm_time / record_time:.1f}x, memory {orm_mem / record_mem:.1f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark rendering /contracts pages: ORM + Pydantic versus columns + orjson.
+
+Fills a temporary SQLite database with ``--rows`` contracts and renders
+``--pages`` pages of ``--page-size`` contracts both ways:
+
+- ``pydantic``: ORM objects validated into ``ContractListResponse`` with
+  ``from_attributes`` and serialized as FastAPI does for a ``response_model``.
+- ``orjson``: only the response columns, as tuples, rendered by
+  ``contract_list_response``.
+
+Usage: python -m benchmarks.bench_responses [--rows 20000] [--pages 100] [--page-size 100]
+"""
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.api import schemas
+from src.api.responses import contract_dicts, contract_list_response, contract_rows
+from src.models import Base, Contract, ContractStatus, DataSource
+from src.processors.pagination import CONTRACT_ORDER
+
+STATES = ["TX", "OK", "CA", "NY", "FL", "WA", "OR", "NM"]
+WORDS = "road repair bridge construction janitorial software network water audit".split()
+
+
+def render_pydantic(db, adapter, offset, page_size) -> bytes:
+    """The previous path: ORM objects through the response model."""
+    contracts = db.query(Contract).order_by(*CONTRACT_ORDER).offset(offset).limit(page_size).all()
+    page = {"total": None, "page": 1, "page_size": page_size, "contracts": contracts}
+    value = adapter.validate_python(page, from_attributes=True)
+    return JSONResponse(adapter.dump_python(value, mode="json")).body
+
+
+def render_orjson(db, adapter, offset, page_size) -> bytes:
+    """The fast path: response columns as tuples, rendered by orjson."""
+    query = contract_rows(db.query(Contract)).order_by(*CONTRACT_ORDER)
+    rows = query.offset(offset).limit(page_size).all()
+    return contract_list_response(
+        total=None, page=1, page_size=page_size, contracts=contract_dicts(rows)
+    ).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    start = datetime(2024, 1, 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        db.execute(
+            insert(DataSource),
+            [{"name": "s", "base_url": "https://s.gov", "scraper_class": "TexasScraper"}],
+        )
+        db.execute(
+            insert(Contract.__table__),
+            [
+                {
+                    "external_id": str(i),
+                    "source_id": 1,
+                    "url": f"https://x.gov/{i}",
+                    "title": " ".join(rng.sample(WORDS, 4)),
+                    "description": " ".join(rng.choices(WORDS, k=60)),
+                    "agency": "Department of Transportation",
+                    "estimated_value": rng.randrange(10_000, 5_000_000) / 100,
+                    "state": rng.choice(STATES),
+                    "status": rng.choice(list(ContractStatus)).name,
+                    "posted_date": start,
+                    "due_date": start + timedelta(hours=rng.randrange(24 * 365)),
+                    "contact_email": "buyer@x.gov",
+                    "created_at": start,
+                    "updated_at": start,
+                }
+                for i in range(args.rows)
+            ],
+        )
+        db.commit()
+
+        adapter = TypeAdapter(schemas.ContractListResponse)
+        offsets = [rng.randrange(args.rows - args.page_size) for _ in range(args.pages)]
+        assert render_pydantic(db, adapter, 0, args.page_size) == render_orjson(
+            db, adapter, 0, args.page_size
+        )
+
+        for name, render in (("pydantic", render_pydantic), ("orjson", render_orjson)):
+            begin = time.perf_counter()
+            for offset in offsets:
+                render(db, adapter, offset, args.page_size)
+                db.expunge_all()
+            elapsed = (time.perf_counter() - begin) / args.pages
+            print(f"{name:>8}: {elapsed * 1000:6.2f} ms per page of {args.page_size}")
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
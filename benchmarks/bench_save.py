@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark bulk upserts against the per-row ORM path in ContractAggregator.
+
+Each run saves ``--rows`` new contracts into a fresh SQLite file, then saves
+them again with a tenth of the titles changed, and reports both timings.
+
+Usage: python -m benchmarks.bench_save [--rows 10000 100000] [--skip-legacy-above 20000]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.models import Base, ContractStatus, DataSource, ScrapedContract
+from src.processors.aggregator import ContractAggregator
+
+
+def make_contracts(source_id: int, rows: int, revision: int = 0):
+    """Build unsaved contracts; ``revision`` changes every tenth title."""
+    contracts = [
+        ScrapedContract(
+            external_id=f"BENCH-{i}",
+            source_id=source_id,
+            url=f"https://bench.gov/{i}",
+            title=f"Contract {i}" + (f" rev {revision}" if revision and i % 10 == 0 else ""),
+            agency="Bench Agency",
+            status=ContractStatus.OPEN,
+            raw_data={},
+        )
+        for i in range(rows)
+    ]
+    for contract in contracts:
+        contract.content_hash = contract.compute_content_hash()
+    return contracts
+
+
+def run(rows: int, bulk: bool):
+    """Return (insert seconds, re-save seconds, re-save stats) for one path."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        source = DataSource(name="Bench", base_url="https://bench.gov", scraper_class="TexasScraper")
+        db.add(source)
+        db.commit()
+
+        aggregator = ContractAggregator(db)
+        if not bulk:
+            aggregator._supports_bulk_upsert = lambda: False
+
+        contracts = make_contracts(source.id, rows)
+        start = time.perf_counter()
+        aggregator.save_batch(contracts, source)
+        inserted = time.perf_counter() - start
+
+        contracts = make_contracts(source.id, rows, revision=1)
+        start = time.perf_counter()
+        stats = aggregator.save_batch(contracts, source)
+        resaved = time.perf_counter() - start
+
+        db.close()
+        engine.dispose()
+        return inserted, resaved, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--skip-legacy-above", type=int, default=20_000)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        paths = [("bulk", True)]
+        if rows <= args.skip_legacy_above:
+            paths.insert(0, ("per-row", False))
+        for label, bulk in paths:
+            inserted, resaved, stats = run(rows, bulk)
+            print(
+                f"{rows:>7} rows {label:>7}: insert {inserted:6.2f} s  "
+                f"re-save {resaved:6.2f} s  ({rows / resaved:,.0f} rows/s)  {stats}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark full-text keyword search against the previous LIKE scan.
+
+Fills a temporary SQLite database with ``--rows`` contracts per size and
+times a first page of keyword results both ways.
+
+Usage: python -m benchmarks.bench_search [--rows 10000 50000 200000] [--repeat 5]
+"""
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert, or_
+from sqlalchemy.orm import sessionmaker
+
+from src.models import Base, Contract, ContractStatus, DataSource
+from src.processors.search import keyword_search
+
+WORDS = (
+    "road repair bridge construction janitorial services software license network "
+    "security consulting engineering survey paving lighting water treatment plant "
+    "maintenance vehicle fleet uniforms printing audit training medical supplies"
+).split()
+# Descriptions draw from a large vocabulary so rare terms stay rare
+FILLER = [f"term{i}" for i in range(20_000)]
+KEYWORDS = ("bridge", "constr", "water treatment", "term123", "zzz")
+
+
+def like_search(db, keyword):
+    """The previous keyword filter: a leading-wildcard ILIKE on three columns."""
+    pattern = f"%{keyword}%"
+    return db.query(Contract).filter(
+        or_(
+            Contract.title.ilike(pattern),
+            Contract.description.ilike(pattern),
+            Contract.agency.ilike(pattern),
+        )
+    )
+
+
+def fts_search(db, keyword):
+    """Keyword search through the full-text index."""
+    query, _ = keyword_search(db.query(Contract), keyword)
+    return query
+
+
+def best_of(function, repeat: int) -> float:
+    """Best wall time of several calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 50_000, 200_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        rng = random.Random(1)
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+            Base.metadata.create_all(bind=engine)
+            db = sessionmaker(bind=engine)()
+            db.execute(
+                insert(DataSource),
+                [{"name": "s", "base_url": "https://s.gov", "scraper_class": "TexasScraper"}],
+            )
+            db.execute(
+                insert(Contract.__table__),
+                [
+                    {
+                        "external_id": str(i),
+                        "source_id": 1,
+                        "url": f"https://x.gov/{i}",
+                        "title": " ".join(rng.sample(WORDS, 4)),
+                        "description": " ".join(rng.choices(FILLER, k=60)),
+                        "agency": f"Agency {rng.randrange(200)}",
+                        "status": ContractStatus.OPEN.name,
+                    }
+                    for i in range(rows)
+                ],
+            )
+            db.commit()
+
+            for keyword in KEYWORDS:
+                times = {}
+                for name, search in (("like", like_search), ("fts", fts_search)):
+                    times[name] = best_of(
+                        lambda: search(db, keyword).order_by(Contract.id).limit(50).all()
+                        + [search(db, keyword).count()],
+                        args.repeat,
+                    )
+                print(
+                    f"{rows:>8} rows  {keyword!r:>17}: like {times['like'] * 1000:8.1f} ms  "
+                    f"fts {times['fts'] * 1000:7.1f} ms"
+                )
+            db.close()
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
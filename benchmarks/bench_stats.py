@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark the statistics rollup against the per-state/per-source counts.
+
+Fills a temporary SQLite database with ``--rows`` contracts spread over a
+growing number of states and sources and times both implementations.
+
+Usage: python -m benchmarks.bench_stats [--rows 50000] [--shapes 5x5 50x50 50x500]
+"""
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.models import Base, Contract, ContractStatus, DataSource
+from src.processors.aggregator import ContractAggregator
+from src.processors.stats import StatsRollup
+
+
+def per_group_statistics(db):
+    """The previous get_statistics: 1 + 2 + states + sources queries."""
+    total = db.query(Contract).count()
+    open_contracts = db.query(Contract).filter(Contract.status == ContractStatus.OPEN).count()
+    closed = db.query(Contract).filter(Contract.status == ContractStatus.CLOSED).count()
+    by_state = {}
+    for (state,) in db.query(Contract.state).distinct().all():
+        by_state[state or "Unknown"] = db.query(Contract).filter(Contract.state == state).count()
+    by_source = {}
+    for source in db.query(DataSource).all():
+        by_source[source.name] = db.query(Contract).filter(Contract.source_id == source.id).count()
+    return total, open_contracts, closed, by_state, by_source
+
+
+def best_of(function, repeat: int) -> float:
+    """Best wall time of several calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--shapes", nargs="+", default=["5x5", "50x50", "50x500"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    statuses = list(ContractStatus)
+    for shape in args.shapes:
+        states, sources = (int(part) for part in shape.split("x"))
+        rng = random.Random(1)
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+            Base.metadata.create_all(bind=engine)
+            db = sessionmaker(bind=engine)()
+            db.execute(
+                insert(DataSource),
+                [
+                    {
+                        "name": f"s{i}",
+                        "base_url": f"https://s{i}.gov",
+                        "scraper_class": "TexasScraper",
+                    }
+                    for i in range(sources)
+                ],
+            )
+            db.execute(
+                insert(Contract),
+                [
+                    {
+                        "external_id": str(i),
+                        "source_id": rng.randrange(sources) + 1,
+                        "url": f"https://x.gov/{i}",
+                        "title": f"Contract {i}",
+                        "state": f"S{rng.randrange(states)}",
+                        "status": rng.choice(statuses),
+                    }
+                    for i in range(args.rows)
+                ],
+            )
+            db.commit()
+            StatsRollup(db).rebuild()
+
+            rollup = best_of(ContractAggregator(db).get_statistics, args.repeat)
+            per_group = best_of(lambda: per_group_statistics(db), args.repeat)
+            print(
+                f"{states:>4} states x {sources:>4} sources: rollup {rollup * 1000:7.1f} ms  "
+                f"per-group {per_group * 1000:8.1f} ms"
+            )
+            db.close()
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark contract search latency for each total_mode.
+
+Fills a temporary SQLite database with ``--rows`` contracts and times a
+client paging through the first ``--pages`` pages of a few searches:
+the total (per mode) plus the page fetch, as /contracts does.
+
+Usage: python -m benchmarks.bench_totals [--rows 200000] [--pages 5]
+"""
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.models import Base, Contract, ContractStatus, DataSource
+from src.processors.pagination import encode_cursor, decode_cursor, keyset_page
+from src.processors.search import keyword_search
+from src.processors.stats import StatsRollup
+from src.processors.totals import TOTAL_MODES, count_total, get_count_cache
+
+STATES = ["TX", "OK", "CA", "NY", "FL", "WA", "OR", "NM"]
+WORDS = "road repair bridge construction janitorial software network water audit".split()
+
+
+def searches(db):
+    """(name, filters, query) for the searches to page through."""
+    by_state = db.query(Contract).filter(Contract.state == "TX")
+    keyword, _ = keyword_search(db.query(Contract), "bridge")
+    return [
+        ("all", {}, db.query(Contract)),
+        ("state", {"state": "TX"}, by_state),
+        ("keyword", {"keyword": "bridge"}, keyword),
+    ]
+
+
+def page_through(db, filters, query, mode, pages, page_size):
+    """Fetch the first pages of a search the way /contracts does."""
+    after = None
+    for _ in range(pages):
+        count_total(db, query, filters, mode)
+        contracts = keyset_page(query, after, page_size + 1)
+        after = decode_cursor(encode_cursor(contracts[page_size - 1]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--page-size", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    start = datetime(2024, 1, 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        db.execute(
+            insert(DataSource),
+            [{"name": "s", "base_url": "https://s.gov", "scraper_class": "TexasScraper"}],
+        )
+        db.execute(
+            insert(Contract.__table__),
+            [
+                {
+                    "external_id": str(i),
+                    "source_id": 1,
+                    "url": f"https://x.gov/{i}",
+                    "title": " ".join(rng.sample(WORDS, 3)),
+                    "state": rng.choice(STATES),
+                    "status": rng.choice(list(ContractStatus)).name,
+                    "due_date": start + timedelta(hours=rng.randrange(24 * 365)),
+                }
+                for i in range(args.rows)
+            ],
+        )
+        db.commit()
+        StatsRollup(db).rebuild()
+
+        for name, filters, query in searches(db):
+            times = {}
+            for mode in TOTAL_MODES:
+                get_count_cache().clear()
+                begin = time.perf_counter()
+                page_through(db, filters, query, mode, args.pages, args.page_size)
+                times[mode] = (time.perf_counter() - begin) / args.pages
+            print(
+                f"{name:>8}: "
+                + "  ".join(f"{mode} {times[mode] * 1000:6.1f} ms" for mode in TOTAL_MODES)
+                + "  (per page)"
+            )
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
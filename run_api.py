@@ -1,22 +1,29 @@
 #!/usr/bin/env python3
-"""Run the DaaS Contract Aggregator API server."""
-import uvicorn
+"""Run the DaaS Contract Aggregator API server.
+
+Usage: python run_api.py [--production] [--workers N]
+"""
+import argparse
+
+from src.api.server import run_dev, run_production, worker_count
 from src.config import settings
-from src.models.database import init_db
-from src.api.main import app
 
 if __name__ == "__main__":
-    # Initialize database
-    print("Initializing database...")
-    init_db()
-    print("Database initialized")
+    parser = argparse.ArgumentParser(description="Run the API server.")
+    parser.add_argument(
+        "--production",
+        action="store_true",
+        help="run several worker processes without auto-reload",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="worker processes (default: API_WORKERS or one per core)"
+    )
+    args = parser.parse_args()
 
-    # Run the API server
+    # The database is initialized once here, not by every worker
     print(f"Starting API server on {settings.api_host}:{settings.api_port}")
-    uvicorn.run(
-        "src.api.main:app",
-        host=settings.api_host,
-        port=settings.api_port,
-        reload=True,
-        log_level=settings.log_level.lower(),
-    )
+    if args.production:
+        print(f"Production mode with {worker_count(args.workers)} workers")
+        run_production(workers=args.workers)
+    else:
+        run_dev()
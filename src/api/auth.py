@@ -1,16 +1,20 @@
 """Authentication and authorization for API."""
+import hashlib
 import secrets
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, APIKeyHeader
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, object_session
 
 from src.config import settings
-from src.models import get_db, User, Subscription, SubscriptionTier
+from src.models import get_async_db, User, Subscription, SubscriptionTier
 from src.api.schemas import TokenData
+from src.utils.cache import TTLCache
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -101,12 +105,127 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     return user
 
 
+class SubscriptionLimits:
+    """The subscription fields request handling needs, detached from the session."""
+
+    __slots__ = (
+        "id",
+        "api_calls_per_day",
+        "max_results_per_query",
+        "api_calls_today",
+        "last_api_call_at",
+    )
+
+    def __init__(self, subscription: Subscription):
+        """Copy the limits from a subscription row."""
+        for field in self.__slots__:
+            setattr(self, field, getattr(subscription, field))
+
+
+class Principal:
+    """An authenticated user as cached between requests.
+
+    Holds only what authorization and rate limiting need, so hot requests
+    never touch the ``users`` or ``subscriptions`` tables. Endpoints that
+    need the full profile load the ``User`` by ``id``.
+    """
+
+    __slots__ = ("id", "email", "is_active", "is_admin", "subscription")
+
+    def __init__(self, user: User):
+        """Copy the principal from a user row (loads its subscription)."""
+        self.id = user.id
+        self.email = user.email
+        self.is_active = user.is_active
+        self.is_admin = user.is_admin
+        self.subscription = SubscriptionLimits(user.subscription) if user.subscription else None
+
+    def __repr__(self) -> str:
+        """Short representation for logs."""
+        return f"Principal(id={self.id!r}, email={self.email!r})"
+
+
+_principals: Optional[TTLCache] = None
+
+
+def get_principal_cache() -> TTLCache:
+    """Get the process-wide cache of principals by API key hash or JWT subject."""
+    global _principals
+    if _principals is None:
+        _principals = TTLCache(
+            ttl_seconds=settings.auth_cache_ttl_seconds,
+            max_entries=settings.auth_cache_size,
+        )
+    return _principals
+
+
+def invalidate_principal(user_id: int):
+    """Drop a user's cached principals so the next request reloads them."""
+    get_principal_cache().delete_where(lambda principal: principal.id == user_id)
+
+
+def _principal_changed(target, user_id: int):
+    """Invalidate a user's principals now and again once the change commits.
+
+    The second pass drops anything another request cached from the old row
+    between the flush and the commit.
+    """
+    invalidate_principal(user_id)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("changed_principals", set()).add(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _user_changed(mapper, connection, user: User):
+    """Invalidate a user's principals when the user row changes."""
+    _principal_changed(user, user.id)
+
+
+@event.listens_for(Subscription, "after_insert")
+@event.listens_for(Subscription, "after_update")
+@event.listens_for(Subscription, "after_delete")
+def _subscription_changed(mapper, connection, subscription: Subscription):
+    """Invalidate a user's principals when their subscription changes."""
+    _principal_changed(subscription, subscription.user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_principals(session: Session):
+    """Invalidate the principals changed in a committed transaction."""
+    for user_id in session.info.pop("changed_principals", ()):
+        invalidate_principal(user_id)
+
+
+async def _load_principal(
+    db: AsyncSession, key: Tuple[str, str], criterion
+) -> Optional[Principal]:
+    """Get a cached principal or load it (with its subscription) in one query."""
+    cache = get_principal_cache()
+    principal = cache.get(key)
+    if principal is None:
+        result = await db.execute(
+            select(User).options(joinedload(User.subscription)).where(criterion).limit(1)
+        )
+        user = result.scalars().first()
+        if user is None:
+            return None
+        principal = Principal(user)
+        cache.set(key, principal)
+    return principal
+
+
 async def get_current_user(
     token: Optional[str] = Depends(oauth2_scheme),
     api_key: Optional[str] = Depends(api_key_header),
-    db: Session = Depends(get_db),
-) -> User:
-    """Get the current authenticated user."""
+    db: AsyncSession = Depends(get_async_db),
+) -> Principal:
+    """Get the current authenticated user.
+
+    Principals are cached for ``auth_cache_ttl_seconds``; changes to users
+    and subscriptions made through the ORM invalidate them right away.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -115,9 +234,10 @@ async def get_current_user(
 
     # Try API key first
     if api_key:
-        user = db.query(User).filter(User.api_key == api_key).first()
-        if user and user.is_active:
-            return user
+        key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+        principal = await _load_principal(db, ("api_key", key_hash), User.api_key == api_key)
+        if principal and principal.is_active:
+            return principal
 
     # Try JWT token
     if token:
@@ -130,22 +250,24 @@ async def get_current_user(
         except JWTError:
             raise credentials_exception
 
-        user = db.query(User).filter(User.email == token_data.email).first()
-        if user is None:
+        principal = await _load_principal(
+            db, ("sub", token_data.email), User.email == token_data.email
+        )
+        if principal is None:
             raise credentials_exception
-        if not user.is_active:
+        if not principal.is_active:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="User account is disabled",
             )
-        return user
+        return principal
 
     raise credentials_exception
 
 
 async def get_current_admin_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     """Get the current user and verify they are an admin."""
     if not current_user.is_admin:
         raise HTTPException(
@@ -154,27 +276,3 @@ async def get_current_admin_user(
         )
     return current_user
 
-
-def check_rate_limit(user: User, db: Session) -> bool:
-    """Check if user has exceeded their daily API rate limit."""
-    if not user.subscription:
-        return False
-
-    sub = user.subscription
-
-    # Reset counter if it's a new day
-    if sub.last_api_call_at:
-        if sub.last_api_call_at.date() < datetime.utcnow().date():
-            sub.api_calls_today = 0
-
-    # Check limit
-    if sub.api_calls_today >= sub.api_calls_per_day:
-        return False
-
-    # Increment counter
-    sub.api_calls_today += 1
-    sub.last_api_call_at = datetime.utcnow()
-    sub.total_api_calls += 1
-    db.commit()
-
-    return True
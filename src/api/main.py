@@ -1,16 +1,19 @@
 """Main FastAPI application for DaaS Contract Aggregator."""
-from datetime import timedelta
+import asyncio
+from datetime import datetime, timedelta
 from typing import List, Optional
 from fastapi import FastAPI, Depends, HTTPException, status, Query
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
 
 from src.config import settings
-from src.models import get_db, Contract, ContractStatus, DataSource, User, init_db
+from src.models import get_async_db, get_db, Contract, ContractStatus, DataSource, User
+from src.models.database import close_async_engine
 from src.api import schemas
 from src.api.auth import (
     authenticate_user,
@@ -18,11 +21,23 @@ from src.api.auth import (
     get_current_user,
     get_current_admin_user,
     create_user,
-    check_rate_limit,
+    Principal,
     ACCESS_TOKEN_EXPIRE_MINUTES,
 )
+from src.api.rate_limit import check_rate_limit, get_usage_recorder
+from src.api.responses import contract_dicts, contract_list_response, contract_rows
 from src.processors.aggregator import ContractAggregator
+from src.processors.dedupe import DuplicateIndex, exclude_duplicates
+from src.processors.pagination import (
+    CONTRACT_ORDER,
+    Cursor,
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+)
 from src.processors.scrape_manager import ScrapeManager
+from src.processors.search import keyword_search
+from src.processors.totals import count_total
 
 # Create FastAPI app
 app = FastAPI(
@@ -49,9 +64,26 @@ except Exception:
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup."""
-    from src.models.database import init_db
-    init_db()
+    """Initialize database on startup and start writing API usage in batches."""
+    if settings.api_init_db_on_startup:
+        from src.models.database import init_db
+        init_db()
+    app.state.usage_flush = asyncio.create_task(
+        get_usage_recorder().run(settings.api_usage_flush_seconds)
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the usage flush task (writing buffered API usage) and close connections."""
+    task = getattr(app.state, "usage_flush", None)
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await close_async_engine()
 
 
 # Root endpoint
@@ -75,7 +107,7 @@ async def portal():
 
 # Authentication endpoints
 @app.post("/token", response_model=schemas.Token)
-async def login_for_access_token(
+def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db),
 ):
@@ -100,7 +132,7 @@ async def login_for_access_token(
 
 
 @app.post("/register", response_model=schemas.UserResponse)
-async def register_user(
+def register_user(
     user_data: schemas.UserCreate,
     db: Session = Depends(get_db),
 ):
@@ -124,13 +156,115 @@ async def register_user(
 
 
 @app.get("/users/me", response_model=schemas.UserResponse)
-async def read_users_me(current_user: User = Depends(get_current_user)):
+async def read_users_me(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+):
     """Get current user profile."""
-    return current_user
+    return await db.get(User, current_user.id)
 
 
 # Contract endpoints
-@app.get("/contracts", response_model=schemas.ContractListResponse)
+def _search_contracts(
+    db: Session,
+    filters: dict,
+    sort: str,
+    page: int,
+    page_size: int,
+    limit: int,
+    after: Optional[Cursor],
+    total_mode: str,
+) -> dict:
+    """Run a contract search (called through ``AsyncSession.run_sync``).
+
+    The page's contracts are returned as ``ContractResponse``-shaped dicts.
+    """
+    # Build query
+    query = db.query(Contract)
+
+    # Apply filters
+    relevance = None
+    if filters["keyword"]:
+        query, relevance = keyword_search(query, filters["keyword"])
+
+    if filters["state"]:
+        query = query.filter(Contract.state == filters["state"])
+
+    if filters["category"]:
+        query = query.filter(Contract.category.ilike(f"%{filters['category']}%"))
+
+    if filters["min_value"] is not None:
+        query = query.filter(
+            or_(
+                Contract.estimated_value >= filters["min_value"],
+                Contract.budget_min >= filters["min_value"],
+            )
+        )
+
+    if filters["max_value"] is not None:
+        query = query.filter(
+            or_(
+                Contract.estimated_value <= filters["max_value"],
+                Contract.budget_max <= filters["max_value"],
+            )
+        )
+
+    if filters["due_after"]:
+        query = query.filter(Contract.due_date >= filters["due_after"])
+
+    if filters["due_before"]:
+        query = query.filter(Contract.due_date <= filters["due_before"])
+
+    if filters["status"]:
+        query = query.filter(Contract.status == filters["status"])
+
+    if filters["naics_code"]:
+        query = query.filter(Contract.naics_code.ilike(f"%{filters['naics_code']}%"))
+
+    if filters["agency"]:
+        query = query.filter(Contract.agency.ilike(f"%{filters['agency']}%"))
+
+    if filters["collapse_duplicates"]:
+        query = exclude_duplicates(query)
+
+    # Get total count
+    total, total_estimated = count_total(db, query, filters, total_mode)
+
+    # Apply pagination, fetching one extra row to know whether there is a next page
+    query = contract_rows(query)
+    by_relevance = sort == "relevance" and relevance is not None
+    if by_relevance:
+        query = query.order_by(relevance, *CONTRACT_ORDER)
+        contracts = query.offset((page - 1) * page_size).limit(limit + 1).all()
+    elif after is not None:
+        contracts = keyset_page(query, after, limit + 1)
+    else:
+        query = query.order_by(*CONTRACT_ORDER)
+        contracts = query.offset((page - 1) * page_size).limit(limit + 1).all()
+
+    next_cursor = None
+    has_more = len(contracts) > limit
+    if has_more:
+        contracts = contracts[:limit]
+        if not by_relevance:
+            next_cursor = encode_cursor(contracts[-1])
+
+    return {
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_estimated": total_estimated,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+        "contracts": contract_dicts(contracts),
+    }
+
+
+@app.get(
+    "/contracts",
+    response_model=schemas.ContractListResponse,
+    response_class=ORJSONResponse,
+)
 async def search_contracts(
     keyword: Optional[str] = Query(None, description="Search keyword"),
     state: Optional[str] = Query(None, description="Filter by state"),
@@ -142,111 +276,124 @@ async def search_contracts(
     status_filter: Optional[str] = Query(None, alias="status", description="Contract status"),
     naics_code: Optional[str] = Query(None, description="NAICS code"),
     agency: Optional[str] = Query(None, description="Agency name"),
-    page: int = Query(1, ge=1, description="Page number"),
+    collapse_duplicates: bool = Query(
+        False, description="Show one contract per cross-source duplicate cluster"
+    ),
+    sort: str = Query(
+        "due_date",
+        pattern="^(due_date|relevance)$",
+        description="Sort by due date or, with a keyword, by relevance",
+    ),
+    page: int = Query(1, ge=1, description="Page number (ignored when a cursor is given)"),
     page_size: int = Query(50, ge=1, le=100, description="Results per page"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None, description="Continue after the next_cursor of a previous page"
+    ),
+    total_mode: Optional[str] = Query(
+        None,
+        pattern="^(exact|estimated|cached|none)$",
+        description="How to compute the total (default from SEARCH_TOTAL_MODE); "
+        "none skips it and relies on has_more",
+    ),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Search and filter contracts."""
+    """Search and filter contracts.
+
+    Pages can be fetched by ``page`` number or, faster for deep pages, by
+    passing the ``next_cursor`` of the previous response as ``cursor``.
+    Cursors follow the default due date order, not relevance order.
+    Counting every match costs about as much as fetching the page, so the
+    total can be cached, estimated or skipped with ``total_mode``.
+    """
     # Check rate limit
-    if not check_rate_limit(current_user, db):
+    if not check_rate_limit(current_user):
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Daily API rate limit exceeded",
         )
 
-    # Build query
-    query = db.query(Contract)
-
-    # Apply filters
-    if keyword:
-        query = query.filter(
-            or_(
-                Contract.title.ilike(f"%{keyword}%"),
-                Contract.description.ilike(f"%{keyword}%"),
-                Contract.agency.ilike(f"%{keyword}%"),
-            )
-        )
-
-    if state:
-        query = query.filter(Contract.state == state)
-
-    if category:
-        query = query.filter(Contract.category.ilike(f"%{category}%"))
-
-    if min_value is not None:
-        query = query.filter(
-            or_(
-                Contract.estimated_value >= min_value,
-                Contract.budget_min >= min_value,
-            )
-        )
-
-    if max_value is not None:
-        query = query.filter(
-            or_(
-                Contract.estimated_value <= max_value,
-                Contract.budget_max <= max_value,
-            )
-        )
-
+    due_after_dt = due_before_dt = status_enum = None
     if due_after:
-        from datetime import datetime
         due_after_dt = datetime.fromisoformat(due_after.replace("Z", "+00:00"))
-        query = query.filter(Contract.due_date >= due_after_dt)
-
     if due_before:
-        from datetime import datetime
         due_before_dt = datetime.fromisoformat(due_before.replace("Z", "+00:00"))
-        query = query.filter(Contract.due_date <= due_before_dt)
-
     if status_filter:
         try:
             status_enum = ContractStatus(status_filter)
-            query = query.filter(Contract.status == status_enum)
         except ValueError:
             pass
 
-    if naics_code:
-        query = query.filter(Contract.naics_code.ilike(f"%{naics_code}%"))
-
-    if agency:
-        query = query.filter(Contract.agency.ilike(f"%{agency}%"))
-
-    # Get total count
-    total = query.count()
+    after = None
+    if cursor:
+        if sort == "relevance" and keyword:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursors are only supported with sort=due_date",
+            )
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    contracts = query.order_by(Contract.due_date.asc()).offset(offset).limit(page_size).all()
+    # Respect subscription limits before fetching, so cursors never skip rows
+    limit = page_size
+    if current_user.subscription and current_user.subscription.max_results_per_query:
+        limit = min(limit, current_user.subscription.max_results_per_query)
+
+    filters = {
+        "keyword": keyword,
+        "state": state,
+        "category": category,
+        "min_value": min_value,
+        "max_value": max_value,
+        "due_after": due_after_dt,
+        "due_before": due_before_dt,
+        "status": status_enum,
+        "naics_code": naics_code,
+        "agency": agency,
+        "collapse_duplicates": collapse_duplicates,
+    }
+    results = await db.run_sync(
+        _search_contracts,
+        filters,
+        sort,
+        page,
+        page_size,
+        limit,
+        after,
+        total_mode or settings.search_total_mode,
+    )
+    return contract_list_response(**results)
 
-    # Respect subscription limits
-    if current_user.subscription:
-        max_results = current_user.subscription.max_results_per_query
-        contracts = contracts[:max_results]
 
-    return {
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "contracts": contracts,
-    }
+@app.get("/contracts/states", response_model=List[str])
+async def get_states(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get list of all states with contracts."""
+    states = await db.scalars(select(Contract.state).distinct())
+    return [state for state in states if state]
 
 
 @app.get("/contracts/{contract_id}", response_model=schemas.ContractResponse)
 async def get_contract(
     contract_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get a specific contract by ID."""
-    if not check_rate_limit(current_user, db):
+    if not check_rate_limit(current_user):
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Daily API rate limit exceeded",
         )
 
-    contract = db.query(Contract).filter(Contract.id == contract_id).first()
+    contract = await db.get(Contract, contract_id)
     if not contract:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -255,36 +402,48 @@ async def get_contract(
     return contract
 
 
-@app.get("/contracts/states", response_model=List[str])
-async def get_states(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+@app.get("/contracts/{contract_id}/duplicates", response_model=List[schemas.ContractResponse])
+async def get_contract_duplicates(
+    contract_id: int,
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Get list of all states with contracts."""
-    states = db.query(Contract.state).distinct().all()
-    return [s[0] for s in states if s[0]]
+    """Get the other contracts in a contract's duplicate cluster."""
+    if not check_rate_limit(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Daily API rate limit exceeded",
+        )
+
+    cluster = await db.run_sync(lambda session: DuplicateIndex(session).cluster(contract_id))
+    duplicate_ids = [i for i in cluster if i != contract_id]
+    if not duplicate_ids:
+        return []
+    contracts = await db.scalars(
+        select(Contract).where(Contract.id.in_(duplicate_ids)).order_by(Contract.id)
+    )
+    return contracts.all()
 
 
 @app.get("/statistics", response_model=schemas.StatisticsResponse)
 async def get_statistics(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get aggregation statistics."""
-    if not check_rate_limit(current_user, db):
+    if not check_rate_limit(current_user):
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Daily API rate limit exceeded",
         )
 
-    aggregator = ContractAggregator(db)
-    return aggregator.get_statistics()
+    return await db.run_sync(lambda session: ContractAggregator(session).get_statistics())
 
 
 # Admin endpoints
 @app.get("/admin/sources", response_model=schemas.SourceListResponse)
-async def list_sources(
-    current_user: User = Depends(get_current_admin_user),
+def list_sources(
+    current_user: Principal = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """List all data sources (admin only)."""
@@ -293,9 +452,9 @@ async def list_sources(
 
 
 @app.post("/admin/sources", response_model=schemas.SourceResponse)
-async def create_source(
+def create_source(
     source_data: schemas.SourceCreate,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Create a new data source (admin only)."""
@@ -304,10 +463,19 @@ async def create_source(
     return source
 
 
+@app.post("/admin/duplicates/rebuild", response_model=schemas.DuplicateRebuildResponse)
+def rebuild_duplicates(
+    current_user: Principal = Depends(get_current_admin_user),
+    db: Session = Depends(get_db),
+):
+    """Recompute the duplicate index and clusters from scratch (admin only)."""
+    return {"duplicate_pairs": DuplicateIndex(db).rebuild()}
+
+
 @app.post("/admin/scrape/{source_id}", response_model=schemas.ScrapeResultResponse)
 async def trigger_scrape(
     source_id: int,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Trigger scraping for a specific source (admin only)."""
@@ -319,22 +487,15 @@ async def trigger_scrape(
         )
 
     manager = ScrapeManager(db)
-    import asyncio
-    result = asyncio.run(manager.scrape_source(source))
-    return result
+    return await manager.scrape_source(source)
 
 
 @app.post("/admin/scrape-all", response_model=List[schemas.ScrapeResultResponse])
 async def trigger_scrape_all(
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Trigger scraping for all active sources (admin only)."""
     manager = ScrapeManager(db)
-    import asyncio
-    results = asyncio.run(manager.scrape_all_sources())
-    return results
-
+    return await manager.scrape_all_sources()
 
-# Import datetime at module level
-from datetime import datetime
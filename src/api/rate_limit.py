@@ -0,0 +1,271 @@
+"""Per-subscription API rate limiting and batched usage accounting."""
+import asyncio
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, time as day_time
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import case, func, update
+
+from src.config import settings
+from src.api.auth import Principal
+from src.models import SessionLocal, Subscription
+from src.utils.logger import get_logger
+
+logger = get_logger("api_rate_limit")
+
+DAY_SECONDS = 24 * 3600
+
+
+class SlidingWindow:
+    """Sliding-window request counter built from two fixed windows.
+
+    Counts calls in the current fixed window (e.g. the current UTC day) and
+    the previous one, and estimates the calls in the sliding window ending
+    now as ``current + previous * overlap``, where ``overlap`` is the share
+    of the previous window still inside the sliding window. This avoids
+    the burst a fixed window allows around its reset.
+    """
+
+    __slots__ = ("window_seconds", "index", "current", "previous")
+
+    def __init__(self, window_seconds: float, now: float, current: int = 0, previous: int = 0):
+        """Initialize the counter for the window containing ``now``."""
+        self.window_seconds = window_seconds
+        self.index = int(now // window_seconds)
+        self.current = current
+        self.previous = previous
+
+    def _advance(self, now: float):
+        """Move to the fixed window containing ``now``."""
+        index = int(now // self.window_seconds)
+        if index == self.index + 1:
+            self.previous, self.current = self.current, 0
+        elif index > self.index + 1:
+            self.previous, self.current = 0, 0
+        self.index = max(index, self.index)
+
+    def estimate(self, now: float) -> float:
+        """Estimate the calls in the sliding window ending at ``now``."""
+        self._advance(now)
+        elapsed = now / self.window_seconds - self.index
+        return self.current + self.previous * (1.0 - elapsed)
+
+    def hit(self, limit: int, now: float) -> bool:
+        """Count a call if it stays within ``limit``; return whether it was allowed."""
+        if self.estimate(now) + 1 > limit:
+            return False
+        self.current += 1
+        return True
+
+
+class ApiRateLimiter:
+    """In-process sliding-window limiter of API calls per subscription.
+
+    Counters live in memory, so checking a request does no database write.
+    With several API worker processes each keeps its own counters; use
+    ``SQLiteApiRateLimiter`` to share them between processes on one machine.
+    """
+
+    def __init__(self, window_seconds: float = DAY_SECONDS):
+        """Initialize the limiter."""
+        self.window_seconds = window_seconds
+        self._windows: Dict[Hashable, SlidingWindow] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key: Hashable, limit: int, used: int = 0, now: Optional[float] = None) -> bool:
+        """Count a call for ``key`` if it is within ``limit`` calls per window.
+
+        ``used`` seeds the current window the first time a key is seen, so
+        calls recorded before a restart still count.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None:
+                window = SlidingWindow(self.window_seconds, now, current=used)
+                self._windows[key] = window
+            return window.hit(limit, now)
+
+
+class SQLiteApiRateLimiter(ApiRateLimiter):
+    """API rate limiter whose counters live in a local SQLite (WAL) file.
+
+    Lets several API worker processes on one machine share one budget per
+    subscription, without touching the main database.
+    """
+
+    def __init__(self, path: Path, window_seconds: float = DAY_SECONDS):
+        """Initialize the limiter and create the counter table."""
+        super().__init__(window_seconds=window_seconds)
+        self.path = Path(path)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS api_windows ("
+                "key TEXT PRIMARY KEY, window_index INTEGER NOT NULL, "
+                "current INTEGER NOT NULL, previous INTEGER NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the shared counter database."""
+        return sqlite3.connect(str(self.path), timeout=10, isolation_level=None)
+
+    def hit(self, key: Hashable, limit: int, used: int = 0, now: Optional[float] = None) -> bool:
+        """Count a call in a write transaction shared across processes."""
+        now = time.time() if now is None else now
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT window_index, current, previous FROM api_windows WHERE key = ?",
+                (str(key),),
+            ).fetchone()
+
+            window = SlidingWindow(self.window_seconds, now, current=used)
+            if row is not None:
+                window.index, window.current, window.previous = row
+
+            allowed = window.hit(limit, now)
+            conn.execute(
+                "INSERT OR REPLACE INTO api_windows (key, window_index, current, previous) "
+                "VALUES (?, ?, ?, ?)",
+                (str(key), window.index, window.current, window.previous),
+            )
+            conn.execute("COMMIT")
+            return allowed
+        except sqlite3.Error as e:
+            logger.error(f"Shared API rate limiter unavailable, using local counters: {e}")
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            return super().hit(key, limit, used=used, now=now)
+        finally:
+            conn.close()
+
+
+class UsageRecorder:
+    """Buffers API calls per subscription and adds them to the database in batches.
+
+    ``record`` only touches memory; ``flush`` (run periodically by the API
+    and at shutdown) applies the buffered counts to ``total_api_calls``,
+    ``api_calls_today`` and ``last_api_call_at`` as SQL increments, so
+    flushes from several processes add up instead of overwriting each other.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        """Initialize the recorder."""
+        self.session_factory = session_factory
+        # (subscription id, UTC day) -> [calls, last call time]
+        self._pending: Dict[Tuple[int, date], List] = {}
+        self._lock = threading.Lock()
+
+    def record(self, subscription_id: int, now: Optional[datetime] = None):
+        """Buffer one API call."""
+        now = now or datetime.utcnow()
+        with self._lock:
+            entry = self._pending.setdefault((subscription_id, now.date()), [0, now])
+            entry[0] += 1
+            entry[1] = max(entry[1], now)
+
+    def _restore(self, pending: Dict[Tuple[int, date], List]):
+        """Put counts back after a failed flush so they are not lost."""
+        with self._lock:
+            for key, (calls, last_at) in pending.items():
+                entry = self._pending.setdefault(key, [0, last_at])
+                entry[0] += calls
+                entry[1] = max(entry[1], last_at)
+
+    def flush(self) -> int:
+        """Write buffered calls to the database; return how many were written."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        db = self.session_factory()
+        try:
+            # Oldest day first, so a batch spanning midnight resets the daily count
+            for (subscription_id, day), (calls, last_at) in sorted(pending.items()):
+                same_day = Subscription.last_api_call_at >= datetime.combine(day, day_time.min)
+                db.execute(
+                    update(Subscription)
+                    .where(Subscription.id == subscription_id)
+                    .values(
+                        total_api_calls=func.coalesce(Subscription.total_api_calls, 0) + calls,
+                        api_calls_today=case(
+                            (same_day, func.coalesce(Subscription.api_calls_today, 0) + calls),
+                            else_=calls,
+                        ),
+                        last_api_call_at=case(
+                            (
+                                Subscription.last_api_call_at > last_at,
+                                Subscription.last_api_call_at,
+                            ),
+                            else_=last_at,
+                        ),
+                    )
+                )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Could not flush API usage, will retry: {e}")
+            self._restore(pending)
+            return 0
+        finally:
+            db.close()
+        return sum(calls for calls, _ in pending.values())
+
+    async def run(self, interval_seconds: float):
+        """Flush every ``interval_seconds`` until cancelled, then flush once more."""
+        try:
+            while True:
+                await asyncio.sleep(interval_seconds)
+                await asyncio.to_thread(self.flush)
+        finally:
+            await asyncio.to_thread(self.flush)
+
+
+_limiter: Optional[ApiRateLimiter] = None
+_recorder: Optional[UsageRecorder] = None
+
+
+def get_api_rate_limiter() -> ApiRateLimiter:
+    """Get the process-wide API rate limiter configured in settings."""
+    global _limiter
+    if _limiter is None:
+        if settings.api_rate_limit_backend == "sqlite":
+            _limiter = SQLiteApiRateLimiter(settings.data_dir / "api_rate_limits.db")
+        else:
+            _limiter = ApiRateLimiter()
+    return _limiter
+
+
+def get_usage_recorder() -> UsageRecorder:
+    """Get the process-wide API usage recorder."""
+    global _recorder
+    if _recorder is None:
+        _recorder = UsageRecorder()
+    return _recorder
+
+
+def check_rate_limit(user: Principal) -> bool:
+    """Check a user's daily API limit and count the call.
+
+    Does not write to the database: the call is counted in the rate
+    limiter and buffered for the next usage flush.
+    """
+    sub = user.subscription
+    if not sub:
+        return False
+
+    # Calls already stored for today count towards a fresh in-memory window
+    used = 0
+    if sub.last_api_call_at and sub.last_api_call_at.date() == datetime.utcnow().date():
+        used = sub.api_calls_today or 0
+
+    if not get_api_rate_limiter().hit(sub.id, sub.api_calls_per_day, used=used):
+        return False
+    get_usage_recorder().record(sub.id)
+    return True
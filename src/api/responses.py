@@ -0,0 +1,41 @@
+"""Fast JSON rendering for contract list responses."""
+from typing import Any, Dict, List, Sequence
+
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Query
+
+from src.api import schemas
+from src.models import Contract
+
+# ContractResponse fields in schema order, and the columns they are read from
+CONTRACT_FIELDS = tuple(schemas.ContractResponse.model_fields)
+CONTRACT_COLUMNS = tuple(getattr(Contract, name) for name in CONTRACT_FIELDS)
+
+
+def contract_rows(query: Query) -> Query:
+    """Select only the ``ContractResponse`` columns, as row tuples.
+
+    Skips building ORM objects (identity map, attribute instrumentation)
+    for rows that are only serialized.
+    """
+    return query.with_entities(*CONTRACT_COLUMNS)
+
+
+def contract_dicts(rows: Sequence) -> List[Dict[str, Any]]:
+    """Turn ``contract_rows`` results into ``ContractResponse``-shaped dicts."""
+    return [dict(zip(CONTRACT_FIELDS, row)) for row in rows]
+
+
+def contract_list_response(**fields: Any) -> ORJSONResponse:
+    """Render a ``ContractListResponse`` without validating each contract.
+
+    The page comes straight from the database, so the per-row Pydantic
+    validation would only re-check column types. orjson writes datetimes
+    and enums the way Pydantic does; keys follow the schema's field order.
+    """
+    return ORJSONResponse(
+        {
+            name: fields.get(name, field.default)
+            for name, field in schemas.ContractListResponse.model_fields.items()
+        }
+    )
@@ -88,9 +88,12 @@ class ContractSearchQuery(BaseModel):
 
 
 class ContractListResponse(BaseModel):
-    total: int
+    total: Optional[int] = None  # None when total_mode=none
+    total_estimated: bool = False
     page: int
     page_size: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
     contracts: List[ContractResponse]
 
 
@@ -134,6 +137,7 @@ class StatisticsResponse(BaseModel):
     total_contracts: int
     open_contracts: int
     closed_contracts: int
+    by_status: dict = {}
     by_state: dict
     by_source: dict
     last_updated: str
@@ -146,4 +150,9 @@ class ScrapeResultResponse(BaseModel):
     success: bool
     contracts_found: int
     stats: dict
+    metrics: dict = {}
     error: Optional[str] = None
+
+
+class DuplicateRebuildResponse(BaseModel):
+    duplicate_pairs: int
@@ -0,0 +1,123 @@
+"""Development and production launchers for the API server."""
+import os
+from typing import Optional
+
+import uvicorn
+
+from src.config import settings
+from src.utils.logger import get_logger
+
+logger = get_logger("server")
+
+APP = "src.api.main:app"
+
+
+def _gunicorn_available() -> bool:
+    """Check whether the optional gunicorn package is installed."""
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def worker_count(workers: Optional[int] = None) -> int:
+    """Number of API worker processes (``api_workers``, 0 = one per CPU core)."""
+    return workers or settings.api_workers or os.cpu_count() or 1
+
+
+def prepare_database():
+    """Create and upgrade the schema once, before any worker starts.
+
+    Workers skip ``init_db`` on startup, and the parent's pooled connections
+    are closed so forked workers do not share them.
+    """
+    from src.models.database import engine, init_db
+
+    init_db()
+    engine.dispose()
+    # Read by spawned workers' settings; forked workers inherit the attribute
+    os.environ["API_INIT_DB_ON_STARTUP"] = "false"
+    settings.api_init_db_on_startup = False
+
+
+def run_dev():
+    """Single process with auto-reload, for development."""
+    prepare_database()
+    uvicorn.run(
+        APP,
+        host=settings.api_host,
+        port=settings.api_port,
+        reload=True,
+        log_level=settings.log_level.lower(),
+    )
+
+
+def run_production(workers: Optional[int] = None, server: Optional[str] = None):
+    """Several worker processes, without the reload file watcher.
+
+    Uses gunicorn with uvicorn workers when it is installed (``api_server``
+    ``auto`` or ``gunicorn``): the app is imported once in the parent and
+    forked, workers that die are replaced, ``SIGHUP`` restarts them
+    gracefully and ``api_max_requests`` recycles them. Otherwise uvicorn's
+    own supervisor runs the workers, each importing the app itself.
+    """
+    workers = worker_count(workers)
+    server = server or settings.api_server
+    if server == "gunicorn" and not _gunicorn_available():
+        raise RuntimeError("api_server is gunicorn but gunicorn is not installed")
+    if workers > 1 and settings.api_rate_limit_backend == "memory":
+        logger.warning(
+            "API rate limits are kept per worker; "
+            "set API_RATE_LIMIT_BACKEND=sqlite to share them across workers"
+        )
+
+    prepare_database()
+    if server != "uvicorn" and _gunicorn_available():
+        logger.info(f"Starting gunicorn with {workers} uvicorn workers")
+        GunicornServer(
+            {
+                "bind": f"{settings.api_host}:{settings.api_port}",
+                "workers": workers,
+                "worker_class": "uvicorn.workers.UvicornWorker",
+                "preload_app": True,
+                "graceful_timeout": settings.api_graceful_timeout_seconds,
+                "max_requests": settings.api_max_requests,
+                "max_requests_jitter": settings.api_max_requests // 10,
+                "loglevel": settings.log_level.lower(),
+                "accesslog": "-",
+            }
+        ).run()
+    else:
+        logger.info(f"Starting uvicorn with {workers} workers")
+        uvicorn.run(
+            APP,
+            host=settings.api_host,
+            port=settings.api_port,
+            workers=workers,
+            timeout_graceful_shutdown=settings.api_graceful_timeout_seconds,
+            log_level=settings.log_level.lower(),
+        )
+
+
+if _gunicorn_available():
+    from gunicorn.app.base import BaseApplication
+
+    class GunicornServer(BaseApplication):
+        """Gunicorn configured from a dict instead of the command line."""
+
+        def __init__(self, options: dict):
+            """Initialize with gunicorn settings."""
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            """Apply the options to gunicorn's config."""
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            """Import the app (once, in the parent, with ``preload_app``)."""
+            from src.api.main import app
+
+            return app
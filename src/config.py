@@ -14,12 +14,56 @@ class Settings(BaseSettings):
     api_port: int = 8000
     secret_key: str = "change-this-in-production"
     access_token_expire_minutes: int = 1440
+    api_rate_limit_backend: str = "memory"  # memory or sqlite (shared across workers)
+    api_usage_flush_seconds: float = 30.0  # How often buffered API usage is written
+    auth_cache_ttl_seconds: int = 300  # Resolved API keys/JWT subjects kept in memory
+    auth_cache_size: int = 4096
+    api_workers: int = 0  # Production worker processes (0 = one per CPU core)
+    api_server: str = "auto"  # auto (gunicorn when installed), gunicorn or uvicorn
+    api_graceful_timeout_seconds: int = 30  # Time workers get to finish requests on restart
+    api_max_requests: int = 0  # Recycle a worker after this many requests (gunicorn, 0 = never)
+    api_init_db_on_startup: bool = True  # run_api.py runs init_db once and turns this off
 
     # Scraping
     scrape_interval_minutes: int = 60
     max_concurrent_scrapers: int = 5
+    max_concurrent_pages_per_source: int = 4
+    scrape_queue_batches: int = 4  # Page batches buffered between scraper and database
+    upsert_chunk_size: int = 500
+    html_parser_backend: str = "lxml"  # lxml (compiled XPath fast path) or bs4
+    parse_in_process_pool: bool = True
+    parse_workers: int = 0  # 0 = one worker per CPU core
     request_timeout_seconds: int = 30
     rate_limit_delay_seconds: float = 2.0
+    rate_limit_burst: int = 3
+    rate_limit_max_concurrency_per_host: int = 4
+    rate_limit_backend: str = "memory"  # memory or sqlite (shared across processes)
+
+    # HTTP client
+    http_max_connections: int = 100
+    http_max_connections_per_host: int = 6
+    http_keepalive_expiry_seconds: float = 30.0
+    http2_enabled: bool = True  # Only used when the optional h2 package is installed
+    http_cache_enabled: bool = True
+    http_cache_ttl_hours: int = 168
+    http_cache_max_mb: int = 256
+
+    # Browser pool (Playwright scrapers)
+    browser_pool_max_pages: int = 8
+    browser_recycle_after_navigations: int = 200
+
+    # Duplicate detection (MinHash LSH)
+    dedupe_incremental: bool = True  # Match newly saved contracts against the stored index
+    dedupe_batch_size: int = 5000
+    dedupe_num_perm: int = 96
+    dedupe_bands: int = 16  # Candidate threshold is roughly (1 / bands) ** (bands / num_perm)
+    dedupe_similarity_threshold: float = 0.8
+    dedupe_max_bucket_size: int = 100
+
+    # Search
+    search_total_mode: str = "cached"  # exact, estimated, cached or none (no total)
+    search_count_cache_ttl_seconds: int = 60
+    search_count_cache_size: int = 1024
 
     # Logging
     log_level: str = "INFO"
@@ -1,18 +1,32 @@
 """Database models for DaaS Contract Aggregator."""
-from src.models.database import Base, engine, SessionLocal, get_db
+from src.models.database import Base, engine, SessionLocal, get_async_db, get_db, init_db
 from src.models.contract import Contract, ContractStatus
 from src.models.source import DataSource, SourceStatus
-from src.models.user import User, Subscription
+from src.models.fingerprint import PageFingerprint
+from src.models.duplicate import ContractDuplicate, ContractLSHKey
+from src.models.scraped import ScrapedContract
+from src.models.search import contract_search
+from src.models.stats import ContractStat
+from src.models.user import User, Subscription, SubscriptionTier
 
 __all__ = [
     "Base",
     "engine",
     "SessionLocal",
     "get_db",
+    "get_async_db",
+    "init_db",
     "Contract",
     "ContractStatus",
     "DataSource",
     "SourceStatus",
+    "PageFingerprint",
+    "ContractDuplicate",
+    "ContractLSHKey",
+    "ScrapedContract",
+    "contract_search",
+    "ContractStat",
     "User",
     "Subscription",
+    "SubscriptionTier",
 ]
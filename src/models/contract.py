@@ -14,6 +14,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import relationship
 from src.models.database import Base
+from src.utils.helpers import content_hash
 
 
 class ContractStatus(enum.Enum):
@@ -31,6 +32,27 @@ class Contract(Base):
 
     __tablename__ = "contracts"
 
+    # Scraped fields covered by content_hash, i.e. the ones a re-scrape updates
+    HASH_FIELDS = (
+        "title",
+        "description",
+        "agency",
+        "department",
+        "budget_min",
+        "budget_max",
+        "estimated_value",
+        "posted_date",
+        "due_date",
+        "close_date",
+        "status",
+        "category",
+        "naics_code",
+        "set_aside",
+        "contact_name",
+        "contact_email",
+        "contact_phone",
+    )
+
     id = Column(Integer, primary_key=True, index=True)
 
     # Core identifiers
@@ -72,22 +94,32 @@ class Contract(Base):
 
     # Metadata
     raw_data = Column(Text, nullable=True)  # JSON string of original scraped data
+    content_hash = Column(String(64), nullable=True)  # Hash of HASH_FIELDS
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     last_scraped_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     source = relationship("DataSource", back_populates="contracts")
+    lsh_keys = relationship("ContractLSHKey", cascade="all, delete-orphan")
+    duplicate = relationship("ContractDuplicate", uselist=False, cascade="all, delete-orphan")
 
     # Indexes for common queries
     __table_args__ = (
-        Index("idx_contract_due_date", "due_date"),
+        # Serves the listing order and keyset pagination (due_date, id)
+        Index("idx_contract_due_date_id", "due_date", "id"),
         Index("idx_contract_status", "status"),
-        Index("idx_contract_state", "state"),
+        Index("idx_contract_state_due_date_id", "state", "due_date", "id"),
         Index("idx_contract_category", "category"),
         Index("idx_contract_source_external", "source_id", "external_id", unique=True),
+        # Covers the existing-key/hash lookup done before each bulk upsert
+        Index("idx_contract_source_external_hash", "source_id", "external_id", "content_hash"),
     )
 
+    def compute_content_hash(self) -> str:
+        """Compute the content hash from the current field values."""
+        return content_hash(getattr(self, field) for field in self.HASH_FIELDS)
+
     def to_dict(self):
         """Convert contract to dictionary."""
         return {
@@ -1,7 +1,11 @@
 """Database connection and session management."""
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, make_url, text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import sessionmaker, declarative_base
 from src.config import settings
+from src.utils.logger import get_logger
+
+logger = get_logger("database")
 
 # Create engine
 engine = create_engine(
@@ -16,6 +20,12 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Create base class for models
 Base = declarative_base()
 
+# Dialects with INSERT ... ON CONFLICT DO UPDATE support
+UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
 
 def get_db():
     """Dependency to get database session."""
@@ -26,6 +36,102 @@ def get_db():
         db.close()
 
 
+# Async drivers for the database URL schemes the sync engine understands
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+_async_engine = None
+_async_session_factory = None
+
+
+def async_database_url(url: str) -> str:
+    """Get the async-driver equivalent of a sync database URL."""
+    scheme, sep, rest = url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+
+def get_async_engine():
+    """Get the process-wide async engine used by the API.
+
+    Created on first use, so scrapers and scripts that only use the sync
+    engine do not need the async drivers (aiosqlite/asyncpg) installed.
+    """
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+        from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+        url = make_url(async_database_url(settings.database_url))
+        options = {}
+        if url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:"):
+            # aiosqlite defaults to a new connection (and thread) per session
+            options["poolclass"] = AsyncAdaptedQueuePool
+        _async_engine = create_async_engine(url, pool_pre_ping=True, **options)
+        _async_session_factory = async_sessionmaker(
+            bind=_async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_engine
+
+
+async def close_async_engine():
+    """Dispose of the async engine and its connections."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = _async_session_factory = None
+
+
+async def get_async_db():
+    """Dependency to get an async database session.
+
+    Queries await the database instead of blocking the event loop. Sync
+    helpers (query builders, processors) run inside ``await db.run_sync()``.
+    """
+    get_async_engine()
+    async with _async_session_factory() as db:
+        yield db
+
+
+def upgrade_schema(bind=engine):
+    """Add columns and indexes that are missing from existing tables.
+
+    ``create_all`` only creates missing tables, so databases created by an
+    older version would otherwise never get new nullable columns or new
+    indexes. Non-nullable columns need a real migration and are only logged.
+    """
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+
+        existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            if not column.nullable:
+                logger.warning(f"Cannot add non-nullable column {table.name}.{column.name}")
+                continue
+            column_type = column.type.compile(dialect=bind.dialect)
+            with bind.begin() as conn:
+                conn.execute(
+                    text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+                )
+            logger.info(f"Added column {table.name}.{column.name}")
+
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+
 def init_db():
     """Initialize database tables."""
+    from src.models.search import create_search_index
+
     Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
+    with engine.begin() as conn:
+        create_search_index(conn)
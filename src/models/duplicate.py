@@ -0,0 +1,36 @@
+"""Models for the persistent duplicate index and duplicate clusters."""
+from datetime import datetime
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer
+from src.models.database import Base
+
+
+class ContractLSHKey(Base):
+    """One MinHash LSH band key of a contract's title or description."""
+
+    __tablename__ = "contract_lsh_keys"
+
+    key = Column(BigInteger, primary_key=True)
+    contract_id = Column(Integer, ForeignKey("contracts.id"), primary_key=True)
+
+    __table_args__ = (
+        Index("idx_contract_lsh_key_contract", "contract_id"),
+    )
+
+
+class ContractDuplicate(Base):
+    """Membership of a contract in a cluster of cross-source duplicates.
+
+    Only contracts with at least one duplicate have a row. ``cluster_id`` is
+    the id of the cluster's canonical contract (its lowest id), which has a
+    row pointing at itself.
+    """
+
+    __tablename__ = "contract_duplicates"
+
+    contract_id = Column(Integer, ForeignKey("contracts.id"), primary_key=True)
+    cluster_id = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_contract_duplicate_cluster", "cluster_id"),
+    )
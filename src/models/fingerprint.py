@@ -0,0 +1,20 @@
+"""Page fingerprint model for skipping unchanged listing pages."""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from src.models.database import Base
+
+
+class PageFingerprint(Base):
+    """Content hash of a listing page from the last successful scrape."""
+
+    __tablename__ = "page_fingerprints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    source_id = Column(Integer, ForeignKey("data_sources.id"), nullable=False)
+    url = Column(String(2048), nullable=False)
+    fingerprint = Column(String(64), nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_page_fingerprint_source_url", "source_id", "url", unique=True),
+    )
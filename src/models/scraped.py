@@ -0,0 +1,82 @@
+"""Lightweight record for scraped contracts before they are saved."""
+import json
+from datetime import datetime
+from typing import Any, Dict
+
+from src.models.contract import Contract, ContractStatus
+from src.utils.helpers import content_hash
+
+
+class ScrapedContract:
+    """A contract as scraped, without SQLAlchemy instrumentation.
+
+    Scrapers produce these instead of ORM ``Contract`` objects, since most
+    re-scraped rows turn out unchanged and are never written. ``raw_data``
+    stays a dict until the row is actually saved. Use ``to_row()`` for bulk
+    inserts and ``to_orm()`` when an ORM object is really needed.
+    """
+
+    # Every Contract column a scrape can set (timestamps and id use defaults)
+    FIELDS = (
+        "external_id",
+        "source_id",
+        "url",
+        "title",
+        "description",
+        "agency",
+        "department",
+        "budget_min",
+        "budget_max",
+        "estimated_value",
+        "posted_date",
+        "due_date",
+        "close_date",
+        "status",
+        "category",
+        "naics_code",
+        "set_aside",
+        "state",
+        "city",
+        "zip_code",
+        "contact_name",
+        "contact_email",
+        "contact_phone",
+        "raw_data",
+        "content_hash",
+        "last_scraped_at",
+    )
+
+    __slots__ = FIELDS
+
+    def __init__(self, **values: Any):
+        """Initialize the record; fields that are not given default to None."""
+        unknown = set(values) - set(self.FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown contract fields: {', '.join(sorted(unknown))}")
+        for field in self.FIELDS:
+            setattr(self, field, values.get(field))
+        if self.status is None:
+            self.status = ContractStatus.UNKNOWN
+        if self.last_scraped_at is None:
+            self.last_scraped_at = datetime.utcnow()
+
+    def __repr__(self) -> str:
+        """Short representation for logs."""
+        return f"ScrapedContract(source_id={self.source_id!r}, external_id={self.external_id!r})"
+
+    def compute_content_hash(self) -> str:
+        """Compute the content hash the same way ``Contract`` does."""
+        return content_hash(getattr(self, field) for field in Contract.HASH_FIELDS)
+
+    def to_row(self) -> Dict[str, Any]:
+        """Get the column values for inserting this contract."""
+        row = {field: getattr(self, field) for field in self.FIELDS}
+        if row["content_hash"] is None:
+            row["content_hash"] = self.compute_content_hash()
+        if row["raw_data"] is not None and not isinstance(row["raw_data"], str):
+            row["raw_data"] = json.dumps(row["raw_data"])
+        return row
+
+    def to_orm(self) -> Contract:
+        """Build an ORM ``Contract`` for this record."""
+        return Contract(**self.to_row())
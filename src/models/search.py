@@ -0,0 +1,132 @@
+"""Full-text search index over contract titles, descriptions and agencies."""
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Column, Integer, MetaData, Table, Text, event, inspect, text
+from sqlalchemy.exc import OperationalError
+
+from src.models.contract import Contract
+from src.utils.logger import get_logger
+
+logger = get_logger("search")
+
+SEARCH_TABLE = "contract_search"
+SEARCH_COLUMNS = ("title", "description", "agency")
+
+# The FTS5 table lives outside Base.metadata: create_all cannot emit
+# CREATE VIRTUAL TABLE, so it is created by the DDL hooks below instead.
+contract_search = Table(
+    SEARCH_TABLE,
+    MetaData(),
+    Column("rowid", Integer, primary_key=True),
+    Column(SEARCH_TABLE, Text),  # FTS5 hidden column used on the left of MATCH
+    *(Column(name, Text) for name in SEARCH_COLUMNS),
+)
+
+_columns = ", ".join(SEARCH_COLUMNS)
+_new_values = ", ".join(f"new.{name}" for name in SEARCH_COLUMNS)
+_old_values = ", ".join(f"old.{name}" for name in SEARCH_COLUMNS)
+_insert_new = f"INSERT INTO {SEARCH_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values});"
+_delete_old = (
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, {_columns}) "
+    f"VALUES ('delete', old.id, {_old_values});"
+)
+
+# External-content FTS5 table: the text stays in ``contracts`` and the
+# triggers keep the index in sync with every write path (ORM, bulk upserts
+# and raw SQL alike). Prefix queries use the term b-tree directly; extra
+# ``prefix=`` indexes made inserts noticeably slower for little gain.
+SQLITE_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+    f"{_columns}, content='contracts', content_rowid='id', "
+    "tokenize='porter unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS contracts_search_insert AFTER INSERT ON contracts "
+    f"BEGIN {_insert_new} END",
+    "CREATE TRIGGER IF NOT EXISTS contracts_search_delete AFTER DELETE ON contracts "
+    f"BEGIN {_delete_old} END",
+    f"CREATE TRIGGER IF NOT EXISTS contracts_search_update AFTER UPDATE OF {_columns} "
+    f"ON contracts BEGIN {_delete_old} {_insert_new} END",
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS contracts_search_insert",
+    "DROP TRIGGER IF EXISTS contracts_search_delete",
+    "DROP TRIGGER IF EXISTS contracts_search_update",
+    f"DROP TABLE IF EXISTS {SEARCH_TABLE}",
+]
+
+# A stored generated tsvector keeps itself in sync and spares ranking from
+# re-parsing the text of every matching row.
+POSTGRESQL_VECTOR = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || "
+    "coalesce(description, '') || ' ' || coalesce(agency, ''))"
+)
+POSTGRESQL_DDL = [
+    "ALTER TABLE contracts ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    f"GENERATED ALWAYS AS ({POSTGRESQL_VECTOR}) STORED",
+    "CREATE INDEX IF NOT EXISTS idx_contract_search_vector "
+    "ON contracts USING gin (search_vector)",
+]
+
+# Engine -> whether it has a usable search index
+_available: "WeakKeyDictionary" = WeakKeyDictionary()
+
+
+def create_search_index(bind):
+    """Create the full-text index for a database if it does not exist yet.
+
+    Safe to call repeatedly. On SQLite, a newly created index is filled
+    from the existing contracts. Dialects without support are left to the
+    LIKE fallback in ``src.processors.search``.
+    """
+    engine = getattr(bind, "engine", bind)
+    dialect = bind.dialect.name
+    if dialect == "sqlite":
+        existed = inspect(bind).has_table(SEARCH_TABLE)
+        try:
+            for statement in SQLITE_DDL:
+                bind.execute(text(statement))
+        except OperationalError as e:
+            logger.warning(f"SQLite FTS5 is not available, keyword search will scan: {e}")
+            _available[engine] = False
+            return
+        if not existed:
+            bind.execute(text(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')"))
+            logger.info("Built contract full-text search index")
+    elif dialect == "postgresql":
+        for statement in POSTGRESQL_DDL:
+            bind.execute(text(statement))
+    _available[engine] = dialect in ("sqlite", "postgresql")
+
+
+def drop_search_index(bind):
+    """Drop the SQLite full-text index (PostgreSQL's goes with the table)."""
+    if bind.dialect.name == "sqlite":
+        for statement in SQLITE_DROP:
+            bind.execute(text(statement))
+    _available.pop(getattr(bind, "engine", bind), None)
+
+
+def has_search_index(bind) -> bool:
+    """Check whether keyword search can use the full-text index."""
+    engine = getattr(bind, "engine", bind)
+    if engine not in _available:
+        if bind.dialect.name == "sqlite":
+            _available[engine] = inspect(bind).has_table(SEARCH_TABLE)
+        elif bind.dialect.name == "postgresql":
+            columns = inspect(bind).get_columns(Contract.__tablename__)
+            _available[engine] = any(column["name"] == "search_vector" for column in columns)
+        else:
+            _available[engine] = False
+    return _available[engine]
+
+
+@event.listens_for(Contract.__table__, "after_create")
+def _create_search_index(target, connection, **kw):
+    """Create the search index whenever the contracts table is created."""
+    create_search_index(connection)
+
+
+@event.listens_for(Contract.__table__, "before_drop")
+def _drop_search_index(target, connection, **kw):
+    """Drop the search index along with the contracts table."""
+    drop_search_index(connection)
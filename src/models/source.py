@@ -53,6 +53,7 @@ class DataSource(Base):
 
     # Relationships
     contracts = relationship("Contract", back_populates="source", cascade="all, delete-orphan")
+    page_fingerprints = relationship("PageFingerprint", cascade="all, delete-orphan")
 
     def to_dict(self):
         """Convert source to dictionary."""
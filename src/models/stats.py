@@ -0,0 +1,30 @@
+"""Materialized contract statistics."""
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Enum, Index, Integer, String
+from src.models.contract import ContractStatus
+from src.models.database import Base
+
+
+class ContractStat(Base):
+    """Number of contracts in one (state, source, status, category) group.
+
+    Kept up to date by ``ContractAggregator`` as contracts are saved and
+    rebuildable from the contracts table. Missing states and categories are
+    stored as empty strings so the group key stays unique.
+    """
+
+    __tablename__ = "contract_stats"
+
+    id = Column(Integer, primary_key=True, index=True)
+    state = Column(String(50), nullable=False, default="")
+    source_id = Column(Integer, nullable=False)
+    status = Column(Enum(ContractStatus), nullable=False)
+    category = Column(String(255), nullable=False, default="")
+    contract_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_contract_stat_group", "state", "source_id", "status", "category", unique=True),
+        # Makes the rollup version (max updated_at) an index lookup
+        Index("idx_contract_stat_updated", "updated_at"),
+    )
@@ -1,5 +1,13 @@
 """Data processors for DaaS Contract Aggregator."""
 from src.processors.aggregator import ContractAggregator
+from src.processors.dedupe import DuplicateDetector
 from src.processors.scrape_manager import ScrapeManager
+from src.processors.parse_pool import get_parse_executor, shutdown_parse_executor
 
-__all__ = ["ContractAggregator", "ScrapeManager"]
+__all__ = [
+    "ContractAggregator",
+    "DuplicateDetector",
+    "ScrapeManager",
+    "get_parse_executor",
+    "shutdown_parse_executor",
+]
@@ -1,15 +1,56 @@
 """Contract aggregation and deduplication logic."""
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Sequence, Set, Tuple, Union
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, select
 
-from src.models.contract import Contract
+from src.config import settings
+from src.models.contract import Contract, ContractStatus
+from src.models.database import UPSERT_INSERTS
+from src.models.scraped import ScrapedContract
 from src.models.source import DataSource, SourceStatus
+from src.processors.dedupe import DuplicateDetector, DuplicateIndex
+from src.processors.stats import StatsRollup, stat_key
 from src.utils.logger import get_logger
 
 logger = get_logger("aggregator")
 
+# Columns overwritten when an existing contract changed
+UPDATE_COLUMNS = list(Contract.HASH_FIELDS) + [
+    "raw_data",
+    "content_hash",
+    "last_scraped_at",
+]
+
+# Columns that place a contract in a statistics rollup group (besides source_id)
+GROUP_COLUMNS = ("state", "status", "category")
+
+# Columns taken from scraped contracts on insert (timestamps use defaults)
+INSERT_COLUMNS = [
+    column.name
+    for column in Contract.__table__.columns
+    if column.name not in ("id", "created_at", "updated_at")
+]
+
+ContractInput = Union[ScrapedContract, Contract]
+
+
+def contract_row(contract: ContractInput) -> Dict[str, Any]:
+    """Get the insert column values for a scraped or unsaved ORM contract."""
+    if isinstance(contract, ScrapedContract):
+        return contract.to_row()
+
+    row = {name: getattr(contract, name) for name in INSERT_COLUMNS}
+    if row["content_hash"] is None:
+        row["content_hash"] = contract.compute_content_hash()
+    # Column defaults the ORM would otherwise apply on flush
+    if row["status"] is None:
+        row["status"] = ContractStatus.UNKNOWN
+    if row["last_scraped_at"] is None:
+        row["last_scraped_at"] = datetime.utcnow()
+    return row
+
 
 class ContractAggregator:
     """Aggregates and deduplicates contract data from multiple sources."""
@@ -18,11 +59,23 @@ class ContractAggregator:
         """Initialize the aggregator."""
         self.db = db
 
-    def save_contracts(self, contracts: List[Contract], source: DataSource) -> dict:
+    def save_contracts(self, contracts: Sequence[ContractInput], source: DataSource) -> dict:
         """Save contracts to database with deduplication.
 
         Returns statistics about the operation.
         """
+        stats = self.save_batch(contracts, source)
+        self.record_scrape(source, stats)
+        return stats
+
+    def save_batch(self, contracts: Sequence[ContractInput], source: DataSource) -> dict:
+        """Save one batch of contracts and commit it.
+
+        Unlike ``save_contracts`` this does not touch the source's scrape
+        counters, so a streaming scrape can call it once per page and call
+        ``record_scrape`` at the end. New and changed contracts are then
+        matched against the duplicate index.
+        """
         stats = {
             "new": 0,
             "updated": 0,
@@ -30,40 +83,211 @@ class ContractAggregator:
             "errors": 0,
         }
 
+        # Last occurrence wins when a key appears twice in one batch
+        rows_by_key: Dict[tuple, dict] = {}
         for contract in contracts:
+            row = contract_row(contract)
+            rows_by_key[(row["source_id"], row["external_id"])] = row
+        rows = list(rows_by_key.values())
+
+        written: Set[Tuple[int, str]] = set()
+        if self._supports_bulk_upsert():
+            self._bulk_upsert(rows, stats, written)
+        else:
+            self._save_individually(rows, stats, written)
+
+        if written and settings.dedupe_incremental:
+            self._index_duplicates(written)
+
+        return stats
+
+    def _supports_bulk_upsert(self) -> bool:
+        """Check whether the database supports INSERT ... ON CONFLICT."""
+        return self.db.get_bind().dialect.name in UPSERT_INSERTS
+
+    def _bulk_upsert(self, rows: List[dict], stats: dict, written: Set[tuple]):
+        """Save contracts with chunked INSERT ... ON CONFLICT DO UPDATE.
+
+        Each chunk costs at most two statements regardless of size: one
+        index-only lookup of the stored content hashes for its keys, and one
+        upsert of the rows that are new or whose hash differs. Unchanged
+        rows are never written.
+        """
+        chunk_size = max(1, settings.upsert_chunk_size)
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            try:
+                chunk_stats = self._upsert_chunk(chunk, written)
+                self.db.commit()
+            except Exception as e:
+                logger.error(f"Bulk upsert failed, saving chunk row by row: {e}")
+                self.db.rollback()
+                chunk_stats = {"new": 0, "updated": 0, "unchanged": 0, "errors": 0}
+                self._save_individually(chunk, chunk_stats, written)
+
+            for key, value in chunk_stats.items():
+                stats[key] += value
+
+    def _upsert_chunk(self, rows: List[dict], written: Set[tuple]) -> dict:
+        """Upsert one chunk of contract rows (without committing).
+
+        Keys of new and changed rows are added to ``written``.
+        """
+        table = Contract.__table__
+        stats = {"new": 0, "updated": 0, "unchanged": 0, "errors": 0}
+
+        # Stored content hash and rollup group of each existing row
+        stored: Dict[tuple, tuple] = {}
+        for source_id in {row["source_id"] for row in rows}:
+            external_ids = [row["external_id"] for row in rows if row["source_id"] == source_id]
+            for external_id, stored_hash, *group in self.db.execute(
+                select(
+                    table.c.external_id,
+                    table.c.content_hash,
+                    *(table.c[name] for name in GROUP_COLUMNS),
+                ).where(
+                    table.c.source_id == source_id,
+                    table.c.external_id.in_(external_ids),
+                )
+            ):
+                stored[(source_id, external_id)] = (stored_hash, dict(zip(GROUP_COLUMNS, group)))
+
+        changed = []
+        deltas = Counter()
+        for row in rows:
+            key = (row["source_id"], row["external_id"])
+            if key not in stored:
+                stats["new"] += 1
+                changed.append(row)
+                deltas[stat_key(row["state"], key[0], row["status"], row["category"])] += 1
+                continue
+
+            stored_hash, group = stored[key]
+            if stored_hash == row["content_hash"]:
+                stats["unchanged"] += 1
+                continue
+
+            stats["updated"] += 1
+            changed.append(row)
+            # The row moves from its stored group to the one the upsert writes
+            deltas[stat_key(group["state"], key[0], group["status"], group["category"])] -= 1
+            written_group = {
+                name: row[name] if name in UPDATE_COLUMNS else value
+                for name, value in group.items()
+            }
+            deltas[
+                stat_key(
+                    written_group["state"],
+                    key[0],
+                    written_group["status"],
+                    written_group["category"],
+                )
+            ] += 1
+
+        if not changed:
+            return stats
+
+        insert = UPSERT_INSERTS[self.db.get_bind().dialect.name]
+        stmt = insert(table)
+        excluded = stmt.excluded
+        set_ = {name: excluded[name] for name in UPDATE_COLUMNS}
+        set_["updated_at"] = datetime.utcnow()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.source_id, table.c.external_id],
+            set_=set_,
+            # Re-checked here in case another writer saved the row meanwhile
+            where=table.c.content_hash.is_distinct_from(excluded.content_hash),
+        )
+        # executemany form: compiled once and batched by insertmanyvalues
+        self.db.execute(stmt, changed)
+        StatsRollup(self.db).apply(deltas)
+        written.update((row["source_id"], row["external_id"]) for row in changed)
+        return stats
+
+    def _save_individually(self, rows: List[dict], stats: dict, written: Set[tuple]):
+        """Save contract rows one at a time through the ORM and commit."""
+        deltas = Counter()
+        for row in rows:
             try:
                 # Check if contract already exists
                 existing = self.db.query(Contract).filter(
                     and_(
-                        Contract.source_id == contract.source_id,
-                        Contract.external_id == contract.external_id,
+                        Contract.source_id == row["source_id"],
+                        Contract.external_id == row["external_id"],
                     )
                 ).first()
 
                 if existing:
                     # Update existing contract
-                    if self._has_changes(existing, contract):
-                        self._update_contract(existing, contract)
+                    if self._has_changes(existing, row):
+                        deltas[self._stat_key(existing)] -= 1
+                        self._update_contract(existing, row)
+                        deltas[self._stat_key(existing)] += 1
+                        written.add((row["source_id"], row["external_id"]))
                         stats["updated"] += 1
-                        logger.debug(f"Updated contract: {contract.external_id}")
+                        logger.debug(f"Updated contract: {row['external_id']}")
                     else:
                         stats["unchanged"] += 1
                 else:
                     # Add new contract
+                    contract = Contract(**row)
                     self.db.add(contract)
+                    deltas[self._stat_key(contract)] += 1
+                    written.add((row["source_id"], row["external_id"]))
                     stats["new"] += 1
-                    logger.debug(f"Added new contract: {contract.external_id}")
+                    logger.debug(f"Added new contract: {row['external_id']}")
 
             except Exception as e:
-                logger.error(f"Error saving contract {contract.external_id}: {e}")
+                logger.error(f"Error saving contract {row['external_id']}: {e}")
                 stats["errors"] += 1
                 continue
 
         # Commit changes
         try:
+            StatsRollup(self.db).apply(deltas)
             self.db.commit()
+        except Exception as e:
+            logger.error(f"Error committing changes: {e}")
+            self.db.rollback()
+            raise
 
-            # Update source statistics
+    def _index_duplicates(self, keys: Set[Tuple[int, str]]):
+        """Match saved contracts against the duplicate index and commit.
+
+        Failures are logged and rolled back; the contracts stay saved and are
+        picked up again by the next change or a ``DuplicateIndex.rebuild()``.
+        """
+        external_ids_by_source = defaultdict(list)
+        for source_id, external_id in keys:
+            external_ids_by_source[source_id].append(external_id)
+
+        try:
+            contract_ids = []
+            chunk_size = max(1, settings.upsert_chunk_size)
+            for source_id, external_ids in external_ids_by_source.items():
+                for start in range(0, len(external_ids), chunk_size):
+                    contract_ids.extend(
+                        self.db.execute(
+                            select(Contract.id).where(
+                                Contract.source_id == source_id,
+                                Contract.external_id.in_(external_ids[start:start + chunk_size]),
+                            )
+                        ).scalars()
+                    )
+
+            found = DuplicateIndex(self.db).add_contracts(contract_ids)
+            self.db.commit()
+            if found:
+                logger.info(
+                    f"Found {found} cross-source duplicates among {len(keys)} saved contracts"
+                )
+        except Exception as e:
+            logger.error(f"Error updating duplicate index: {e}")
+            self.db.rollback()
+
+    def record_scrape(self, source: DataSource, stats: dict):
+        """Update source statistics after a scrape has been saved."""
+        try:
             source.total_contracts_found += stats["new"]
             source.last_success_at = datetime.utcnow()
             source.total_scrapes += 1
@@ -80,149 +304,36 @@ class ContractAggregator:
             self.db.rollback()
             raise
 
-        return stats
+    @staticmethod
+    def _stat_key(contract: Contract):
+        """Get the statistics rollup group of a contract."""
+        return stat_key(contract.state, contract.source_id, contract.status, contract.category)
 
-    def _has_changes(self, existing: Contract, new: Contract) -> bool:
+    def _has_changes(self, existing: Contract, row: dict) -> bool:
         """Check if contract data has changed."""
-        fields_to_check = [
-            "title",
-            "description",
-            "agency",
-            "department",
-            "budget_min",
-            "budget_max",
-            "estimated_value",
-            "due_date",
-            "close_date",
-            "status",
-            "category",
-            "contact_name",
-            "contact_email",
-            "contact_phone",
-        ]
-
-        for field in fields_to_check:
-            old_val = getattr(existing, field)
-            new_val = getattr(new, field)
-
-            if old_val != new_val:
-                return True
-
-        return False
-
-    def _update_contract(self, existing: Contract, new: Contract):
+        return existing.content_hash != row["content_hash"]
+
+    def _update_contract(self, existing: Contract, row: dict):
         """Update existing contract with new data."""
-        existing.title = new.title
-        existing.description = new.description
-        existing.agency = new.agency
-        existing.department = new.department
-        existing.budget_min = new.budget_min
-        existing.budget_max = new.budget_max
-        existing.estimated_value = new.estimated_value
-        existing.posted_date = new.posted_date
-        existing.due_date = new.due_date
-        existing.close_date = new.close_date
-        existing.status = new.status
-        existing.category = new.category
-        existing.naics_code = new.naics_code
-        existing.set_aside = new.set_aside
-        existing.contact_name = new.contact_name
-        existing.contact_email = new.contact_email
-        existing.contact_phone = new.contact_phone
-        existing.raw_data = new.raw_data
+        for name in UPDATE_COLUMNS:
+            setattr(existing, name, row[name])
         existing.last_scraped_at = datetime.utcnow()
         existing.updated_at = datetime.utcnow()
 
     def find_duplicates(self) -> List[tuple]:
         """Find potential duplicate contracts across different sources.
 
-        Uses title similarity and other heuristics.
+        Candidates come from MinHash LSH over titles and descriptions and are
+        verified with the agency, due date and estimated value heuristics;
+        see ``DuplicateDetector``.
         """
-        # This is a simplified version - in production, you'd use
-        # more sophisticated text similarity algorithms
-        duplicates = []
-
-        contracts = self.db.query(Contract).all()
-
-        for i, c1 in enumerate(contracts):
-            for c2 in contracts[i + 1:]:
-                # Skip if same source
-                if c1.source_id == c2.source_id:
-                    continue
-
-                # Check for similar titles
-                if self._are_titles_similar(c1.title, c2.title):
-                    # Additional checks
-                    if (
-                        c1.agency == c2.agency
-                        or c1.due_date == c2.due_date
-                        or (
-                            c1.estimated_value
-                            and c2.estimated_value
-                            and abs(c1.estimated_value - c2.estimated_value) < 100
-                        )
-                    ):
-                        duplicates.append((c1.id, c2.id))
-
-        return duplicates
-
-    def _are_titles_similar(self, title1: str, title2: str, threshold: float = 0.8) -> bool:
-        """Check if two titles are similar using simple token overlap."""
-        if not title1 or not title2:
-            return False
-
-        # Simple word overlap similarity
-        words1 = set(title1.lower().split())
-        words2 = set(title2.lower().split())
-
-        if not words1 or not words2:
-            return False
-
-        intersection = len(words1 & words2)
-        union = len(words1 | words2)
-
-        similarity = intersection / union
-        return similarity >= threshold
+        return DuplicateDetector(self.db).find_duplicates()
 
     def get_statistics(self) -> dict:
-        """Get overall aggregation statistics."""
-        from src.models.contract import ContractStatus
-
-        total = self.db.query(Contract).count()
-        open_contracts = (
-            self.db.query(Contract)
-            .filter(Contract.status == ContractStatus.OPEN)
-            .count()
-        )
-        closed = (
-            self.db.query(Contract)
-            .filter(Contract.status == ContractStatus.CLOSED)
-            .count()
-        )
+        """Get overall aggregation statistics.
 
-        # Group by state
-        by_state = {}
-        states = self.db.query(Contract.state).distinct().all()
-        for (state,) in states:
-            count = self.db.query(Contract).filter(Contract.state == state).count()
-            by_state[state or "Unknown"] = count
-
-        # Group by source
-        by_source = {}
-        sources = self.db.query(DataSource).all()
-        for source in sources:
-            count = (
-                self.db.query(Contract)
-                .filter(Contract.source_id == source.id)
-                .count()
-            )
-            by_source[source.name] = count
-
-        return {
-            "total_contracts": total,
-            "open_contracts": open_contracts,
-            "closed_contracts": closed,
-            "by_state": by_state,
-            "by_source": by_source,
-            "last_updated": datetime.utcnow().isoformat(),
-        }
+        Reads the ``contract_stats`` rollup, so the cost depends on the number
+        of (state, source, status, category) groups, not on the number of
+        contracts. ``last_updated`` is when the rollup last changed.
+        """
+        return StatsRollup(self.db).read()
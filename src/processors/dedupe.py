@@ -0,0 +1,501 @@
+"""Cross-source duplicate detection with MinHash and LSH banding."""
+import re
+import zlib
+from collections import defaultdict
+from itertools import combinations
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import delete, insert, or_, select, update
+from sqlalchemy.orm import Query, Session
+
+from src.config import settings
+from src.models.contract import Contract
+from src.models.duplicate import ContractDuplicate, ContractLSHKey
+from src.utils.logger import get_logger
+
+logger = get_logger("dedupe")
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Description shingles are word trigrams over at most this many words
+_DESCRIPTION_WORDS = 200
+
+# Upper bound on shingles x permutations hashed in one numpy pass (~32 MB)
+_MAX_HASH_CELLS = 4_000_000
+
+# Fixed seed so signatures and band keys are stable between runs
+_SEED = 1_234_567
+
+_EMPTY = np.iinfo(np.uint32).max
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase alphanumeric words."""
+    return _TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+def title_shingles(title: Optional[str]) -> Set[str]:
+    """Shingle a title as its set of words."""
+    return set(tokenize(title))
+
+
+def description_shingles(description: Optional[str]) -> Set[str]:
+    """Shingle a description as word trigrams."""
+    words = tokenize(description)[:_DESCRIPTION_WORDS]
+    if len(words) < 3:
+        return set(words)
+    return {" ".join(words[i:i + 3]) for i in range(len(words) - 2)}
+
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    """Jaccard similarity of two sets (0 when either is empty)."""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+class MinHasher:
+    """MinHash signatures and LSH band keys for shingle sets.
+
+    Shingles are hashed with CRC32 and permuted with ``num_perm``
+    multiply-shift hash functions. Signatures are split into ``bands`` bands;
+    two sets share a band key with probability ``1 - (1 - s**r)**bands`` for
+    Jaccard similarity ``s`` and ``r = num_perm / bands`` rows per band.
+    """
+
+    def __init__(self, num_perm: int = 96, bands: int = 16, seed: int = _SEED):
+        """Initialize the hash functions."""
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        rng = np.random.default_rng(seed)
+        high = np.iinfo(np.uint64).max
+        self._a = rng.integers(1, high, size=num_perm, dtype=np.uint64, endpoint=True)
+        self._a |= np.uint64(1)
+        self._b = rng.integers(0, high, size=num_perm, dtype=np.uint64, endpoint=True)
+        self._band_mix = rng.integers(1, high, size=self.rows, dtype=np.uint64, endpoint=True)
+
+    def signatures(self, shingle_sets: Sequence[Set[str]]) -> np.ndarray:
+        """Compute a ``(len(shingle_sets), num_perm)`` uint32 signature matrix.
+
+        Empty sets get a row of all-max values; callers should mask them out.
+        """
+        count = len(shingle_sets)
+        result = np.full((count, self.num_perm), _EMPTY, dtype=np.uint32)
+
+        start = 0
+        while start < count:
+            docs, lengths, hashes = [], [], []
+            end = start
+            while end < count:
+                shingles = shingle_sets[end]
+                if docs and (len(hashes) + len(shingles)) * self.num_perm > _MAX_HASH_CELLS:
+                    break
+                if shingles:
+                    docs.append(end)
+                    lengths.append(len(shingles))
+                    hashes.extend(zlib.crc32(shingle.encode("utf-8")) for shingle in shingles)
+                end += 1
+
+            if docs:
+                values = np.array(hashes, dtype=np.uint64)
+                permuted = (self._a[:, None] * values[None, :] + self._b[:, None]) >> np.uint64(32)
+                offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+                result[docs] = np.minimum.reduceat(permuted, offsets, axis=1).T
+            start = end
+
+        return result
+
+    def band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """Collapse each band of each signature into one uint64 key."""
+        rows = signatures.astype(np.uint64).reshape(len(signatures), self.bands, self.rows)
+        return (rows * self._band_mix).sum(axis=2, dtype=np.uint64)
+
+
+class DuplicateDetector:
+    """Find likely duplicate contracts across sources in roughly linear time.
+
+    Contracts are streamed in id order, ``batch_size`` at a time. For each
+    one only the LSH band keys of its title and description signatures are
+    kept. Contracts from different sources that share a band key are
+    candidates. A candidate is reported if its titles or descriptions are at
+    least ``threshold`` similar and the agency, due date or estimated value
+    agree. Very large buckets (boilerplate titles) are skipped.
+    """
+
+    FIELDS = {
+        "title": title_shingles,
+        "description": description_shingles,
+    }
+
+    VERIFY_COLUMNS = (
+        Contract.id,
+        Contract.source_id,
+        Contract.title,
+        Contract.description,
+        Contract.agency,
+        Contract.due_date,
+        Contract.estimated_value,
+    )
+
+    def __init__(
+        self,
+        db: Session,
+        batch_size: Optional[int] = None,
+        num_perm: Optional[int] = None,
+        bands: Optional[int] = None,
+        threshold: Optional[float] = None,
+        max_bucket_size: Optional[int] = None,
+    ):
+        """Initialize the detector (defaults come from settings)."""
+        self.db = db
+        self.batch_size = batch_size or settings.dedupe_batch_size
+        self.threshold = (
+            threshold if threshold is not None else settings.dedupe_similarity_threshold
+        )
+        self.max_bucket_size = max_bucket_size or settings.dedupe_max_bucket_size
+        self.hasher = MinHasher(
+            num_perm=num_perm or settings.dedupe_num_perm,
+            bands=bands or settings.dedupe_bands,
+        )
+
+    def _iter_batches(self, *columns) -> Iterator[list]:
+        """Stream contract rows in id order using keyset pagination."""
+        last_id = 0
+        while True:
+            rows = self.db.execute(
+                select(Contract.id, *columns)
+                .where(Contract.id > last_id)
+                .order_by(Contract.id)
+                .limit(self.batch_size)
+            ).all()
+            if not rows:
+                return
+            yield rows
+            last_id = rows[-1].id
+
+    def field_keys(self, rows: Sequence) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Get (row positions, band keys) per field for rows with that field set."""
+        result = {}
+        for name, shingle in self.FIELDS.items():
+            shingle_sets = [shingle(getattr(row, name)) for row in rows]
+            present = np.flatnonzero([bool(shingles) for shingles in shingle_sets])
+            if len(present):
+                signatures = self.hasher.signatures([shingle_sets[i] for i in present])
+                result[name] = (present, self.hasher.band_keys(signatures))
+        return result
+
+    def _index(self) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Compute (ids, source_ids, band keys) per field over the whole table."""
+        parts: Dict[str, List[tuple]] = {name: [] for name in self.FIELDS}
+        columns = [Contract.source_id] + [getattr(Contract, name) for name in self.FIELDS]
+
+        for rows in self._iter_batches(*columns):
+            ids = np.array([row.id for row in rows], dtype=np.int64)
+            source_ids = np.array([row.source_id for row in rows], dtype=np.int64)
+            for name, (present, keys) in self.field_keys(rows).items():
+                parts[name].append((ids[present], source_ids[present], keys))
+
+        index = {}
+        for name, chunks in parts.items():
+            if chunks:
+                index[name] = tuple(np.concatenate(arrays) for arrays in zip(*chunks))
+        return index
+
+    def _bucket_pairs(
+        self,
+        ids: np.ndarray,
+        source_ids: np.ndarray,
+        keys: np.ndarray,
+        pairs: Set[Tuple[int, int]],
+    ) -> int:
+        """Add cross-source pairs that share a band key; return skipped buckets."""
+        skipped = 0
+        for band in range(keys.shape[1]):
+            column = keys[:, band]
+            order = np.argsort(column, kind="stable")
+            boundaries = np.flatnonzero(np.diff(column[order])) + 1
+            starts = np.concatenate(([0], boundaries))
+            ends = np.concatenate((boundaries, [len(column)]))
+
+            for start, end in zip(starts, ends):
+                size = end - start
+                if size < 2:
+                    continue
+                if size > self.max_bucket_size:
+                    skipped += 1
+                    continue
+                members = order[start:end]
+                for i, j in combinations(members, 2):
+                    if source_ids[i] != source_ids[j]:
+                        first, second = int(ids[i]), int(ids[j])
+                        pairs.add((first, second) if first < second else (second, first))
+        return skipped
+
+    def candidate_pairs(self) -> Set[Tuple[int, int]]:
+        """Get cross-source contract id pairs that share any LSH band."""
+        pairs: Set[Tuple[int, int]] = set()
+        skipped = 0
+        for ids, source_ids, keys in self._index().values():
+            skipped += self._bucket_pairs(ids, source_ids, keys, pairs)
+        if skipped:
+            logger.info(f"Skipped {skipped} LSH buckets larger than {self.max_bucket_size}")
+        return pairs
+
+    def load(self, contract_ids: Iterable[int]) -> Dict[int, tuple]:
+        """Load the columns needed for verification, in id chunks."""
+        rows = {}
+        contract_ids = sorted(contract_ids)
+        for start in range(0, len(contract_ids), self.batch_size):
+            chunk = contract_ids[start:start + self.batch_size]
+            for row in self.db.execute(
+                select(*self.VERIFY_COLUMNS).where(Contract.id.in_(chunk))
+            ):
+                rows[row.id] = row
+        return rows
+
+    def is_duplicate(self, first, second) -> bool:
+        """Verify a candidate pair with text similarity and field heuristics."""
+        similar = (
+            jaccard(title_shingles(first.title), title_shingles(second.title)) >= self.threshold
+            or jaccard(
+                description_shingles(first.description),
+                description_shingles(second.description),
+            ) >= self.threshold
+        )
+        if not similar:
+            return False
+
+        return bool(
+            (first.agency and first.agency == second.agency)
+            or (first.due_date and first.due_date == second.due_date)
+            or (
+                first.estimated_value
+                and second.estimated_value
+                and abs(first.estimated_value - second.estimated_value) < 100
+            )
+        )
+
+    def find_duplicates(self) -> List[Tuple[int, int]]:
+        """Find likely duplicate pairs as sorted ``(lower id, higher id)`` tuples."""
+        candidates = self.candidate_pairs()
+        rows = self.load({contract_id for pair in candidates for contract_id in pair})
+
+        duplicates = sorted(
+            (first, second)
+            for first, second in candidates
+            if first in rows and second in rows and self.is_duplicate(rows[first], rows[second])
+        )
+        logger.info(f"Verified {len(duplicates)} duplicates out of {len(candidates)} candidates")
+        return duplicates
+
+
+class UnionFind:
+    """Disjoint sets over integer ids; each set's root is its smallest id."""
+
+    def __init__(self):
+        """Initialize an empty forest."""
+        self.parent: Dict[int, int] = {}
+
+    def find(self, item: int) -> int:
+        """Get the root of an item's set, compressing the path to it."""
+        root = item
+        while self.parent.get(root, root) != root:
+            root = self.parent[root]
+        while item != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, first: int, second: int) -> int:
+        """Merge the sets of two items and return the new root."""
+        first, second = self.find(first), self.find(second)
+        if second < first:
+            first, second = second, first
+        if first != second:
+            self.parent[second] = first
+        return first
+
+
+def _chunks(items: Sequence, size: int) -> Iterator[Sequence]:
+    """Split a sequence into chunks of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class DuplicateIndex:
+    """Persistent LSH index and duplicate clusters, maintained incrementally.
+
+    ``add_contracts`` stores the band keys of new or changed contracts in
+    ``contract_lsh_keys`` and verifies them only against contracts sharing a
+    key, so each scrape costs time proportional to the contracts it saved.
+    Verified duplicates are merged into ``contract_duplicates`` clusters
+    with union-find. Clusters only ever merge: a contract edited so that it
+    no longer matches keeps its cluster until ``rebuild()``.
+    """
+
+    def __init__(self, db: Session, detector: Optional[DuplicateDetector] = None):
+        """Initialize the index."""
+        self.db = db
+        self.detector = detector or DuplicateDetector(db)
+        # Per field and band salts, so equal keys from different bands differ
+        rng = np.random.default_rng(_SEED + 1)
+        self._salts = rng.integers(
+            0,
+            np.iinfo(np.uint64).max,
+            size=(len(DuplicateDetector.FIELDS), self.detector.hasher.bands),
+            dtype=np.uint64,
+            endpoint=True,
+        )
+
+    def _keys(self, rows: Sequence) -> Dict[int, Set[int]]:
+        """Get the stored (signed 64-bit) LSH keys of each contract row."""
+        keys_by_contract: Dict[int, Set[int]] = {row.id: set() for row in rows}
+        field_keys = self.detector.field_keys(rows)
+        for position, name in enumerate(DuplicateDetector.FIELDS):
+            if name not in field_keys:
+                continue
+            present, keys = field_keys[name]
+            salted = (keys ^ self._salts[position]).view(np.int64)
+            for row_index, row_keys in zip(present, salted.tolist()):
+                keys_by_contract[rows[row_index].id].update(row_keys)
+        return keys_by_contract
+
+    def add_contracts(self, contract_ids: Iterable[int]) -> int:
+        """Index new or changed contracts and merge any duplicates found.
+
+        Returns the number of verified duplicate pairs. Does not commit.
+        """
+        batch_size = self.detector.batch_size
+        rows = self.detector.load(contract_ids)
+        if not rows:
+            return 0
+
+        keys_by_contract = self._keys(list(rows.values()))
+        new_ids = list(keys_by_contract)
+        for chunk in _chunks(new_ids, batch_size):
+            self.db.execute(delete(ContractLSHKey).where(ContractLSHKey.contract_id.in_(chunk)))
+
+        buckets: Dict[int, List[int]] = defaultdict(list)
+        for contract_id, keys in keys_by_contract.items():
+            for key in keys:
+                buckets[key].append(contract_id)
+        for chunk in _chunks(list(buckets), batch_size):
+            for key, contract_id in self.db.execute(
+                select(ContractLSHKey.key, ContractLSHKey.contract_id).where(
+                    ContractLSHKey.key.in_(chunk)
+                )
+            ):
+                buckets[key].append(contract_id)
+
+        # Pairs of two already indexed contracts were checked when they were added
+        new_set = set(new_ids)
+        candidates: Set[Tuple[int, int]] = set()
+        for members in buckets.values():
+            if len(members) < 2 or len(members) > self.detector.max_bucket_size:
+                continue
+            for first, second in combinations(members, 2):
+                if first in new_set or second in new_set:
+                    candidates.add((first, second) if first < second else (second, first))
+
+        missing = {contract_id for pair in candidates for contract_id in pair} - set(rows)
+        rows.update(self.detector.load(missing))
+        duplicates = [
+            (first, second)
+            for first, second in candidates
+            if first in rows
+            and second in rows
+            and rows[first].source_id != rows[second].source_id
+            and self.detector.is_duplicate(rows[first], rows[second])
+        ]
+
+        key_rows = [
+            {"key": key, "contract_id": contract_id}
+            for contract_id, keys in keys_by_contract.items()
+            for key in keys
+        ]
+        if key_rows:
+            self.db.execute(insert(ContractLSHKey.__table__), key_rows)
+        self._merge(duplicates)
+        return len(duplicates)
+
+    def _merge(self, pairs: Sequence[Tuple[int, int]]):
+        """Merge duplicate pairs into the stored clusters."""
+        if not pairs:
+            return
+
+        involved = sorted({contract_id for pair in pairs for contract_id in pair})
+        cluster_of: Dict[int, int] = {}
+        for chunk in _chunks(involved, self.detector.batch_size):
+            cluster_of.update(
+                self.db.execute(
+                    select(ContractDuplicate.contract_id, ContractDuplicate.cluster_id).where(
+                        ContractDuplicate.contract_id.in_(chunk)
+                    )
+                ).all()
+            )
+
+        forest = UnionFind()
+        for first, second in pairs:
+            forest.union(cluster_of.get(first, first), cluster_of.get(second, second))
+
+        for root in set(cluster_of.values()):
+            merged_root = forest.find(root)
+            if merged_root != root:
+                self.db.execute(
+                    update(ContractDuplicate)
+                    .where(ContractDuplicate.cluster_id == root)
+                    .values(cluster_id=merged_root)
+                )
+
+        new_members = [
+            {"contract_id": contract_id, "cluster_id": forest.find(contract_id)}
+            for contract_id in involved
+            if contract_id not in cluster_of
+        ]
+        if new_members:
+            self.db.execute(insert(ContractDuplicate.__table__), new_members)
+
+    def rebuild(self) -> int:
+        """Recompute the whole index and all clusters, committing per batch."""
+        self.db.execute(delete(ContractDuplicate))
+        self.db.execute(delete(ContractLSHKey))
+        self.db.commit()
+
+        total = 0
+        for rows in self.detector._iter_batches():
+            total += self.add_contracts([row.id for row in rows])
+            self.db.commit()
+        logger.info(f"Rebuilt duplicate index: {total} duplicate pairs")
+        return total
+
+    def cluster(self, contract_id: int) -> List[int]:
+        """Get the ids of all contracts in a contract's cluster (empty if none)."""
+        cluster_id = (
+            select(ContractDuplicate.cluster_id)
+            .where(ContractDuplicate.contract_id == contract_id)
+            .scalar_subquery()
+        )
+        return list(
+            self.db.execute(
+                select(ContractDuplicate.contract_id)
+                .where(ContractDuplicate.cluster_id == cluster_id)
+                .order_by(ContractDuplicate.contract_id)
+            ).scalars()
+        )
+
+
+def exclude_duplicates(query: Query) -> Query:
+    """Keep only the canonical contract of each duplicate cluster in a query.
+
+    Contracts without duplicates are unaffected. If the canonical contract
+    is excluded by the query's other filters, so is the rest of its cluster.
+    """
+    return query.outerjoin(
+        ContractDuplicate, ContractDuplicate.contract_id == Contract.id
+    ).filter(
+        or_(ContractDuplicate.cluster_id.is_(None), ContractDuplicate.cluster_id == Contract.id)
+    )
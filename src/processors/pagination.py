@@ -0,0 +1,65 @@
+"""Keyset (cursor) pagination for contract listings."""
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+from src.models.contract import Contract
+
+# Position of the last contract on a page: (due_date, id)
+Cursor = Tuple[Optional[datetime], int]
+
+# Listing order: soonest deadline first, contracts without one last, ties by id.
+# idx_contract_due_date_id serves both the order and the cursor range scans.
+CONTRACT_ORDER = (Contract.due_date.asc().nullslast(), Contract.id.asc())
+
+
+def encode_cursor(contract: Contract) -> str:
+    """Encode the position after a contract as an opaque cursor string."""
+    due_date = contract.due_date.isoformat() if contract.due_date else None
+    payload = json.dumps([due_date, contract.id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Decode a cursor from ``encode_cursor``; raises ValueError if it is malformed."""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        due_date, contract_id = json.loads(payload)
+        if due_date is not None:
+            due_date = datetime.fromisoformat(due_date)
+        if not isinstance(contract_id, int):
+            raise TypeError("contract id must be an integer")
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    return due_date, contract_id
+
+
+def keyset_page(query: Query, after: Optional[Cursor], limit: int) -> List[Contract]:
+    """Fetch up to ``limit`` contracts following a cursor position, in CONTRACT_ORDER.
+
+    Each page is an index range scan starting at the cursor, so deep pages
+    cost the same as the first. Rows with a due date and rows without one
+    are read with separate range conditions (a single OR of both cannot use
+    the index), the latter only once the dated rows run out.
+    """
+    if after is None:
+        return query.order_by(*CONTRACT_ORDER).limit(limit).all()
+
+    due_date, contract_id = after
+    undated = query.filter(Contract.due_date.is_(None))
+    if due_date is None:
+        return undated.filter(Contract.id > contract_id).order_by(Contract.id).limit(limit).all()
+
+    contracts = (
+        query.filter(tuple_(Contract.due_date, Contract.id) > tuple_(due_date, contract_id))
+        .order_by(*CONTRACT_ORDER)
+        .limit(limit)
+        .all()
+    )
+    if len(contracts) < limit:
+        contracts += undated.order_by(Contract.id).limit(limit - len(contracts)).all()
+    return contracts
@@ -0,0 +1,39 @@
+"""Process pool for CPU-bound listing page parsing."""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.config import settings
+from src.utils.logger import get_logger
+
+logger = get_logger("parse_pool")
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_parse_executor() -> Optional[ProcessPoolExecutor]:
+    """Get the shared parse process pool, or None when disabled.
+
+    Workers are started with ``spawn`` since the scheduler process runs
+    threads, which makes ``fork`` unsafe.
+    """
+    global _executor
+    if not settings.parse_in_process_pool:
+        return None
+    if _executor is None:
+        workers = settings.parse_workers or os.cpu_count() or 1
+        _executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info(f"Started parse pool with {workers} worker processes")
+    return _executor
+
+
+def shutdown_parse_executor():
+    """Shut down the shared parse process pool, if it was started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
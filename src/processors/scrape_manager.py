@@ -5,8 +5,10 @@ from typing import List, Dict, Any
 from sqlalchemy.orm import Session
 
 from src.models.source import DataSource, SourceStatus
+from src.models.fingerprint import PageFingerprint
 from src.scrapers import SCRAPER_REGISTRY
 from src.processors.aggregator import ContractAggregator
+from src.processors.parse_pool import get_parse_executor
 from src.utils.logger import get_logger
 from src.config import settings
 
@@ -32,6 +34,7 @@ class ScrapeManager:
             "success": False,
             "contracts_found": 0,
             "stats": {},
+            "metrics": {},
             "error": None,
         }
 
@@ -48,24 +51,30 @@ class ScrapeManager:
             # Initialize scraper
             scraper = scraper_class(source.id)
             scraper.rate_limit_delay = source.rate_limit_seconds
+            scraper.known_fingerprints = self._load_fingerprints(source)
+            scraper.parse_executor = get_parse_executor()
 
-            # Run scraping
-            contracts = await scraper.scrape()
-
-            # Aggregate results
-            stats = self.aggregator.save_contracts(contracts, source)
+            # Run scraping, saving each page's contracts as it arrives
+            contracts_found, stats = await self._run_pipeline(scraper, source)
+            self.aggregator.record_scrape(source, stats)
 
             # Update result
             result["success"] = True
-            result["contracts_found"] = len(contracts)
+            result["contracts_found"] = contracts_found
             result["stats"] = stats
+            result["metrics"] = dict(scraper.metrics)
 
             # Update source status
             source.status = SourceStatus.ACTIVE
             source.last_error = None
             self.db.commit()
 
-            logger.info(f"Completed scrape for {source.name}: {len(contracts)} contracts found")
+            logger.info(
+                f"Completed scrape for {source.name}: {contracts_found} contracts found, "
+                f"{scraper.metrics['pages_unchanged']} pages unchanged, "
+                f"{scraper.metrics['cache_hits']} pages not modified "
+                f"({scraper.metrics['bytes_saved']} bytes saved)"
+            )
 
         except Exception as e:
             logger.error(f"Error scraping {source.name}: {e}")
@@ -87,6 +96,83 @@ class ScrapeManager:
 
         return result
 
+    async def _run_pipeline(self, scraper, source: DataSource):
+        """Stream page batches from a scraper into the database.
+
+        Batches pass through a bounded queue: when saving falls behind, the
+        producer blocks on ``put`` and the scraper stops starting new pages.
+        Each batch is committed as it arrives.
+
+        Returns (contracts_found, combined save stats).
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, settings.scrape_queue_batches))
+        totals = {"new": 0, "updated": 0, "unchanged": 0, "errors": 0}
+        contracts_found = 0
+
+        async def produce():
+            batches = scraper.scrape()
+            try:
+                async for batch in batches:
+                    await queue.put(batch)
+            finally:
+                await batches.aclose()
+            await queue.put(None)
+
+        async def consume():
+            nonlocal contracts_found
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    return
+                contracts_found += len(batch.contracts)
+                stats = self.aggregator.save_batch(batch.contracts, source)
+                for key in totals:
+                    totals[key] += stats.get(key, 0)
+                if batch.fingerprint:
+                    self._save_fingerprints(source, {batch.url: batch.fingerprint})
+
+        producer = asyncio.ensure_future(produce())
+        consumer = asyncio.ensure_future(consume())
+        try:
+            await asyncio.gather(producer, consumer)
+        except BaseException:
+            producer.cancel()
+            consumer.cancel()
+            await asyncio.gather(producer, consumer, return_exceptions=True)
+            raise
+
+        return contracts_found, totals
+
+    def _load_fingerprints(self, source: DataSource) -> Dict[str, str]:
+        """Load page fingerprints recorded by the source's previous scrapes."""
+        rows = (
+            self.db.query(PageFingerprint.url, PageFingerprint.fingerprint)
+            .filter(PageFingerprint.source_id == source.id)
+            .all()
+        )
+        return {url: fingerprint for url, fingerprint in rows}
+
+    def _save_fingerprints(self, source: DataSource, fingerprints: Dict[str, str]):
+        """Record fingerprints of pages whose contracts were saved."""
+        if not fingerprints:
+            return
+
+        existing = {
+            row.url: row
+            for row in self.db.query(PageFingerprint).filter(
+                PageFingerprint.source_id == source.id,
+                PageFingerprint.url.in_(list(fingerprints)),
+            )
+        }
+        for url, fingerprint in fingerprints.items():
+            if url in existing:
+                existing[url].fingerprint = fingerprint
+            else:
+                self.db.add(
+                    PageFingerprint(source_id=source.id, url=url, fingerprint=fingerprint)
+                )
+        self.db.commit()
+
     async def scrape_all_sources(self) -> List[Dict[str, Any]]:
         """Scrape all active data sources."""
         sources = (
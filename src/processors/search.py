@@ -0,0 +1,65 @@
+"""Keyword search over contracts using the full-text index."""
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, literal_column, or_
+from sqlalchemy.orm import Query
+
+from src.models.contract import Contract
+from src.models.search import SEARCH_TABLE, contract_search, has_search_index
+
+# Relevance weights for title, description and agency matches (FTS5 bm25)
+BM25_WEIGHTS = (10.0, 1.0, 5.0)
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def search_terms(keyword: str) -> List[str]:
+    """Split a keyword string into lowercase search terms."""
+    return [term.lower() for term in _TERM.findall(keyword)]
+
+
+def fts5_query(terms: List[str]) -> str:
+    """Build an FTS5 query matching rows containing every term as a prefix."""
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def tsquery(terms: List[str]) -> str:
+    """Build a PostgreSQL tsquery matching rows containing every term as a prefix."""
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def keyword_search(query: Query, keyword: str) -> Tuple[Query, Optional[object]]:
+    """Filter a Contract query to rows matching a keyword.
+
+    Every word of the keyword must appear in the title, description or
+    agency, matching word prefixes ("constr" finds "construction"). Returns
+    the filtered query and a relevance expression to order by (best match
+    first), or None when the database has no full-text index and the
+    filter falls back to a LIKE scan.
+    """
+    terms = search_terms(keyword)
+    bind = query.session.get_bind()
+    if not terms or not has_search_index(bind):
+        pattern = f"%{keyword}%"
+        query = query.filter(
+            or_(
+                Contract.title.ilike(pattern),
+                Contract.description.ilike(pattern),
+                Contract.agency.ilike(pattern),
+            )
+        )
+        return query, None
+
+    if bind.dialect.name == "sqlite":
+        query = query.join(contract_search, contract_search.c.rowid == Contract.id).filter(
+            contract_search.c[SEARCH_TABLE].op("MATCH")(fts5_query(terms))
+        )
+        # bm25() is lower for better matches
+        rank = func.bm25(literal_column(SEARCH_TABLE), *BM25_WEIGHTS)
+        return query, rank.asc()
+
+    vector = literal_column("contracts.search_vector")
+    ts_query = func.to_tsquery("english", tsquery(terms))
+    query = query.filter(vector.op("@@")(ts_query))
+    return query, func.ts_rank_cd(vector, ts_query).desc()
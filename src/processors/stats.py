@@ -0,0 +1,197 @@
+"""Incrementally maintained contract statistics rollup."""
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from src.models.contract import Contract, ContractStatus
+from src.models.database import UPSERT_INSERTS
+from src.models.source import DataSource
+from src.models.stats import ContractStat
+from src.utils.logger import get_logger
+
+logger = get_logger("stats")
+
+# (state, source_id, status, category) with missing values normalized
+StatKey = Tuple[str, int, ContractStatus, str]
+
+
+def stat_key(
+    state: Optional[str],
+    source_id: int,
+    status: Optional[ContractStatus],
+    category: Optional[str],
+) -> StatKey:
+    """Get the rollup group of a contract."""
+    return (state or "", source_id, status or ContractStatus.UNKNOWN, category or "")
+
+
+class StatsRollup:
+    """Contract counts per (state, source, status, category) in ``contract_stats``.
+
+    ``apply`` adds per-group deltas in the caller's transaction, so the
+    rollup commits together with the contracts it describes. ``rebuild``
+    recomputes it from the contracts table, which is needed after contracts
+    are deleted outside ``ContractAggregator``.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize the rollup."""
+        self.db = db
+
+    def apply(self, deltas: Counter):
+        """Add per-group contract count deltas (without committing).
+
+        Groups whose delta is zero are still touched, so ``updated_at``
+        reflects the last change to any contract in the group.
+        """
+        if not deltas:
+            return
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "state": state,
+                "source_id": source_id,
+                "status": status,
+                "category": category,
+                "contract_count": delta,
+                "updated_at": now,
+            }
+            for (state, source_id, status, category), delta in deltas.items()
+        ]
+
+        upsert = UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if upsert is not None:
+            table = ContractStat.__table__
+            stmt = upsert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.state, table.c.source_id, table.c.status, table.c.category],
+                set_={
+                    "contract_count": table.c.contract_count + stmt.excluded.contract_count,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+            self.db.execute(stmt, rows)
+            return
+
+        for row in rows:
+            stat = self.db.query(ContractStat).filter_by(
+                state=row["state"],
+                source_id=row["source_id"],
+                status=row["status"],
+                category=row["category"],
+            ).with_for_update().first()
+            if stat is None:
+                self.db.add(ContractStat(**row))
+            else:
+                stat.contract_count += row["contract_count"]
+                stat.updated_at = now
+
+    def rebuild(self):
+        """Recompute every group from the contracts table and commit."""
+        state = func.coalesce(Contract.state, "")
+        status = func.coalesce(
+            Contract.status, literal(ContractStatus.UNKNOWN, Contract.status.type)
+        )
+        category = func.coalesce(Contract.category, "")
+
+        self.db.execute(delete(ContractStat))
+        self.db.execute(
+            insert(ContractStat).from_select(
+                ["state", "source_id", "status", "category", "contract_count", "updated_at"],
+                select(
+                    state,
+                    Contract.source_id,
+                    status,
+                    category,
+                    func.count(),
+                    literal(datetime.utcnow(), ContractStat.updated_at.type),
+                ).group_by(state, Contract.source_id, status, category),
+            )
+        )
+        self.db.commit()
+        logger.info("Rebuilt contract statistics rollup")
+
+    def _is_empty(self) -> bool:
+        """Check whether the rollup has no groups yet."""
+        return self.db.execute(select(ContractStat.id).limit(1)).first() is None
+
+    def _ensure_built(self):
+        """Build the rollup if it is empty but contracts exist.
+
+        This happens for databases created before the rollup existed.
+        """
+        if self._is_empty() and self.db.execute(select(Contract.id).limit(1)).first():
+            self.rebuild()
+
+    def version(self) -> Optional[datetime]:
+        """Get the time of the last contract change recorded in the rollup.
+
+        Every saved contract change touches its group, so this changes
+        whenever cached results derived from contracts may be stale.
+        """
+        return self.db.scalar(select(func.max(ContractStat.updated_at)))
+
+    def count(
+        self,
+        state: Optional[str] = None,
+        status: Optional[ContractStatus] = None,
+        category: Optional[str] = None,
+    ) -> int:
+        """Count contracts by state, status and category substring (like /contracts)."""
+        self._ensure_built()
+        query = select(func.coalesce(func.sum(ContractStat.contract_count), 0))
+        if state is not None:
+            query = query.where(ContractStat.state == state)
+        if status is not None:
+            query = query.where(ContractStat.status == status)
+        if category is not None:
+            query = query.where(ContractStat.category.ilike(f"%{category}%"))
+        return self.db.scalar(query)
+
+    def read(self) -> dict:
+        """Summarize the rollup by status, state and source."""
+        self._ensure_built()
+
+        count = func.sum(ContractStat.contract_count)
+        by_status: Dict[str, int] = {
+            status.value: total
+            for status, total in self.db.execute(
+                select(ContractStat.status, count).group_by(ContractStat.status)
+            )
+            if total > 0
+        }
+        by_state: Dict[str, int] = {
+            state or "Unknown": total
+            for state, total in self.db.execute(
+                select(ContractStat.state, count).group_by(ContractStat.state)
+            )
+            if total > 0
+        }
+        by_source_id: Dict[int, int] = {
+            source_id: total
+            for source_id, total in self.db.execute(
+                select(ContractStat.source_id, count).group_by(ContractStat.source_id)
+            )
+        }
+        last_updated = self.version()
+
+        by_source = {
+            name: max(by_source_id.get(source_id, 0), 0)
+            for source_id, name in self.db.execute(
+                select(DataSource.id, DataSource.name).order_by(DataSource.id)
+            )
+        }
+
+        return {
+            "total_contracts": sum(by_status.values()),
+            "open_contracts": by_status.get(ContractStatus.OPEN.value, 0),
+            "closed_contracts": by_status.get(ContractStatus.CLOSED.value, 0),
+            "by_status": by_status,
+            "by_state": by_state,
+            "by_source": by_source,
+            "last_updated": (last_updated or datetime.utcnow()).isoformat(),
+        }
@@ -0,0 +1,121 @@
+"""Total result counts for contract searches."""
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from src.config import settings
+from src.processors.stats import StatsRollup
+from src.utils.cache import TTLCache
+from src.utils.logger import get_logger
+
+logger = get_logger("totals")
+
+TOTAL_MODES = ("exact", "estimated", "cached", "none")
+
+# Filters the contract_stats rollup can count exactly
+ROLLUP_FILTERS = frozenset({"state", "status", "category"})
+
+# Filters matched case-insensitively, so their cache keys can be too
+CASE_INSENSITIVE_FILTERS = frozenset({"keyword", "category", "naics_code", "agency"})
+
+
+_cache: Optional[TTLCache] = None
+
+
+def get_count_cache() -> TTLCache:
+    """Get the process-wide search total cache."""
+    global _cache
+    if _cache is None:
+        _cache = TTLCache(
+            ttl_seconds=settings.search_count_cache_ttl_seconds,
+            max_entries=settings.search_count_cache_size,
+        )
+    return _cache
+
+
+def filter_signature(filters: Dict[str, Any]) -> Tuple:
+    """Normalize search filters to a hashable cache key.
+
+    Unset filters are dropped and case-insensitive filters are lowercased,
+    so equivalent searches share a cache entry.
+    """
+    signature = []
+    for name, value in sorted(filters.items()):
+        if value is None or value is False or value == "":
+            continue
+        if name in CASE_INSENSITIVE_FILTERS and isinstance(value, str):
+            value = value.lower()
+        signature.append((name, value))
+    return tuple(signature)
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a select, for planner row estimates."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        """Wrap the statement to explain."""
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    """Compile EXPLAIN for PostgreSQL."""
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def planner_estimate(db: Session, query: Query) -> Optional[int]:
+    """Get the planner's row estimate for a query (PostgreSQL only)."""
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    try:
+        plan = db.execute(Explain(query.statement)).scalar()
+    except SQLAlchemyError as e:
+        logger.debug(f"Could not get a planner estimate: {e}")
+        return None
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_total(
+    db: Session, query: Query, filters: Dict[str, Any], mode: str
+) -> Tuple[Optional[int], bool]:
+    """Count the results of a contract search.
+
+    Modes:
+
+    - ``exact``: ``COUNT(*)`` with the search filters on every request.
+    - ``cached``: the exact count, reused for ``search_count_cache_ttl_seconds``
+      per normalized filter set. Entries are keyed by the statistics rollup
+      version as well, so any saved contract change invalidates them.
+    - ``estimated``: exact from the rollup when only state, status and
+      category are filtered, otherwise the PostgreSQL planner's estimate,
+      otherwise the cached count.
+    - ``none``: no total; clients page with ``has_more``/``next_cursor``.
+
+    Returns ``(total, estimated)`` where ``estimated`` tells whether the
+    total is only approximate.
+    """
+    if mode == "none":
+        return None, False
+    if mode == "exact":
+        return query.count(), False
+
+    active = {name: value for name, value in filters.items() if value not in (None, False, "")}
+    if mode == "estimated":
+        if set(active) <= ROLLUP_FILTERS:
+            return StatsRollup(db).count(**active), False
+        estimate = planner_estimate(db, query)
+        if estimate is not None:
+            return estimate, True
+
+    cache = get_count_cache()
+    key = (filter_signature(active), StatsRollup(db).version())
+    total = cache.get(key)
+    if total is None:
+        total = query.count()
+        cache.set(key, total)
+    return total, False
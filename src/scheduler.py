@@ -1,5 +1,6 @@
 """Scheduler for automated scraping jobs."""
 import asyncio
+import threading
 from datetime import datetime
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -7,6 +8,9 @@ from apscheduler.triggers.interval import IntervalTrigger
 from src.config import settings
 from src.models.database import SessionLocal
 from src.processors.scrape_manager import ScrapeManager
+from src.processors.parse_pool import shutdown_parse_executor
+from src.scrapers.browser_pool import close_browser_pool
+from src.scrapers.http_client import close_http_client
 from src.utils.logger import get_logger
 
 logger = get_logger("scheduler")
@@ -19,6 +23,30 @@ class ScraperScheduler:
         """Initialize the scheduler."""
         self.scheduler = BackgroundScheduler()
         self.is_running = False
+        self._loop = None
+        self._loop_lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop shared by all jobs.
+
+        Reusing one loop lets pooled resources (HTTP connections, browsers)
+        survive between scheduled runs instead of being rebuilt every job.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    def _close_loop(self):
+        """Release pooled resources and close the shared event loop."""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                return
+            try:
+                self._loop.run_until_complete(close_browser_pool())
+                self._loop.run_until_complete(close_http_client())
+            finally:
+                self._loop.close()
+                self._loop = None
 
     def _scrape_job(self):
         """Execute a scraping job."""
@@ -29,30 +57,27 @@ class ScraperScheduler:
         try:
             manager = ScrapeManager(db)
 
-            # Run the async scraping in a new event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
+            # Run the async scraping on the shared event loop
+            with self._loop_lock:
+                loop = self._get_loop()
+                asyncio.set_event_loop(loop)
                 results = loop.run_until_complete(manager.scrape_sources_due())
 
-                # Log results
-                successful = sum(1 for r in results if r.get("success"))
-                total_contracts = sum(r.get("contracts_found", 0) for r in results)
+            # Log results
+            successful = sum(1 for r in results if r.get("success"))
+            total_contracts = sum(r.get("contracts_found", 0) for r in results)
 
-                logger.info(
-                    f"Scheduled scrape completed: {successful}/{len(results)} sources successful, "
-                    f"{total_contracts} contracts found"
-                )
+            logger.info(
+                f"Scheduled scrape completed: {successful}/{len(results)} sources successful, "
+                f"{total_contracts} contracts found"
+            )
 
-                # Log any errors
-                for result in results:
-                    if not result.get("success"):
-                        logger.error(
-                            f"Source {result.get('source_name')} failed: {result.get('error')}"
-                        )
-
-            finally:
-                loop.close()
+            # Log any errors
+            for result in results:
+                if not result.get("success"):
+                    logger.error(
+                        f"Source {result.get('source_name')} failed: {result.get('error')}"
+                    )
 
         except Exception as e:
             logger.error(f"Scraping job failed: {e}")
@@ -93,6 +118,8 @@ class ScraperScheduler:
             return
 
         self.scheduler.shutdown()
+        self._close_loop()
+        shutdown_parse_executor()
         self.is_running = False
         logger.info("Scheduler stopped")
 
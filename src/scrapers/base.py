@@ -1,17 +1,60 @@
 """Base scraper classes with rate limiting and error handling."""
 import asyncio
-import json
+import importlib
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-import requests
+from itertools import islice
+from typing import AsyncIterator, List, Dict, Any, Optional, Union
+import httpx
 from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.config import settings
 from src.utils.logger import get_logger
-from src.models.contract import Contract
+from src.utils.helpers import page_fingerprint
+from src.models.scraped import ScrapedContract
+from src.scrapers.browser_pool import get_browser_pool
+from src.scrapers.http_cache import HTTPCache, get_http_cache
+from src.scrapers.http_client import get_http_client
+from src.scrapers.parsing import LxmlNode, parse_document
+from src.scrapers.rate_limiter import get_rate_limiter
+
+@dataclass
+class PageBatch:
+    """Contracts extracted from one listing page."""
+
+    url: str
+    contracts: List[ScrapedContract]
+    fingerprint: Optional[str] = None
+
+
+# Scraper instances reused by parse worker processes, keyed by (class, source)
+_worker_scrapers: Dict[tuple, "BaseScraper"] = {}
+
+
+def parse_listing_in_worker(
+    module: str, qualname: str, source_id: int, parser_backend: str, html: str
+) -> List[Dict[str, Any]]:
+    """Parse a listing page inside a worker process.
+
+    Takes raw HTML and returns plain dicts, so only picklable data crosses
+    the process boundary.
+    """
+    key = (module, qualname, source_id)
+    scraper = _worker_scrapers.get(key)
+    if scraper is None:
+        scraper_class = importlib.import_module(module)
+        for part in qualname.split("."):
+            scraper_class = getattr(scraper_class, part)
+        scraper = scraper_class(source_id)
+        _worker_scrapers[key] = scraper
+
+    scraper.parser_backend = parser_backend
+    return scraper.parse_listing(html)
 
 
 class BaseScraper(ABC):
@@ -24,9 +67,25 @@ class BaseScraper(ABC):
         self.base_url = base_url
         self.logger = get_logger(f"scraper.{source_name}")
         self.ua = UserAgent()
-        self.session = requests.Session()
+        self.http = get_http_client()
+        self.rate_limiter = get_rate_limiter()
         self.rate_limit_delay = settings.rate_limit_delay_seconds
-        self._last_request_time = 0
+        self.page_concurrency = settings.max_concurrent_pages_per_source
+        self.parser_backend = settings.html_parser_backend
+        # Process pool for CPU-bound parsing, assigned by ScrapeManager
+        self.parse_executor: Optional[Executor] = None
+        self.http_cache = get_http_cache()
+        # When False, a 304 returns the cached body so the page is re-parsed
+        self.skip_unchanged_pages = True
+        # Fingerprints from the previous run (url -> hash), set by the caller
+        self.known_fingerprints: Dict[str, str] = {}
+        self.metrics = {
+            "pages_fetched": 0,
+            "pages_unchanged": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "bytes_saved": 0,
+        }
 
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers with random user agent."""
@@ -37,57 +96,118 @@ class BaseScraper(ABC):
             "Connection": "keep-alive",
         }
 
-    async def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        current_time = asyncio.get_event_loop().time()
-        time_since_last = current_time - self._last_request_time
+    def _rate_limit(self, url: str):
+        """Wait for a request slot on the URL's host.
 
-        if time_since_last < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last)
-
-        self._last_request_time = asyncio.get_event_loop().time()
+        Used as ``async with self._rate_limit(url):`` around a request. The
+        per-host budget is shared with every other scraper in the process.
+        """
+        rate = 1 / self.rate_limit_delay if self.rate_limit_delay > 0 else None
+        return self.rate_limiter.limit(url, rate)
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
     )
     async def fetch_page(self, url: str) -> Optional[str]:
-        """Fetch a page with rate limiting and retries."""
-        await self._rate_limit()
+        """Fetch a page with rate limiting and retries.
+
+        Returns None when the server answers 304 Not Modified for a cached
+        page, which tells ``scrape()`` to skip parsing it.
+        """
+        headers = self._get_headers()
+        # Cache file I/O and zlib run in a thread, off the event loop
+        cached = await asyncio.to_thread(self.http_cache.get, url) if self.http_cache else None
+        headers.update(HTTPCache.conditional_headers(cached))
 
         try:
             self.logger.info(f"Fetching: {url}")
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.session.get(
+            async with self._rate_limit(url):
+                response = await self.http.get(
                     url,
-                    headers=self._get_headers(),
+                    headers=headers,
                     timeout=settings.request_timeout_seconds,
-                ),
-            )
+                )
+
+            if cached and response.status_code == 304:
+                await asyncio.to_thread(self.http_cache.touch, url)
+                self.metrics["cache_hits"] += 1
+                self.metrics["bytes_saved"] += cached.get("size", 0)
+                self.logger.info(f"Not modified: {url}")
+                if self.skip_unchanged_pages:
+                    return None
+                return await asyncio.to_thread(self.http_cache.read_body, url)
+
             response.raise_for_status()
+            self.metrics["pages_fetched"] += 1
+            if self.http_cache:
+                self.metrics["cache_misses"] += 1
+                await asyncio.to_thread(
+                    self.http_cache.store,
+                    url,
+                    response.text,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
             return response.text
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.logger.error(f"Error fetching {url}: {e}")
             raise
 
-    def parse_html(self, html: str) -> BeautifulSoup:
-        """Parse HTML content."""
-        return BeautifulSoup(html, "lxml")
+    def parse_html(self, html: str) -> Union[LxmlNode, BeautifulSoup]:
+        """Parse HTML content with the scraper's parser backend.
+
+        The default ``lxml`` backend returns an ``LxmlNode`` that supports the
+        same ``find``/``find_all``/``text``/``get`` calls as BeautifulSoup.
+        """
+        return parse_document(html, self.parser_backend)
 
     @abstractmethod
     async def get_listing_urls(self) -> List[str]:
         """Get URLs of pages containing contract listings."""
         pass
 
-    @abstractmethod
+    def parse_listing(self, html: str) -> List[Dict[str, Any]]:
+        """Parse a listing page to extract contract data.
+
+        Scrapers implement this synchronous, self-contained version so that
+        parsing can run in a worker process (see ``parse_executor``).
+        """
+        raise NotImplementedError
+
     async def parse_listing_page(self, html: str) -> List[Dict[str, Any]]:
-        """Parse a listing page to extract contract data."""
-        pass
+        """Parse a listing page on the event loop."""
+        return self.parse_listing(html)
+
+    def _can_offload_parsing(self) -> bool:
+        """Check whether parsing can be sent to the process pool."""
+        return (
+            self.parse_executor is not None
+            and type(self).parse_listing is not BaseScraper.parse_listing
+            and type(self).parse_listing_page is BaseScraper.parse_listing_page
+        )
 
-    def create_contract_from_data(self, data: Dict[str, Any]) -> Contract:
-        """Create a Contract object from scraped data."""
-        contract = Contract(
+    async def _parse_page(self, html: str) -> List[Dict[str, Any]]:
+        """Parse a page in the process pool if available, else on the loop."""
+        if self._can_offload_parsing():
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self.parse_executor,
+                    parse_listing_in_worker,
+                    type(self).__module__,
+                    type(self).__qualname__,
+                    self.source_id,
+                    self.parser_backend,
+                    html,
+                )
+            except BrokenProcessPool as e:
+                self.logger.error(f"Parse worker pool failed, parsing in-process: {e}")
+                self.parse_executor = None
+        return await self.parse_listing_page(html)
+
+    def create_contract_from_data(self, data: Dict[str, Any]) -> ScrapedContract:
+        """Create a ScrapedContract record from scraped data."""
+        contract = ScrapedContract(
             external_id=data.get("external_id", ""),
             source_id=self.source_id,
             url=data.get("url", ""),
@@ -111,102 +231,187 @@ class BaseScraper(ABC):
             contact_name=data.get("contact_name"),
             contact_email=data.get("contact_email"),
             contact_phone=data.get("contact_phone"),
-            raw_data=json.dumps(data.get("raw_data", {})),
+            raw_data=data.get("raw_data", {}),
             last_scraped_at=datetime.utcnow(),
         )
+        contract.content_hash = contract.compute_content_hash()
         return contract
 
-    async def scrape(self) -> List[Contract]:
-        """Main scraping method."""
-        contracts = []
+    async def _scrape_page(self, url: str) -> Optional[PageBatch]:
+        """Fetch and parse a single listing page.
+
+        Returns None for pages that were skipped (not modified, unchanged
+        fingerprint) or failed.
+        """
+        try:
+            html = await self.fetch_page(url)
+            if not html:
+                return None
+
+            fingerprint = page_fingerprint(html)
+            if self.skip_unchanged_pages and self.known_fingerprints.get(url) == fingerprint:
+                self.metrics["pages_unchanged"] += 1
+                self.logger.info(f"Unchanged since last run: {url}")
+                return None
+
+            page_contracts = await self._parse_page(html)
+            contracts = [
+                self.create_contract_from_data(contract_data) for contract_data in page_contracts
+            ]
+            self.logger.info(f"Extracted {len(page_contracts)} contracts from {url}")
+            return PageBatch(url=url, contracts=contracts, fingerprint=fingerprint)
+        except Exception as e:
+            self.logger.error(f"Error processing {url}: {e}")
+            return None
+
+    async def scrape(self) -> AsyncIterator[PageBatch]:
+        """Main scraping method, yielding one batch of contracts per page.
+
+        Up to ``page_concurrency`` pages are in flight at once so network
+        latency overlaps with parsing. A new page is only started after a
+        finished one has been consumed, so a slow consumer holds back
+        fetching and memory stays bounded by the window size.
+        """
+        total = 0
+        pending = set()
 
         try:
             # Get listing URLs
             listing_urls = await self.get_listing_urls()
             self.logger.info(f"Found {len(listing_urls)} listing pages to scrape")
 
-            # Scrape each listing page
-            for url in listing_urls:
-                try:
-                    html = await self.fetch_page(url)
-                    if html:
-                        page_contracts = await self.parse_listing_page(html)
-                        for contract_data in page_contracts:
-                            contract = self.create_contract_from_data(contract_data)
-                            contracts.append(contract)
-                        self.logger.info(
-                            f"Extracted {len(page_contracts)} contracts from {url}"
-                        )
-                except Exception as e:
-                    self.logger.error(f"Error processing {url}: {e}")
-                    continue
-
-            self.logger.info(f"Total contracts scraped: {len(contracts)}")
-            return contracts
+            remaining = iter(listing_urls)
+            window = max(1, self.page_concurrency)
+
+            def fill_window():
+                for url in islice(remaining, window - len(pending)):
+                    pending.add(asyncio.ensure_future(self._scrape_page(url)))
+
+            fill_window()
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.discard(task)
+                    batch = task.result()
+                    if batch is not None:
+                        total += len(batch.contracts)
+                        yield batch
+                fill_window()
+
+            self.logger.info(f"Total contracts scraped: {total}")
 
         except Exception as e:
             self.logger.error(f"Scraping failed: {e}")
             raise
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def scrape_all(self) -> List[ScrapedContract]:
+        """Scrape every page and return all contracts in one list."""
+        contracts = []
+        async for batch in self.scrape():
+            contracts.extend(batch.contracts)
+        return contracts
 
 
 class PlaywrightScraper(BaseScraper):
     """Scraper for JavaScript-heavy websites using Playwright."""
 
+    # Request types aborted during page loads (Playwright resource types)
+    blocked_resource_types = frozenset({"image", "media", "font", "stylesheet"})
+    # Third-party hosts whose scripts we never need (analytics, tag managers)
+    blocked_url_patterns = (
+        "google-analytics.com",
+        "googletagmanager.com",
+        "doubleclick.net",
+        "dap.digitalgov.gov",
+        "newrelic.com",
+        "nr-data.net",
+    )
+    block_resources = True
+
+    # CSS selector that signals the listing has rendered. When None, the page
+    # waits for network idle instead.
+    wait_for_selector: Optional[str] = None
+    selector_timeout_seconds = 10
+
     def __init__(self, source_id: int, source_name: str, base_url: str):
         """Initialize the Playwright scraper."""
         super().__init__(source_id, source_name, base_url)
-        self.browser = None
+        self.browser_pool = get_browser_pool()
         self.context = None
 
     async def init_browser(self):
-        """Initialize Playwright browser."""
-        from playwright.async_api import async_playwright
-
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=True)
-        self.context = await self.browser.new_context(
+        """Lease an isolated browser context from the shared pool."""
+        self.context = await self.browser_pool.new_context(
             user_agent=self.ua.random,
             viewport={"width": 1920, "height": 1080},
         )
+        if self.block_resources:
+            await self.context.route("**/*", self._route_request)
+
+    async def _route_request(self, route):
+        """Abort requests for resources the parser never looks at."""
+        request = route.request
+        if request.resource_type in self.blocked_resource_types or any(
+            pattern in request.url for pattern in self.blocked_url_patterns
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _wait_for_listing(self, page, url: str):
+        """Wait until the listing is rendered using the scraper's strategy."""
+        if not self.wait_for_selector:
+            await page.wait_for_load_state("networkidle")
+            return
+
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        try:
+            await page.wait_for_selector(
+                self.wait_for_selector,
+                state="attached",
+                timeout=self.selector_timeout_seconds * 1000,
+            )
+        except PlaywrightTimeoutError:
+            # Empty result pages never render the listing; parse what we have
+            self.logger.warning(f"Selector {self.wait_for_selector!r} not found on {url}")
 
     async def close_browser(self):
-        """Close Playwright browser."""
+        """Return the browser context to the shared pool."""
         if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if hasattr(self, "playwright"):
-            await self.playwright.stop()
+            await self.browser_pool.release_context(self.context)
+            self.context = None
 
     async def fetch_page(self, url: str) -> Optional[str]:
         """Fetch a page using Playwright."""
-        await self._rate_limit()
-
-        if not self.browser:
+        if not self.context:
             await self.init_browser()
 
         try:
             self.logger.info(f"Fetching (JS): {url}")
-            page = await self.context.new_page()
-            await page.goto(url, timeout=settings.request_timeout_seconds * 1000)
-            await page.wait_for_load_state("networkidle")
-
-            # Give time for any JavaScript to finish
-            await asyncio.sleep(1)
-
-            content = await page.content()
-            await page.close()
+            async with self._rate_limit(url), self.browser_pool.page(self.context) as page:
+                await page.goto(
+                    url,
+                    wait_until="domcontentloaded" if self.wait_for_selector else "load",
+                    timeout=settings.request_timeout_seconds * 1000,
+                )
+                await self._wait_for_listing(page, url)
+                content = await page.content()
+            self.metrics["pages_fetched"] += 1
             return content
 
         except Exception as e:
             self.logger.error(f"Error fetching {url}: {e}")
             raise
 
-    async def scrape(self) -> List[Contract]:
-        """Main scraping method with browser lifecycle management."""
+    async def scrape(self) -> AsyncIterator[PageBatch]:
+        """Main scraping method with browser context lifecycle management."""
         try:
             await self.init_browser()
-            contracts = await super().scrape()
-            return contracts
+            async for batch in super().scrape():
+                yield batch
         finally:
             await self.close_browser()
@@ -0,0 +1,145 @@
+"""Long-lived Playwright browser pool shared by JavaScript scrapers."""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from src.config import settings
+from src.utils.logger import get_logger
+
+logger = get_logger("browser_pool")
+
+
+class BrowserPool:
+    """Process-wide headless Chromium that hands out isolated contexts.
+
+    The browser is launched on first use and kept alive between scrapes.
+    Each scraper leases its own context (separate cookies and storage) and
+    opens pages through ``page()``, which caps the number of open pages.
+    After ``recycle_after`` navigations the browser is relaunched at the next
+    point where no context is leased, to bound Chromium's memory growth.
+    """
+
+    def __init__(self, max_pages: int = 8, recycle_after: int = 200, headless: bool = True):
+        """Initialize the pool (the browser is launched lazily)."""
+        self.max_pages = max(1, max_pages)
+        self.recycle_after = recycle_after
+        self.headless = headless
+        self.navigations = 0
+        self._playwright = None
+        self._browser = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._page_slots: Optional[asyncio.Semaphore] = None
+        self._leased_contexts = 0
+
+    @property
+    def is_healthy(self) -> bool:
+        """Check whether the browser is running and connected."""
+        return self._browser is not None and self._browser.is_connected()
+
+    def _bind_loop(self):
+        """Reset loop-bound state if a different event loop is running."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Playwright objects from another loop cannot be reused or closed
+            self._playwright = None
+            self._browser = None
+            self._leased_contexts = 0
+            self._lock = asyncio.Lock()
+            self._page_slots = asyncio.Semaphore(self.max_pages)
+            self._loop = loop
+
+    async def _launch(self):
+        """Start Playwright and launch Chromium."""
+        from playwright.async_api import async_playwright
+
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        self.navigations = 0
+        logger.info("Launched pooled Chromium browser")
+
+    async def _close_browser(self):
+        """Close the browser, ignoring errors from an already dead process."""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser: {e}")
+            self._browser = None
+
+    async def _ensure_browser(self):
+        """Launch, health-check or recycle the browser as needed."""
+        self._bind_loop()
+        async with self._lock:
+            if self._browser is not None and not self._browser.is_connected():
+                logger.warning("Pooled browser disconnected, relaunching")
+                self._browser = None
+            elif (
+                self._browser is not None
+                and self.recycle_after
+                and self.navigations >= self.recycle_after
+                and self._leased_contexts == 0
+            ):
+                logger.info(f"Recycling browser after {self.navigations} navigations")
+                await self._close_browser()
+
+            if self._browser is None:
+                await self._launch()
+
+    async def new_context(self, **options):
+        """Lease a new isolated browser context."""
+        await self._ensure_browser()
+        context = await self._browser.new_context(**options)
+        self._leased_contexts += 1
+        return context
+
+    async def release_context(self, context):
+        """Close a leased context and return it to the pool."""
+        self._leased_contexts = max(0, self._leased_contexts - 1)
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser context: {e}")
+
+    @asynccontextmanager
+    async def page(self, context):
+        """Open a page in a leased context, waiting for a free page slot."""
+        self._bind_loop()
+        async with self._page_slots:
+            page = await context.new_page()
+            self.navigations += 1
+            try:
+                yield page
+            finally:
+                await page.close()
+
+    async def close(self):
+        """Shut down the browser and Playwright."""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        await self._close_browser()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        self._leased_contexts = 0
+
+
+_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get the process-wide browser pool."""
+    global _pool
+    if _pool is None:
+        _pool = BrowserPool(
+            max_pages=settings.browser_pool_max_pages,
+            recycle_after=settings.browser_recycle_after_navigations,
+        )
+    return _pool
+
+
+async def close_browser_pool():
+    """Close the process-wide browser pool, if it was created."""
+    if _pool is not None:
+        await _pool.close()
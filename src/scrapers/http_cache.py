@@ -0,0 +1,193 @@
+"""On-disk HTTP response cache used for conditional GET requests."""
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.config import settings
+from src.utils.logger import get_logger
+
+logger = get_logger("http_cache")
+
+
+class HTTPCache:
+    """Compressed response bodies plus ETag/Last-Modified validators, keyed by URL.
+
+    Each entry is two files under ``directory``: ``<key>.body`` (zlib) and
+    ``<key>.json`` (validators and size). The metadata file is written last,
+    so an entry only exists once its body is complete. Entries older than
+    ``ttl_seconds`` are ignored and removed; when the cache grows past
+    ``max_bytes`` the least recently validated entries are evicted.
+    """
+
+    def __init__(self, directory: Path, ttl_seconds: float, max_bytes: int):
+        """Initialize the cache directory."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    def _paths(self, url: str):
+        """Get the (metadata, body) paths for a URL."""
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        """Write a file via a temporary file and rename."""
+        tmp_path = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def get(self, url: str) -> Optional[dict]:
+        """Get the metadata for a fresh cache entry, if any."""
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - meta.get("validated_at", 0) > self.ttl_seconds:
+            self._remove(meta_path, body_path, meta.get("stored_bytes", 0))
+            return None
+        return meta
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Get conditional request headers for a cached URL."""
+        return self.conditional_headers(self.get(url))
+
+    @staticmethod
+    def conditional_headers(meta: Optional[dict]) -> Dict[str, str]:
+        """Get conditional request headers from an entry's metadata."""
+        if not meta:
+            return {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def read_body(self, url: str) -> Optional[str]:
+        """Read the cached body for a URL."""
+        _, body_path = self._paths(url)
+        try:
+            return zlib.decompress(body_path.read_bytes()).decode("utf-8")
+        except (OSError, zlib.error):
+            return None
+
+    def store(
+        self,
+        url: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """Store a response body and its validators."""
+        if not etag and not last_modified:
+            return
+
+        meta_path, body_path = self._paths(url)
+        replaced_bytes = self._stored_bytes(meta_path)
+        compressed = zlib.compress(body.encode("utf-8"), 6)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "size": len(body),
+            "stored_bytes": len(compressed),
+            "validated_at": time.time(),
+        }
+        try:
+            self._write_atomic(body_path, compressed)
+            self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Could not cache {url}: {e}")
+            return
+
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += len(compressed) - replaced_bytes
+        self._evict_if_needed()
+
+    def touch(self, url: str):
+        """Mark a cached entry as revalidated (after a 304 response)."""
+        meta_path, _ = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text())
+            meta["validated_at"] = time.time()
+            self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def _stored_bytes(meta_path: Path) -> int:
+        """Get the compressed size of an existing entry (0 if there is none)."""
+        try:
+            return json.loads(meta_path.read_text()).get("stored_bytes", 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _remove(self, meta_path: Path, body_path: Path, stored_bytes: int = 0):
+        """Remove an entry's files."""
+        for path in (meta_path, body_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes -= stored_bytes
+
+    def _entries(self):
+        """List (validated_at, stored_bytes, meta_path) for all entries."""
+        entries = []
+        for meta_path in self.directory.glob("*.json"):
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (OSError, ValueError):
+                continue
+            entries.append((meta.get("validated_at", 0), meta.get("stored_bytes", 0), meta_path))
+        return entries
+
+    def _evict_if_needed(self):
+        """Drop expired entries, then the oldest ones until under max_bytes."""
+        with self._lock:
+            if self._total_bytes is not None and self._total_bytes <= self.max_bytes:
+                return
+
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            cutoff = time.time() - self.ttl_seconds
+
+            for validated_at, size, meta_path in sorted(entries):
+                if total <= self.max_bytes and validated_at >= cutoff:
+                    break
+                self._remove(meta_path, meta_path.with_suffix(".body"))
+                total -= size
+
+            self._total_bytes = total
+
+
+_cache: Optional[HTTPCache] = None
+
+
+def get_http_cache() -> Optional[HTTPCache]:
+    """Get the process-wide HTTP cache, or None when caching is disabled."""
+    global _cache
+    if not settings.http_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = HTTPCache(
+            settings.data_dir / "http_cache",
+            ttl_seconds=settings.http_cache_ttl_hours * 3600,
+            max_bytes=settings.http_cache_max_mb * 1024 * 1024,
+        )
+    return _cache
@@ -0,0 +1,123 @@
+"""Shared async HTTP client with pooled connections for scrapers."""
+import asyncio
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.config import settings
+from src.utils.logger import get_logger
+
+logger = get_logger("http_client")
+
+
+def _http2_available() -> bool:
+    """Check whether the optional h2 package is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HTTPClientPool:
+    """Process-wide pooled HTTP client with per-host connection limits.
+
+    httpx pools connections across all hosts, so the per-host cap is enforced
+    here with one semaphore per host. The underlying client is bound to the
+    event loop that created it and is rebuilt if a different loop is running.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_connections_per_host: int = 6,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        timeout: float = 30.0,
+    ):
+        """Initialize the pool (the client itself is created lazily)."""
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2 and _http2_available()
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the client for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            # A client left over from a closed loop cannot be closed cleanly,
+            # so it is simply dropped along with its connections.
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                http2=self.http2,
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
+            self._loop = loop
+            self._host_limits = {}
+            logger.debug(f"Created HTTP client (http2={self.http2})")
+        return self._client
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        """Get the connection semaphore for the host of a URL."""
+        host = urlsplit(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return self._host_limits[host]
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request through the shared client."""
+        client = self._get_client()
+        async with self._host_limit(url):
+            return await client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """Send a GET request through the shared client."""
+        return await self.request("GET", url, **kwargs)
+
+    async def aclose(self):
+        """Close the client and release pooled connections."""
+        client, loop = self._client, self._loop
+        self._client = None
+        self._loop = None
+        self._host_limits = {}
+
+        if client is not None and not client.is_closed:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                await client.aclose()
+
+
+_pool: Optional[HTTPClientPool] = None
+
+
+def get_http_client() -> HTTPClientPool:
+    """Get the process-wide HTTP client pool."""
+    global _pool
+    if _pool is None:
+        _pool = HTTPClientPool(
+            max_connections=settings.http_max_connections,
+            max_connections_per_host=settings.http_max_connections_per_host,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+            http2=settings.http2_enabled,
+            timeout=settings.request_timeout_seconds,
+        )
+    return _pool
+
+
+async def close_http_client():
+    """Close the process-wide HTTP client pool, if it was created."""
+    if _pool is not None:
+        await _pool.aclose()
@@ -0,0 +1,118 @@
+"""Pluggable HTML parser backends for listing pages."""
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+
+from src.utils.logger import get_logger
+
+logger = get_logger("parsing")
+
+PARSER_BACKENDS = ("lxml", "bs4")
+
+
+def _xpath_literal(value: str) -> str:
+    """Quote a string for use in an XPath expression."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+@lru_cache(maxsize=1024)
+def _compile(name: Optional[str], attrs: Tuple[Tuple[str, Any], ...], first: bool):
+    """Compile (and cache) the XPath for a find/find_all call."""
+    predicates = []
+    for key, value in attrs:
+        if key == "class":
+            predicates.append(
+                "contains(concat(' ', normalize-space(@class), ' '), "
+                f"{_xpath_literal(f' {value} ')})"
+            )
+        elif value is True:
+            predicates.append(f"@{key}")
+        else:
+            predicates.append(f"@{key}={_xpath_literal(str(value))}")
+
+    path = f"descendant::{name or '*'}" + "".join(f"[{p}]" for p in predicates)
+    if first:
+        path = f"({path})[1]"
+    return etree.XPath(path)
+
+
+class LxmlNode:
+    """Thin wrapper giving an lxml element the BeautifulSoup calls scrapers use.
+
+    Supports ``find``/``find_all`` with a tag name, an ``attrs`` dict,
+    ``class_`` and attribute keyword arguments, plus ``.text``, ``.name``
+    and ``.get()``. Each distinct selector is compiled to XPath once and
+    cached, which is where the speedup over BeautifulSoup comes from.
+    """
+
+    __slots__ = ("element",)
+
+    def __init__(self, element):
+        """Wrap an lxml element."""
+        self.element = element
+
+    @staticmethod
+    def _selector(
+        name: Optional[str],
+        attrs: Union[Dict[str, Any], str, None],
+        class_: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Tuple[str, Any], ...]:
+        """Normalize BeautifulSoup-style filters to a hashable selector."""
+        selector = {}
+        if isinstance(attrs, str):
+            selector["class"] = attrs
+        elif attrs:
+            selector.update(attrs)
+        if class_ is not None:
+            selector["class"] = class_
+        selector.update(kwargs)
+        return tuple(sorted(selector.items()))
+
+    def find(self, name=None, attrs=None, class_=None, **kwargs) -> Optional["LxmlNode"]:
+        """Find the first matching descendant."""
+        xpath = _compile(name, self._selector(name, attrs, class_, kwargs), True)
+        matches = xpath(self.element)
+        return LxmlNode(matches[0]) if matches else None
+
+    def find_all(self, name=None, attrs=None, class_=None, **kwargs) -> List["LxmlNode"]:
+        """Find all matching descendants in document order."""
+        xpath = _compile(name, self._selector(name, attrs, class_, kwargs), False)
+        return [LxmlNode(element) for element in xpath(self.element)]
+
+    @property
+    def name(self) -> str:
+        """Tag name of the element."""
+        return self.element.tag
+
+    @property
+    def text(self) -> str:
+        """All text inside the element."""
+        return self.element.text_content()
+
+    def get(self, key: str, default=None):
+        """Get an attribute value (``class`` is returned as a list, like bs4)."""
+        value = self.element.get(key)
+        if value is None:
+            return default
+        if key == "class":
+            return value.split()
+        return value
+
+
+def parse_document(html: str, backend: str = "lxml") -> Union[LxmlNode, BeautifulSoup]:
+    """Parse HTML with the requested backend, falling back to BeautifulSoup."""
+    if backend == "lxml":
+        try:
+            return LxmlNode(lxml_html.document_fromstring(html))
+        except (etree.ParserError, ValueError) as e:
+            logger.debug(f"lxml fast path failed, falling back to BeautifulSoup: {e}")
+    return BeautifulSoup(html, "lxml")
@@ -0,0 +1,179 @@
+"""Per-host token-bucket rate limiting shared by all scrapers."""
+import asyncio
+import sqlite3
+import threading
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from src.config import settings
+from src.utils.logger import get_logger
+
+logger = get_logger("rate_limiter")
+
+
+def host_for(url: str) -> str:
+    """Get the rate-limit key (host) for a URL."""
+    return urlsplit(url).netloc or url
+
+
+class TokenBucket:
+    """Token bucket refilled at a steady rate, allowing bursts up to capacity.
+
+    Tokens may go negative: a caller that finds the bucket empty still takes a
+    token and is told how long to wait, which reserves its place in line.
+    """
+
+    def __init__(self, rate: float, capacity: float, now: Optional[float] = None):
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic() if now is None else now
+
+    def reserve(self, now: Optional[float] = None) -> float:
+        """Take one token and return the seconds to wait before using it."""
+        now = time.monotonic() if now is None else now
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class HostRateLimiter:
+    """In-process rate limiter with one token bucket per host.
+
+    Every scraper in the process shares the same buckets, so two sources that
+    hit one host draw from a single budget. When sources ask for different
+    rates for the same host, the slowest rate wins.
+    """
+
+    def __init__(self, burst: int = 3, max_concurrency: int = 4):
+        """Initialize the limiter."""
+        self.burst = max(1, burst)
+        self.max_concurrency = max(1, max_concurrency)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _reserve(self, host: str, rate: float) -> float:
+        """Reserve a token for a host and return the wait in seconds."""
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(rate, self.burst)
+                self._buckets[host] = bucket
+            elif rate < bucket.rate:
+                bucket.rate = rate
+            return bucket.reserve()
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        """Get the concurrency semaphore for a host on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphores = {}
+            self._loop = loop
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[host]
+
+    @asynccontextmanager
+    async def limit(self, url: str, rate: Optional[float]):
+        """Wait for a request slot on the URL's host and hold it while in use.
+
+        ``rate`` is in requests per second; ``None`` or a non-positive value
+        only applies the concurrency cap.
+        """
+        host = host_for(url)
+        async with self._semaphore(host):
+            if rate and rate > 0:
+                wait = self._reserve(host, rate)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            yield
+
+
+class SQLiteRateLimiter(HostRateLimiter):
+    """Rate limiter whose buckets live in a local SQLite file.
+
+    Lets several scraper processes on one machine share a single budget per
+    host. The concurrency cap is still enforced per process.
+    """
+
+    def __init__(self, path: Path, burst: int = 3, max_concurrency: int = 4):
+        """Initialize the limiter and create the bucket table."""
+        super().__init__(burst=burst, max_concurrency=max_concurrency)
+        self.path = Path(path)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_buckets ("
+                "host TEXT PRIMARY KEY, rate REAL NOT NULL, capacity REAL NOT NULL, "
+                "tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the shared bucket database."""
+        return sqlite3.connect(str(self.path), timeout=10, isolation_level=None)
+
+    def _reserve(self, host: str, rate: float) -> float:
+        """Reserve a token in a write transaction shared across processes."""
+        # Wall-clock time, since monotonic clocks differ between processes
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT rate, capacity, tokens, updated_at FROM rate_buckets WHERE host = ?",
+                (host,),
+            ).fetchone()
+
+            if row is None:
+                bucket = TokenBucket(rate, self.burst, now=now)
+            else:
+                bucket = TokenBucket(min(rate, row[0]), row[1], now=row[3])
+                bucket.tokens = row[2]
+
+            wait = bucket.reserve(now)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_buckets "
+                "(host, rate, capacity, tokens, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (host, bucket.rate, bucket.capacity, bucket.tokens, bucket.updated_at),
+            )
+            conn.execute("COMMIT")
+            return wait
+        except sqlite3.Error as e:
+            logger.error(f"Shared rate limiter unavailable, using local bucket: {e}")
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            return super()._reserve(host, rate)
+        finally:
+            conn.close()
+
+
+_limiter: Optional[HostRateLimiter] = None
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Get the process-wide rate limiter configured in settings."""
+    global _limiter
+    if _limiter is None:
+        if settings.rate_limit_backend == "sqlite":
+            _limiter = SQLiteRateLimiter(
+                settings.data_dir / "rate_limits.db",
+                burst=settings.rate_limit_burst,
+                max_concurrency=settings.rate_limit_max_concurrency_per_host,
+            )
+        else:
+            _limiter = HostRateLimiter(
+                burst=settings.rate_limit_burst,
+                max_concurrency=settings.rate_limit_max_concurrency_per_host,
+            )
+    return _limiter
@@ -21,6 +21,10 @@ class SAMGovScraper(PlaywrightScraper):
     In production, you should use the official API at https://api.sam.gov/opportunities/v2
     """
 
+    wait_for_selector = (
+        "div.opportunity-card, div[data-testid='opportunity-result'], article.opportunity"
+    )
+
     def __init__(self, source_id: int):
         """Initialize SAM.gov scraper."""
         super().__init__(
@@ -49,11 +53,6 @@ class SAMGovScraper(PlaywrightScraper):
 
         Note: In production, you need an API key from SAM.gov.
         """
-        import json
-        import aiohttp
-
-        await self._rate_limit()
-
         headers = {
             "X-Api-Key": "YOUR_SAM_GOV_API_KEY",  # Replace with actual API key
             "Accept": "application/json",
@@ -61,18 +60,18 @@ class SAMGovScraper(PlaywrightScraper):
 
         try:
             self.logger.info(f"Fetching API: {url}")
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=30) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        self.logger.error(f"API error: {response.status}")
-                        return {"opportunitiesData": []}
+            async with self._rate_limit(url):
+                response = await self.http.get(url, headers=headers, timeout=30)
+            if response.status_code == 200:
+                return response.json()
+            else:
+                self.logger.error(f"API error: {response.status_code}")
+                return {"opportunitiesData": []}
         except Exception as e:
             self.logger.error(f"Error fetching API data: {e}")
             return {"opportunitiesData": []}
 
-    async def parse_listing_page(self, html: str) -> List[Dict[str, Any]]:
+    def parse_listing(self, html: str) -> List[Dict[str, Any]]:
         """Parse SAM.gov opportunity listing.
 
         This demonstrates parsing logic for SAM.gov's HTML structure.
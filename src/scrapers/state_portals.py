@@ -17,6 +17,8 @@ from src.utils.helpers import (
 class CaliforniaScraper(PlaywrightScraper):
     """Scraper for California State Contracts Register (Cal eProcure)."""
 
+    wait_for_selector = "#BidSearchResults, table.bid-list"
+
     def __init__(self, source_id: int):
         """Initialize California scraper."""
         super().__init__(
@@ -34,7 +36,7 @@ class CaliforniaScraper(PlaywrightScraper):
         ]
         return urls
 
-    async def parse_listing_page(self, html: str) -> List[Dict[str, Any]]:
+    def parse_listing(self, html: str) -> List[Dict[str, Any]]:
         """Parse California procurement listing page."""
         contracts = []
         soup = self.parse_html(html)
@@ -135,7 +137,7 @@ class TexasScraper(BaseScraper):
         ]
         return urls
 
-    async def parse_listing_page(self, html: str) -> List[Dict[str, Any]]:
+    def parse_listing(self, html: str) -> List[Dict[str, Any]]:
         """Parse Texas ESBD listing page."""
         contracts = []
         soup = self.parse_html(html)
@@ -226,6 +228,8 @@ class TexasScraper(BaseScraper):
 class NewYorkScraper(PlaywrightScraper):
     """Scraper for New York State Contract Reporter."""
 
+    wait_for_selector = "div.advertisement, div.contract-listing"
+
     def __init__(self, source_id: int):
         """Initialize New York scraper."""
         super().__init__(
@@ -243,7 +247,7 @@ class NewYorkScraper(PlaywrightScraper):
         ]
         return urls
 
-    async def parse_listing_page(self, html: str) -> List[Dict[str, Any]]:
+    def parse_listing(self, html: str) -> List[Dict[str, Any]]:
         """Parse New York Contract Reporter listing page."""
         contracts = []
         soup = self.parse_html(html)
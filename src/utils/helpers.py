@@ -1,7 +1,9 @@
 """Helper functions for data processing."""
+import enum
+import hashlib
 import re
 from datetime import datetime
-from typing import Optional
+from typing import Any, Iterable, Optional
 from dateutil import parser as date_parser
 
 
@@ -81,3 +83,52 @@ def generate_external_id(source_name: str, *identifiers) -> str:
     """Generate a unique external ID for a contract."""
     parts = [source_name] + [str(id_part) for id_part in identifiers if id_part]
     return "_".join(parts)
+
+
+# Markup that changes between requests without the listing changing
+_VOLATILE_PATTERNS = [
+    re.compile(r"<script\b.*?</script>", re.IGNORECASE | re.DOTALL),
+    re.compile(r"<style\b.*?</style>", re.IGNORECASE | re.DOTALL),
+    re.compile(r"<!--.*?-->", re.DOTALL),
+    # Hidden form state: ASP.NET __VIEWSTATE/__EVENTVALIDATION, CSRF tokens
+    re.compile(r"<input\b[^>]*\btype=[\"']?hidden\b[^>]*>", re.IGNORECASE),
+    re.compile(r"\b(?:nonce|csrf[\w-]*|data-token)=(?:\"[^\"]*\"|'[^']*')", re.IGNORECASE),
+    # Cache-busting query parameters and full ISO timestamps (with seconds)
+    re.compile(r"[?&](?:_|v|ts|t)=\d+"),
+    re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?"),
+]
+
+
+def page_fingerprint(html: str) -> str:
+    """Hash a page after stripping volatile markup.
+
+    Two fetches of an unchanged listing page produce the same fingerprint
+    even if the portal re-renders view state, nonces or timestamps.
+    """
+    for pattern in _VOLATILE_PATTERNS:
+        html = pattern.sub("", html)
+    normalized = " ".join(html.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _normalize_for_hash(value: Any) -> str:
+    """Normalize one field value for content hashing."""
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        value = value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, float):
+        return repr(round(value, 2))
+    return " ".join(str(value).split())
+
+
+def content_hash(values: Iterable[Any]) -> str:
+    """Hash an ordered sequence of field values.
+
+    Whitespace, enum wrappers and float noise are normalized away, so
+    re-scraping an unchanged record yields the same hash.
+    """
+    normalized = "\x1f".join(_normalize_for_hash(value) for value in values)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
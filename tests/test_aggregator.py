@@ -0,0 +1,239 @@
+"""Tests for ContractAggregator persistence."""
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.pool import StaticPool
+
+from src.models import Base, Contract, ContractStat, ContractStatus, DataSource, ScrapedContract
+from src.models.database import upgrade_schema
+from src.processors.aggregator import INSERT_COLUMNS, ContractAggregator
+from src.processors.stats import StatsRollup
+
+
+@pytest.fixture
+def source(db):
+    source = DataSource(name="Test", base_url="https://a.gov", scraper_class="TexasScraper")
+    db.add(source)
+    db.commit()
+    return source
+
+
+def make_contract(source, external_id, title="Road repair", **fields):
+    return Contract(
+        external_id=external_id,
+        source_id=source.id,
+        url=f"https://a.gov/{external_id}",
+        title=title,
+        status=fields.pop("status", ContractStatus.OPEN),
+        raw_data="{}",
+        **fields,
+    )
+
+
+@pytest.fixture(params=["bulk", "individual"])
+def aggregator(request, db, monkeypatch):
+    aggregator = ContractAggregator(db)
+    if request.param == "individual":
+        monkeypatch.setattr(aggregator, "_supports_bulk_upsert", lambda: False)
+    return aggregator
+
+
+class TestSaveBatch:
+    """Tests for save_batch on both the bulk upsert and per-row paths."""
+
+    def test_counts_new_updated_unchanged(self, aggregator, db, source):
+        first = aggregator.save_batch(
+            [make_contract(source, "a"), make_contract(source, "b"), make_contract(source, "c")],
+            source,
+        )
+        assert first == {"new": 3, "updated": 0, "unchanged": 0, "errors": 0}
+
+        second = aggregator.save_batch(
+            [
+                make_contract(source, "a"),
+                make_contract(source, "b", title="Bridge repair"),
+                make_contract(source, "d"),
+            ],
+            source,
+        )
+        assert second == {"new": 1, "updated": 1, "unchanged": 1, "errors": 0}
+
+        assert db.query(Contract).count() == 4
+        updated = db.query(Contract).filter(Contract.external_id == "b").one()
+        assert updated.title == "Bridge repair"
+        assert updated.created_at is not None
+
+    def test_detects_status_change(self, aggregator, db, source):
+        aggregator.save_batch([make_contract(source, "a")], source)
+        stats = aggregator.save_batch(
+            [make_contract(source, "a", status=ContractStatus.CLOSED)], source
+        )
+        assert stats["updated"] == 1
+        assert db.query(Contract).one().status == ContractStatus.CLOSED
+
+    def test_detects_naics_and_set_aside_change(self, aggregator, db, source):
+        aggregator.save_batch([make_contract(source, "a", naics_code="236220")], source)
+        stats = aggregator.save_batch(
+            [make_contract(source, "a", naics_code="237310", set_aside="SBA")], source
+        )
+        assert stats["updated"] == 1
+        assert db.query(Contract).one().naics_code == "237310"
+
+    def test_unchanged_rows_are_not_rewritten(self, aggregator, db, source):
+        aggregator.save_batch([make_contract(source, "a")], source)
+        before = db.query(Contract).one().updated_at
+        aggregator.save_batch([make_contract(source, "a", title=" Road  repair ")], source)
+        db.expire_all()
+        assert db.query(Contract).one().updated_at == before
+
+    def test_rows_without_hash_are_backfilled(self, aggregator, db, source):
+        aggregator.save_batch([make_contract(source, "a")], source)
+        db.execute(text("UPDATE contracts SET content_hash = NULL"))
+        db.commit()
+        assert aggregator.save_batch([make_contract(source, "a")], source)["updated"] == 1
+        assert aggregator.save_batch([make_contract(source, "a")], source)["unchanged"] == 1
+
+    def test_chunks_large_batches(self, aggregator, db, source, monkeypatch):
+        monkeypatch.setattr("src.processors.aggregator.settings.upsert_chunk_size", 7)
+        contracts = [make_contract(source, str(i)) for i in range(30)]
+        assert aggregator.save_batch(contracts, source)["new"] == 30
+        assert aggregator.save_batch(contracts, source)["unchanged"] == 30
+
+    def test_save_contracts_records_scrape(self, aggregator, source):
+        aggregator.save_contracts([make_contract(source, "a")], source)
+        assert source.total_scrapes == 1
+        assert source.total_contracts_found == 1
+
+    def test_saves_scraped_records(self, aggregator, db, source):
+        record = ScrapedContract(
+            external_id="a", source_id=source.id, url="https://a.gov/a", title="Road repair",
+            raw_data={"id": "a"},
+        )
+        assert aggregator.save_batch([record], source)["new"] == 1
+        assert aggregator.save_batch([record], source)["unchanged"] == 1
+
+        saved = db.query(Contract).one()
+        assert saved.raw_data == '{"id": "a"}'
+        assert saved.status == ContractStatus.UNKNOWN
+        assert saved.content_hash == record.compute_content_hash()
+
+
+class TestScrapedContract:
+    """Tests for the lightweight scraped contract record."""
+
+    def test_fields_match_contract_columns(self):
+        assert set(ScrapedContract.FIELDS) == set(INSERT_COLUMNS)
+
+    def test_rejects_unknown_fields(self):
+        with pytest.raises(TypeError):
+            ScrapedContract(titel="typo")
+
+    def test_hash_matches_orm_contract(self):
+        values = dict(external_id="a", source_id=1, url="u", title="Road", budget_max=5.0,
+                      status=ContractStatus.OPEN)
+        assert (
+            ScrapedContract(**values).compute_content_hash()
+            == Contract(**values).compute_content_hash()
+        )
+
+    def test_to_orm(self):
+        contract = ScrapedContract(external_id="a", source_id=1, url="u", title="Road").to_orm()
+        assert isinstance(contract, Contract)
+        assert contract.content_hash is not None
+
+
+class TestUpgradeSchema:
+    """Tests for adding new columns to existing databases."""
+
+    def test_adds_missing_column_and_index(self):
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX idx_contract_source_external_hash"))
+            conn.execute(text("ALTER TABLE contracts DROP COLUMN content_hash"))
+
+        upgrade_schema(engine)
+
+        inspector = inspect(engine)
+        assert "content_hash" in {c["name"] for c in inspector.get_columns("contracts")}
+        assert "idx_contract_source_external_hash" in {
+            i["name"] for i in inspector.get_indexes("contracts")
+        }
+        engine.dispose()
+
+
+class TestGetStatistics:
+    """Tests for get_statistics."""
+
+    def test_grouped_counts(self, aggregator, db, source):
+        other = DataSource(name="Other", base_url="https://b.gov", scraper_class="TexasScraper")
+        empty = DataSource(name="Empty", base_url="https://c.gov", scraper_class="TexasScraper")
+        db.add_all([other, empty])
+        db.commit()
+        aggregator.save_batch(
+            [
+                make_contract(source, "1", state="TX"),
+                make_contract(source, "2", state="TX", status=ContractStatus.CLOSED),
+                make_contract(source, "3", state=None, status=ContractStatus.AWARDED),
+                make_contract(other, "1", state="CA"),
+            ],
+            source,
+        )
+
+        stats = aggregator.get_statistics()
+        assert stats["total_contracts"] == 4
+        assert stats["open_contracts"] == 2
+        assert stats["closed_contracts"] == 1
+        assert stats["by_status"] == {"open": 2, "closed": 1, "awarded": 1}
+        assert stats["by_state"] == {"TX": 2, "CA": 1, "Unknown": 1}
+        assert stats["by_source"] == {"Test": 3, "Other": 1, "Empty": 0}
+
+    def test_updates_move_between_groups(self, aggregator, db, source):
+        aggregator.save_batch(
+            [make_contract(source, "1", state="TX"), make_contract(source, "2")], source
+        )
+        aggregator.save_batch(
+            [make_contract(source, "1", state="TX", status=ContractStatus.CLOSED)], source
+        )
+
+        stats = aggregator.get_statistics()
+        assert stats["by_status"] == {"open": 1, "closed": 1}
+        assert stats["by_state"] == {"TX": 1, "Unknown": 1}
+
+        incremental = {
+            (s.state, s.source_id, s.status, s.category): s.contract_count
+            for s in db.query(ContractStat).all()
+            if s.contract_count
+        }
+        StatsRollup(db).rebuild()
+        rebuilt = {
+            (s.state, s.source_id, s.status, s.category): s.contract_count
+            for s in db.query(ContractStat).all()
+        }
+        assert rebuilt == incremental
+
+    def test_state_change_keeps_stored_state(self, aggregator, db, source):
+        # state is not among the columns an update overwrites
+        aggregator.save_batch([make_contract(source, "1", state="California")], source)
+        aggregator.save_batch([make_contract(source, "1", state="CA", title="New")], source)
+
+        assert db.query(Contract.state).scalar() == "California"
+        assert aggregator.get_statistics()["by_state"] == {"California": 1}
+        StatsRollup(db).rebuild()
+        assert aggregator.get_statistics()["by_state"] == {"California": 1}
+
+    def test_builds_rollup_for_existing_contracts(self, db, source):
+        db.add_all([make_contract(source, "1", state="TX"), make_contract(source, "2", state="TX")])
+        db.commit()
+        assert db.query(ContractStat).count() == 0
+
+        stats = ContractAggregator(db).get_statistics()
+        assert stats["by_state"] == {"TX": 2}
+        assert db.query(ContractStat).count() == 1
+
+    def test_last_updated_tracks_rollup_changes(self, aggregator, db, source):
+        aggregator.save_batch([make_contract(source, "1")], source)
+        first = aggregator.get_statistics()["last_updated"]
+        assert aggregator.get_statistics()["last_updated"] == first
+
+        aggregator.save_batch([make_contract(source, "1", title="Changed")], source)
+        assert aggregator.get_statistics()["last_updated"] > first
@@ -0,0 +1,122 @@
+"""Tests for API rate limiting and batched usage accounting."""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from src.api.rate_limit import (
+    ApiRateLimiter,
+    SlidingWindow,
+    SQLiteApiRateLimiter,
+    UsageRecorder,
+)
+from src.models import Subscription, User
+
+DAY = 86400.0
+
+
+@pytest.fixture
+def subscription(db):
+    user = User(email="a@example.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    subscription = Subscription(user_id=user.id, api_calls_per_day=100)
+    db.add(subscription)
+    db.commit()
+    return subscription
+
+
+@pytest.fixture
+def recorder(db):
+    return UsageRecorder(sessionmaker(bind=db.get_bind()))
+
+
+class TestSlidingWindow:
+    """Tests for SlidingWindow."""
+
+    def test_allows_up_to_limit(self):
+        window = SlidingWindow(DAY, now=0.0)
+        assert [window.hit(3, now=float(i)) for i in range(4)] == [True, True, True, False]
+
+    def test_previous_window_fades_out(self):
+        window = SlidingWindow(DAY, now=0.0)
+        for _ in range(10):
+            window.hit(10, now=DAY - 1)
+        # A quarter into the next window, 75% of the previous count still applies
+        assert window.estimate(now=DAY * 1.25) == pytest.approx(7.5)
+        assert [window.hit(10, now=DAY * 1.25) for _ in range(3)] == [True, True, False]
+
+    def test_resets_after_two_windows(self):
+        window = SlidingWindow(DAY, now=0.0, current=10)
+        assert window.estimate(now=DAY * 2) == 0
+
+
+class TestApiRateLimiter:
+    """Tests for ApiRateLimiter."""
+
+    def test_keys_are_separate(self):
+        limiter = ApiRateLimiter()
+        assert limiter.hit(1, 1, now=0.0)
+        assert not limiter.hit(1, 1, now=1.0)
+        assert limiter.hit(2, 1, now=1.0)
+
+    def test_seeds_new_keys_with_stored_usage(self):
+        limiter = ApiRateLimiter()
+        assert limiter.hit(1, 100, used=99, now=0.0)
+        assert not limiter.hit(1, 100, used=99, now=1.0)
+
+    def test_sqlite_backend_shares_counters(self, tmp_path):
+        first = SQLiteApiRateLimiter(tmp_path / "limits.db")
+        second = SQLiteApiRateLimiter(tmp_path / "limits.db")
+        assert first.hit(1, 2, now=0.0)
+        assert second.hit(1, 2, now=1.0)
+        assert not first.hit(1, 2, now=2.0)
+
+
+class TestUsageRecorder:
+    """Tests for UsageRecorder."""
+
+    def test_flush_adds_buffered_calls(self, db, subscription, recorder):
+        now = datetime(2024, 5, 1, 12)
+        for i in range(3):
+            recorder.record(subscription.id, now + timedelta(seconds=i))
+        assert recorder.flush() == 3
+        assert recorder.flush() == 0
+
+        db.refresh(subscription)
+        assert subscription.total_api_calls == 3
+        assert subscription.api_calls_today == 3
+        assert subscription.last_api_call_at == now + timedelta(seconds=2)
+
+        recorder.record(subscription.id, now + timedelta(hours=1))
+        recorder.flush()
+        db.refresh(subscription)
+        assert (subscription.total_api_calls, subscription.api_calls_today) == (4, 4)
+
+    def test_daily_count_resets_on_new_day(self, db, subscription, recorder):
+        recorder.record(subscription.id, datetime(2024, 5, 1, 23, 59))
+        recorder.record(subscription.id, datetime(2024, 5, 1, 23, 59))
+        recorder.record(subscription.id, datetime(2024, 5, 2, 0, 1))
+        recorder.flush()
+
+        db.refresh(subscription)
+        assert subscription.total_api_calls == 3
+        assert subscription.api_calls_today == 1
+        assert subscription.last_api_call_at == datetime(2024, 5, 2, 0, 1)
+
+    def test_failed_flush_keeps_calls(self, db, subscription, recorder, monkeypatch):
+        recorder.record(subscription.id, datetime(2024, 5, 1))
+
+        def broken_session():
+            session = sessionmaker(bind=db.get_bind())()
+            monkeypatch.setattr(session, "execute", lambda *args, **kwargs: 1 / 0)
+            return session
+
+        good_factory = recorder.session_factory
+        recorder.session_factory = broken_session
+        assert recorder.flush() == 0
+
+        recorder.session_factory = good_factory
+        assert recorder.flush() == 1
+        db.refresh(subscription)
+        assert subscription.total_api_calls == 1
@@ -0,0 +1,120 @@
+"""Tests for authentication and the principal cache."""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from src.api import auth
+from src.api.auth import Principal, create_access_token, get_current_user
+from src.models import Base, Subscription, User
+from src.utils.cache import TTLCache
+
+
+@pytest.fixture(autouse=True)
+def principals(monkeypatch):
+    cache = TTLCache(ttl_seconds=60, max_entries=16)
+    monkeypatch.setattr(auth, "_principals", cache)
+    return cache
+
+
+@pytest.fixture
+def db(tmp_path):
+    """A sync session on a file database, so the async engine can share it."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'auth.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def async_engine(db, tmp_path):
+    # NullPool: every asyncio.run() below gets its own event loop and connection
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}", poolclass=NullPool)
+    yield engine
+    engine.sync_engine.dispose()
+
+
+@pytest.fixture
+def user(db):
+    user = User(email="a@example.com", hashed_password="x", api_key="daas_key")
+    db.add(user)
+    db.flush()
+    db.add(Subscription(user_id=user.id, api_calls_per_day=100, max_results_per_query=50))
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def queries(async_engine):
+    """Record the SQL statements run by get_current_user."""
+    statements = []
+    engine = async_engine.sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    yield statements
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+def authenticate(engine, api_key=None, token=None) -> Principal:
+    async def run():
+        async with AsyncSession(engine) as db:
+            return await get_current_user(token=token, api_key=api_key, db=db)
+
+    return asyncio.run(run())
+
+
+class TestGetCurrentUser:
+    """Tests for get_current_user with the principal cache."""
+
+    def test_api_key_principal_is_cached(self, db, async_engine, user, queries):
+        principal = authenticate(async_engine, api_key="daas_key")
+        assert (principal.id, principal.subscription.max_results_per_query) == (user.id, 50)
+        assert len(queries) == 1
+
+        assert authenticate(async_engine, api_key="daas_key") is principal
+        assert len(queries) == 1
+
+    def test_jwt_principal_is_cached(self, db, async_engine, user, queries):
+        token = create_access_token({"sub": user.email})
+        queries.clear()
+        principal = authenticate(async_engine, token=token)
+        assert authenticate(async_engine, token=token) is principal
+        assert len(queries) == 1
+
+    def test_unknown_credentials_are_not_cached(self, db, async_engine, user, principals):
+        with pytest.raises(HTTPException) as error:
+            authenticate(async_engine, api_key="wrong")
+        assert error.value.status_code == 401
+        assert len(principals) == 0
+
+    def test_subscription_change_invalidates(self, db, async_engine, user):
+        principal = authenticate(async_engine, api_key="daas_key")
+        assert principal.subscription.max_results_per_query == 50
+        user.subscription.max_results_per_query = 500
+        db.commit()
+        principal = authenticate(async_engine, api_key="daas_key")
+        assert principal.subscription.max_results_per_query == 500
+
+    def test_deactivated_user_is_rejected(self, db, async_engine, user):
+        token = create_access_token({"sub": user.email})
+        authenticate(async_engine, token=token)
+        user.is_active = False
+        db.commit()
+        with pytest.raises(HTTPException) as error:
+            authenticate(async_engine, token=token)
+        assert error.value.status_code == 403
+
+    def test_invalidates_again_after_commit(self, db, async_engine, user, principals):
+        authenticate(async_engine, api_key="daas_key")
+        user.is_admin = True
+        db.flush()
+        # Another request caches the row as it was before the commit
+        principals.set(("api_key", "stale"), Principal(User(id=user.id, email=user.email)))
+        db.commit()
+        assert len(principals) == 0
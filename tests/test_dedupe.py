@@ -0,0 +1,229 @@
+"""Tests for MinHash LSH duplicate detection."""
+from datetime import datetime
+from itertools import combinations
+
+import pytest
+
+from src.models import Contract, ContractDuplicate, ContractStatus, DataSource, ScrapedContract
+from src.processors.aggregator import ContractAggregator
+from src.processors.dedupe import (
+    DuplicateDetector,
+    DuplicateIndex,
+    MinHasher,
+    UnionFind,
+    description_shingles,
+    exclude_duplicates,
+    jaccard,
+    title_shingles,
+)
+
+
+@pytest.fixture
+def sources(db):
+    sources = [
+        DataSource(name=name, base_url=f"https://{name}.gov", scraper_class="TexasScraper")
+        for name in ("a", "b", "c")
+    ]
+    db.add_all(sources)
+    db.commit()
+    return sources
+
+
+def add_contract(db, source, external_id, title, **fields):
+    contract = Contract(
+        external_id=external_id,
+        source_id=source.id,
+        url=f"https://x.gov/{external_id}",
+        title=title,
+        status=ContractStatus.OPEN,
+        **fields,
+    )
+    db.add(contract)
+    db.commit()
+    return contract
+
+
+class TestShingles:
+    """Tests for shingling and similarity helpers."""
+
+    def test_title_shingles_ignore_case_and_punctuation(self):
+        assert title_shingles("Road Repair, Phase-2") == {"road", "repair", "phase", "2"}
+
+    def test_description_shingles_are_word_trigrams(self):
+        assert description_shingles("a b c d") == {"a b c", "b c d"}
+        assert description_shingles("a b") == {"a", "b"}
+
+    def test_jaccard(self):
+        assert jaccard({"a", "b"}, {"b", "c"}) == pytest.approx(1 / 3)
+        assert jaccard(set(), {"a"}) == 0.0
+
+
+class TestMinHasher:
+    """Tests for MinHash signatures and band keys."""
+
+    def test_signature_agreement_estimates_jaccard(self):
+        hasher = MinHasher(num_perm=256, bands=32)
+        first = {f"w{i}" for i in range(100)}
+        second = {f"w{i}" for i in range(50, 150)}
+        signatures = hasher.signatures([first, second])
+        estimate = (signatures[0] == signatures[1]).mean()
+        assert estimate == pytest.approx(jaccard(first, second), abs=0.1)
+
+    def test_signatures_are_stable(self):
+        shingles = [{"road", "repair"}, set(), {"bridge"}]
+        assert (MinHasher().signatures(shingles) == MinHasher().signatures(shingles)).all()
+
+    def test_identical_sets_share_every_band(self):
+        hasher = MinHasher(num_perm=64, bands=16)
+        keys = hasher.band_keys(hasher.signatures([{"a", "b", "c"}, {"c", "b", "a"}]))
+        assert keys.shape == (2, 16)
+        assert (keys[0] == keys[1]).all()
+
+    def test_bands_must_divide_permutations(self):
+        with pytest.raises(ValueError):
+            MinHasher(num_perm=64, bands=10)
+
+
+class TestDuplicateDetector:
+    """Tests for DuplicateDetector."""
+
+    def test_finds_cross_source_duplicate(self, db, sources):
+        a, b, _ = sources
+        first = add_contract(db, a, "1", "Highway 35 bridge deck repair project", agency="TxDOT")
+        second = add_contract(db, b, "2", "Highway 35 Bridge Deck Repair Project", agency="TxDOT")
+        add_contract(db, b, "3", "Janitorial services for state offices", agency="TxDOT")
+
+        assert DuplicateDetector(db).find_duplicates() == [(first.id, second.id)]
+
+    def test_ignores_same_source(self, db, sources):
+        a, _, _ = sources
+        add_contract(db, a, "1", "Highway 35 bridge deck repair", agency="TxDOT")
+        add_contract(db, a, "2", "Highway 35 bridge deck repair", agency="TxDOT")
+        assert DuplicateDetector(db).find_duplicates() == []
+
+    def test_requires_a_matching_heuristic(self, db, sources):
+        a, b, _ = sources
+        add_contract(db, a, "1", "Highway 35 bridge deck repair", agency="TxDOT")
+        add_contract(db, b, "2", "Highway 35 bridge deck repair", agency="Army")
+        assert DuplicateDetector(db).find_duplicates() == []
+
+    def test_matches_on_description(self, db, sources):
+        a, b, _ = sources
+        description = "Furnish and install traffic signals at twelve intersections in Travis County"
+        due = datetime(2030, 1, 1)
+        first = add_contract(db, a, "1", "RFP 2024-118", description=description, due_date=due)
+        second = add_contract(db, b, "2", "Signals", description=description, due_date=due)
+        assert DuplicateDetector(db).find_duplicates() == [(first.id, second.id)]
+
+    def test_streams_in_batches_and_matches_brute_force(self, db, sources):
+        a, b, _ = sources
+        words = ["road", "bridge", "repair", "paving", "signal", "county", "state", "phase"]
+        for i, combo in enumerate(combinations(words, 5)):
+            title = " ".join(combo)
+            add_contract(db, a if i % 2 else b, str(i), title, agency="TxDOT")
+
+        detector = DuplicateDetector(
+            db, batch_size=7, num_perm=64, bands=16, threshold=0.6, max_bucket_size=1000
+        )
+        rows = detector.load(range(1, 1000))
+        expected = sorted(
+            (x.id, y.id)
+            for x, y in combinations(rows.values(), 2)
+            if x.source_id != y.source_id and detector.is_duplicate(x, y)
+        )
+        found = detector.find_duplicates()
+        assert set(found) <= set(expected)
+        # LSH is probabilistic; with 16 bands of 4 rows recall at J=0.67 is ~0.97
+        assert len(found) >= 0.8 * len(expected)
+
+
+class TestUnionFind:
+    """Tests for UnionFind."""
+
+    def test_smallest_id_is_root(self):
+        forest = UnionFind()
+        forest.union(5, 3)
+        forest.union(9, 5)
+        forest.union(1, 7)
+        assert forest.find(9) == 3
+        assert forest.union(7, 9) == 1
+        assert {forest.find(i) for i in (1, 3, 5, 7, 9)} == {1}
+
+
+def scraped(source, external_id, title, agency="TxDOT"):
+    return ScrapedContract(
+        external_id=external_id, source_id=source.id, url=f"https://x.gov/{external_id}",
+        title=title, agency=agency,
+    )
+
+
+def clusters(db):
+    result = {}
+    for member in db.query(ContractDuplicate).all():
+        result.setdefault(member.cluster_id, set()).add(member.contract_id)
+    return result
+
+
+class TestDuplicateIndex:
+    """Tests for the incrementally maintained duplicate clusters."""
+
+    TITLE = "Highway 35 bridge deck repair project"
+
+    def test_saving_contracts_builds_clusters(self, db, sources):
+        a, b, c = sources
+        aggregator = ContractAggregator(db)
+        aggregator.save_batch([scraped(a, "1", self.TITLE), scraped(a, "2", "Janitorial services")], a)
+        assert clusters(db) == {}
+
+        aggregator.save_batch([scraped(b, "1", self.TITLE.upper())], b)
+        first, second = (
+            db.query(Contract.id).filter(Contract.title.ilike(self.TITLE)).order_by(Contract.id)
+        )
+        assert clusters(db) == {first.id: {first.id, second.id}}
+
+        aggregator.save_batch([scraped(c, "1", self.TITLE + ".")], c)
+        assert list(clusters(db)) == [first.id]
+        assert len(clusters(db)[first.id]) == 3
+        assert DuplicateIndex(db).cluster(second.id) == sorted(clusters(db)[first.id])
+
+    def test_merges_existing_clusters(self, db, sources):
+        a, b, c = sources
+        ids = [add_contract(db, source, "1", self.TITLE, agency="TxDOT").id for source in (a, b)]
+        ids += [add_contract(db, c, "1", "Road striping services", agency="TxDOT").id]
+        ids += [add_contract(db, a, "2", "Road striping services", agency="TxDOT").id]
+        index = DuplicateIndex(db)
+        index.add_contracts(ids)
+        db.commit()
+        assert clusters(db) == {ids[0]: {ids[0], ids[1]}, ids[2]: {ids[2], ids[3]}}
+
+        # A contract matching both clusters (by description) joins them
+        description = "Repair the Highway 35 bridge deck and restripe the approach roads"
+        for contract_id in (ids[1], ids[3]):
+            db.get(Contract, contract_id).description = description
+        bridge = add_contract(db, c, "2", "Misc", agency="TxDOT", description=description)
+        index.add_contracts([ids[1], ids[3], bridge.id])
+        db.commit()
+        assert clusters(db) == {ids[0]: set(ids) | {bridge.id}}
+
+    def test_rebuild_matches_incremental(self, db, sources):
+        a, b, c = sources
+        aggregator = ContractAggregator(db)
+        for source in sources:
+            aggregator.save_batch(
+                [scraped(source, str(i), f"{self.TITLE} lot {i}") for i in range(5)], source
+            )
+        incremental = clusters(db)
+        assert len(incremental) == 5
+
+        assert DuplicateIndex(db).rebuild() > 0
+        assert clusters(db) == incremental
+
+    def test_exclude_duplicates_keeps_canonical(self, db, sources):
+        a, b, _ = sources
+        aggregator = ContractAggregator(db)
+        aggregator.save_batch([scraped(a, "1", self.TITLE), scraped(a, "2", "Janitorial")], a)
+        aggregator.save_batch([scraped(b, "1", self.TITLE)], b)
+
+        collapsed = exclude_duplicates(db.query(Contract)).order_by(Contract.id).all()
+        assert [(c.source_id, c.external_id) for c in collapsed] == [(a.id, "1"), (a.id, "2")]
+        assert db.query(Contract).count() == 3
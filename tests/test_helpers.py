@@ -8,6 +8,8 @@ from src.utils.helpers import (
     extract_email,
     extract_phone,
     generate_external_id,
+    page_fingerprint,
+    content_hash,
 )
 
 
@@ -116,3 +118,48 @@ class TestGenerateExternalId:
     def test_skips_none_values(self):
         result = generate_external_id("source", "123", None, "456")
         assert result == "source_123_456"
+
+
+class TestPageFingerprint:
+    """Tests for page_fingerprint function."""
+
+    def test_same_content_same_fingerprint(self):
+        html = "<table><tr><td>Bid 1</td></tr></table>"
+        assert page_fingerprint(html) == page_fingerprint(html)
+
+    def test_ignores_viewstate_and_scripts(self):
+        first = (
+            '<input type="hidden" name="__VIEWSTATE" value="abc123">'
+            "<script>var t = 1;</script><td>Bid 1</td>"
+        )
+        second = (
+            '<input type="hidden" name="__VIEWSTATE" value="zzz999">'
+            "<script>var t = 2;</script><td>Bid 1</td>"
+        )
+        assert page_fingerprint(first) == page_fingerprint(second)
+
+    def test_ignores_render_timestamps(self):
+        first = "<span>Generated 2024-01-15T10:30:01Z</span><td>Bid 1</td>"
+        second = "<span>Generated 2024-01-15T11:45:59Z</span><td>Bid 1</td>"
+        assert page_fingerprint(first) == page_fingerprint(second)
+
+    def test_detects_listing_changes(self):
+        assert page_fingerprint("<td>Bid 1</td>") != page_fingerprint("<td>Bid 2</td>")
+
+
+class TestContentHash:
+    """Tests for content_hash function."""
+
+    def test_normalizes_whitespace_and_floats(self):
+        assert content_hash(["Road  repair ", 1000.0]) == content_hash(["Road repair", 1000.001])
+
+    def test_none_and_order_matter(self):
+        assert content_hash(["a", None]) != content_hash([None, "a"])
+        assert content_hash(["a", "b"]) != content_hash(["b", "a"])
+
+    def test_dates_and_enums(self):
+        from src.models import ContractStatus
+
+        due = datetime(2030, 1, 2)
+        assert content_hash([due, ContractStatus.OPEN]) == content_hash([due, ContractStatus.OPEN])
+        assert content_hash([due, ContractStatus.OPEN]) != content_hash([due, ContractStatus.CLOSED])
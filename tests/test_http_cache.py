@@ -0,0 +1,52 @@
+"""Tests for the on-disk HTTP response cache."""
+import time
+
+from src.scrapers.http_cache import HTTPCache
+
+
+def make_cache(tmp_path, ttl_seconds=3600, max_bytes=10 * 1024 * 1024):
+    return HTTPCache(tmp_path / "cache", ttl_seconds=ttl_seconds, max_bytes=max_bytes)
+
+
+class TestHTTPCache:
+    """Tests for HTTPCache."""
+
+    def test_round_trips_body_and_validators(self, tmp_path):
+        cache = make_cache(tmp_path)
+        cache.store("https://a.gov/1", "<html>page</html>", etag='"abc"', last_modified="Mon")
+
+        assert cache.read_body("https://a.gov/1") == "<html>page</html>"
+        assert cache.validators("https://a.gov/1") == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon",
+        }
+
+    def test_skips_responses_without_validators(self, tmp_path):
+        cache = make_cache(tmp_path)
+        cache.store("https://a.gov/1", "<html></html>")
+        assert cache.get("https://a.gov/1") is None
+        assert cache.validators("https://a.gov/1") == {}
+
+    def test_expired_entries_are_dropped(self, tmp_path):
+        cache = make_cache(tmp_path, ttl_seconds=0)
+        cache.store("https://a.gov/1", "<html></html>", etag='"abc"')
+        time.sleep(0.01)
+        assert cache.get("https://a.gov/1") is None
+        assert cache.read_body("https://a.gov/1") is None
+
+    def test_evicts_oldest_entries_over_size_limit(self, tmp_path):
+        cache = make_cache(tmp_path, max_bytes=1)
+        cache.store("https://a.gov/1", "first page", etag='"1"')
+        time.sleep(0.01)
+        cache.store("https://a.gov/2", "second page", etag='"2"')
+
+        assert cache.get("https://a.gov/1") is None
+
+    def test_replacing_an_entry_keeps_size_accounting(self, tmp_path):
+        cache = make_cache(tmp_path)
+        cache.store("https://a.gov/1", "first version " * 100, etag='"1"')
+        cache.store("https://a.gov/1", "second version", etag='"2"')
+        cache.store("https://a.gov/2", "other page", etag='"3"')
+
+        on_disk = sum(path.stat().st_size for path in (tmp_path / "cache").glob("*.body"))
+        assert cache._total_bytes == on_disk
@@ -0,0 +1,83 @@
+"""Tests for keyset pagination of contract listings."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models import Contract, ContractStatus, DataSource
+from src.processors.pagination import (
+    CONTRACT_ORDER,
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+)
+
+
+@pytest.fixture
+def contracts(db):
+    source = DataSource(name="Texas", base_url="https://tx.gov", scraper_class="TexasScraper")
+    db.add(source)
+    db.commit()
+
+    start = datetime(2024, 1, 1)
+    # Repeated due dates and missing ones exercise the id tie-break and NULLS LAST
+    due_dates = [start + timedelta(days=i % 7) for i in range(30)] + [None] * 8
+    db.add_all(
+        Contract(
+            external_id=str(i),
+            source_id=source.id,
+            url=f"https://tx.gov/{i}",
+            title=f"Contract {i}",
+            status=ContractStatus.OPEN,
+            due_date=due_date,
+            state="TX" if i % 2 else "OK",
+        )
+        for i, due_date in enumerate(due_dates)
+    )
+    db.commit()
+    return db.query(Contract).all()
+
+
+def walk(query, page_size):
+    """Collect every contract by following cursors."""
+    seen, after = [], None
+    while True:
+        page = keyset_page(query, after, page_size)
+        seen += page
+        if len(page) < page_size:
+            return seen
+        after = decode_cursor(encode_cursor(page[-1]))
+
+
+class TestCursor:
+    """Tests for cursor encoding."""
+
+    def test_round_trip(self):
+        contract = Contract(id=42, due_date=datetime(2024, 3, 1, 17, 30))
+        assert decode_cursor(encode_cursor(contract)) == (datetime(2024, 3, 1, 17, 30), 42)
+        assert decode_cursor(encode_cursor(Contract(id=7))) == (None, 7)
+
+    @pytest.mark.parametrize("cursor", ["", "not a cursor", "WzEsMiwzXQ", "WyJ4IiwgMV0"])
+    def test_malformed_cursor(self, cursor):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+class TestKeysetPage:
+    """Tests for keyset_page."""
+
+    @pytest.mark.parametrize("page_size", [1, 4, 7, 30, 50])
+    def test_walk_matches_ordered_listing(self, db, contracts, page_size):
+        query = db.query(Contract)
+        expected = query.order_by(*CONTRACT_ORDER).all()
+        assert walk(query, page_size) == expected
+        assert expected[-1].due_date is None
+
+    def test_walk_with_filters(self, db, contracts):
+        query = db.query(Contract).filter(Contract.state == "TX")
+        assert walk(query, 4) == query.order_by(*CONTRACT_ORDER).all()
+
+    def test_pages_match_offset_pages(self, db, contracts):
+        query = db.query(Contract)
+        first = keyset_page(query, None, 10)
+        second = keyset_page(query, decode_cursor(encode_cursor(first[-1])), 10)
+        assert second == query.order_by(*CONTRACT_ORDER).offset(10).limit(10).all()
@@ -0,0 +1,105 @@
+"""Tests for the lxml fast-path parser backend."""
+import asyncio
+
+import pytest
+
+from src.scrapers.parsing import LxmlNode, parse_document
+from src.scrapers.sam_gov import SAMGovScraper
+from src.scrapers.state_portals import CaliforniaScraper, NewYorkScraper, TexasScraper
+
+CALIFORNIA_PAGE = """
+<html><body><table id="BidSearchResults">
+<tr><th>Bid</th><th>Title</th><th>Dept</th><th>Posted</th><th>Due</th><th>Value</th></tr>
+<tr><td><a href="/event/0001">0001</a></td><td>Road  Repair</td><td>Caltrans</td>
+<td>01/02/2024</td><td>02/15/2030</td><td>$1,200.00</td></tr>
+<tr><td><a href="https://caleprocure.ca.gov/event/0002">0002</a></td><td>IT Support</td>
+<td>CDT</td><td>01/03/2024</td><td>01/10/2024</td></tr>
+</table></body></html>
+"""
+
+TEXAS_PAGE = """
+<html><body>
+<div class="opportunity-item featured">
+  <span class="solicitation-number">TX-100</span>
+  <a class="title-link" href="/esbd/TX-100">Janitorial Services</a>
+  <span class="agency">TxDOT</span><p class="summary">Cleaning of offices</p>
+  <span class="posted-date">2024-01-05</span><span class="closing-date">2030-03-01</span>
+  <span class="category">Services</span><span class="estimated-value">$50,000</span>
+</div>
+<div class="opportunity-item"><span class="agency">No number</span></div>
+</body></html>
+"""
+
+NEW_YORK_PAGE = """
+<html><body>
+<div class="advertisement">
+  <span class="ad-number">NY-7</span><h2>Bridge Inspection</h2>
+  <a class="detail-link" href="ad.cfm?id=7">Details</a>
+  <div class="agency">NYSDOT</div><div class="description">Inspect bridges</div>
+  <span class="publication-date">2024-02-01</span><span class="due-date">2030-02-01</span>
+  <span class="contract-type">Construction</span><span class="estimated-amount">$2,000</span>
+  <div class="contact-info"><span class="contact-name">Jane Roe</span>
+  jane.roe@dot.ny.gov (518) 555-0100</div>
+</div>
+</body></html>
+"""
+
+SAM_PAGE = """
+<html><body>
+<div data-testid="opportunity-result">
+  <span data-testid="notice-id">W912-24-R-0001</span>
+  <a class="opportunity-title" href="/opp/abc/view">Radar Maintenance</a>
+  <span data-testid="agency">Dept of the Army</span>
+  <span data-testid="posted-date">Jan 4, 2024</span>
+  <span data-testid="response-deadline">Mar 1, 2030</span>
+  <span data-testid="naics">334511</span><span data-testid="set-aside">SBA</span>
+  <p class="opportunity-description">Maintain radar systems</p>
+</div>
+</body></html>
+"""
+
+CASES = [
+    (CaliforniaScraper, CALIFORNIA_PAGE, 2),
+    (TexasScraper, TEXAS_PAGE, 1),
+    (NewYorkScraper, NEW_YORK_PAGE, 1),
+    (SAMGovScraper, SAM_PAGE, 1),
+]
+
+
+def parse_with(scraper_class, html, backend):
+    scraper = scraper_class(source_id=1)
+    scraper.parser_backend = backend
+    return asyncio.run(scraper.parse_listing_page(html))
+
+
+class TestLxmlNode:
+    """Tests for the BeautifulSoup-compatible lxml wrapper."""
+
+    def test_class_matches_any_token(self):
+        root = parse_document('<div class="a opportunity-item b">x</div>')
+        assert len(root.find_all("div", class_="opportunity-item")) == 1
+
+    def test_attrs_dict_and_missing_match(self):
+        root = parse_document('<span data-testid="agency">Army</span>')
+        assert root.find("span", {"data-testid": "agency"}).text == "Army"
+        assert root.find("span", {"data-testid": "naics"}) is None
+
+    def test_get_and_name(self):
+        link = parse_document('<a href="/x" class="t">y</a>').find("a")
+        assert link.name == "a"
+        assert link.get("href") == "/x"
+        assert link.get("title", "") == ""
+
+    @pytest.mark.filterwarnings("ignore::bs4.XMLParsedAsHTMLWarning")
+    def test_falls_back_to_beautifulsoup(self):
+        doc = parse_document("<?xml version='1.0' encoding='utf-8'?><p>x</p>")
+        assert not isinstance(doc, LxmlNode)
+        assert doc.find("p").text == "x"
+
+
+@pytest.mark.parametrize("scraper_class,html,expected", CASES)
+def test_backends_produce_identical_contracts(scraper_class, html, expected):
+    fast = parse_with(scraper_class, html, "lxml")
+    slow = parse_with(scraper_class, html, "bs4")
+    assert len(fast) == expected
+    assert fast == slow
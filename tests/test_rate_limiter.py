@@ -0,0 +1,87 @@
+"""Tests for the per-host token-bucket rate limiter."""
+import asyncio
+
+import pytest
+
+from src.scrapers.rate_limiter import (
+    HostRateLimiter,
+    SQLiteRateLimiter,
+    TokenBucket,
+    host_for,
+)
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_allows_burst_without_waiting(self):
+        bucket = TokenBucket(rate=1.0, capacity=3, now=0.0)
+        assert [bucket.reserve(now=0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_queues_requests_beyond_burst(self):
+        bucket = TokenBucket(rate=2.0, capacity=1, now=0.0)
+        assert bucket.reserve(now=0.0) == 0.0
+        assert bucket.reserve(now=0.0) == pytest.approx(0.5)
+        assert bucket.reserve(now=0.0) == pytest.approx(1.0)
+
+    def test_refills_at_steady_rate(self):
+        bucket = TokenBucket(rate=1.0, capacity=2, now=0.0)
+        bucket.reserve(now=0.0)
+        bucket.reserve(now=0.0)
+        assert bucket.reserve(now=1.0) == 0.0
+
+    def test_refill_capped_at_capacity(self):
+        bucket = TokenBucket(rate=1.0, capacity=2, now=0.0)
+        bucket.reserve(now=100.0)
+        bucket.reserve(now=100.0)
+        assert bucket.reserve(now=100.0) == pytest.approx(1.0)
+
+
+class TestHostRateLimiter:
+    """Tests for HostRateLimiter."""
+
+    def test_host_for_url(self):
+        assert host_for("https://www.txsmartbuy.gov/sp?page=1") == "www.txsmartbuy.gov"
+
+    def test_hosts_have_separate_buckets(self):
+        limiter = HostRateLimiter(burst=1)
+        assert limiter._reserve("a.gov", 1.0) == 0.0
+        assert limiter._reserve("b.gov", 1.0) == 0.0
+        assert limiter._reserve("a.gov", 1.0) > 0.0
+
+    def test_slowest_rate_wins(self):
+        limiter = HostRateLimiter(burst=1)
+        limiter._reserve("a.gov", 10.0)
+        limiter._reserve("a.gov", 0.5)
+        assert limiter._buckets["a.gov"].rate == 0.5
+
+    def test_concurrency_cap(self):
+        limiter = HostRateLimiter(burst=100, max_concurrency=2)
+        active = 0
+        peak = 0
+
+        async def request():
+            nonlocal active, peak
+            async with limiter.limit("https://a.gov/x", rate=None):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        async def run():
+            await asyncio.gather(*(request() for _ in range(6)))
+
+        asyncio.run(run())
+        assert peak == 2
+
+
+class TestSQLiteRateLimiter:
+    """Tests for the SQLite-backed shared limiter."""
+
+    def test_budget_shared_between_instances(self, tmp_path):
+        path = tmp_path / "limits.db"
+        first = SQLiteRateLimiter(path, burst=1)
+        second = SQLiteRateLimiter(path, burst=1)
+
+        assert first._reserve("a.gov", 0.1) == 0.0
+        assert second._reserve("a.gov", 0.1) > 0.0
@@ -0,0 +1,47 @@
+"""Tests for the fast contract list response."""
+from datetime import datetime
+
+import pytest
+
+from src.api import schemas
+from src.api.responses import contract_dicts, contract_list_response, contract_rows
+from src.models import Contract, ContractStatus, DataSource
+
+
+@pytest.fixture
+def contracts(db):
+    source = DataSource(name="Texas", base_url="https://tx.gov", scraper_class="TexasScraper")
+    db.add(source)
+    db.flush()
+    db.add_all(
+        [
+            Contract(
+                external_id="1",
+                source_id=source.id,
+                url="https://tx.gov/1",
+                title="Road repair – phase 2",
+                agency="TxDOT",
+                budget_min=1000,
+                estimated_value=2500.5,
+                due_date=datetime(2024, 5, 1, 17, 30, 0, 250),
+                status=ContractStatus.OPEN,
+                state="TX",
+            ),
+            Contract(external_id="2", source_id=source.id, url="https://tx.gov/2", title="IT"),
+        ]
+    )
+    db.commit()
+
+
+class TestContractListResponse:
+    """The fast path renders the same JSON as the ContractListResponse schema."""
+
+    def test_matches_schema_output(self, db, contracts):
+        fields = {"total": 2, "page": 1, "page_size": 50, "has_more": False}
+        expected = schemas.ContractListResponse(
+            contracts=db.query(Contract).order_by(Contract.id).all(), **fields
+        )
+
+        rows = contract_rows(db.query(Contract)).order_by(Contract.id).all()
+        response = contract_list_response(contracts=contract_dicts(rows), **fields)
+        assert response.body == expected.model_dump_json().encode()
@@ -0,0 +1,99 @@
+"""Tests for full-text keyword search."""
+import pytest
+from sqlalchemy import text
+
+from src.models import Contract, ContractStatus, DataSource, ScrapedContract
+from src.models.search import create_search_index, drop_search_index, has_search_index
+from src.processors.aggregator import ContractAggregator
+from src.processors.search import fts5_query, keyword_search, search_terms, tsquery
+
+
+@pytest.fixture
+def source(db):
+    source = DataSource(name="Texas", base_url="https://tx.gov", scraper_class="TexasScraper")
+    db.add(source)
+    db.commit()
+    return source
+
+
+def scraped(source, external_id, title, **fields):
+    return ScrapedContract(
+        external_id=external_id,
+        source_id=source.id,
+        url=f"https://tx.gov/{external_id}",
+        title=title,
+        status=ContractStatus.OPEN,
+        **fields,
+    )
+
+
+def search(db, keyword, by_relevance=False):
+    query, relevance = keyword_search(db.query(Contract), keyword)
+    query = query.order_by(relevance) if by_relevance else query.order_by(Contract.external_id)
+    return [contract.external_id for contract in query.all()]
+
+
+class TestSearchTerms:
+    """Tests for keyword parsing."""
+
+    def test_terms_drop_punctuation(self):
+        assert search_terms('Road "repair", phase-2') == ["road", "repair", "phase", "2"]
+
+    def test_query_builders(self):
+        assert fts5_query(["road", "rep"]) == '"road"* "rep"*'
+        assert tsquery(["road", "rep"]) == "road:* & rep:*"
+
+
+class TestKeywordSearch:
+    """Tests for keyword_search against the SQLite FTS5 index."""
+
+    @pytest.fixture(autouse=True)
+    def contracts(self, db, source):
+        ContractAggregator(db).save_batch(
+            [
+                scraped(source, "1", "Road repair on Highway 6", agency="TxDOT"),
+                scraped(source, "2", "Janitorial services", description="Office road map"),
+                scraped(source, "3", "Bridge construction", agency="Road Authority"),
+                scraped(source, "4", "IT support"),
+            ],
+            source,
+        )
+
+    def test_index_is_created_with_tables(self, db):
+        assert has_search_index(db.get_bind())
+
+    def test_matches_title_description_and_agency(self, db):
+        assert search(db, "road") == ["1", "2", "3"]
+
+    def test_prefix_and_all_terms(self, db):
+        assert search(db, "constr") == ["3"]
+        assert search(db, "road rep") == ["1"]
+        assert search(db, "Repairs") == ["1"]
+
+    def test_ranks_title_matches_first(self, db):
+        assert search(db, "road", by_relevance=True)[0] == "1"
+        assert search(db, "road", by_relevance=True)[-1] == "2"
+
+    def test_punctuation_only_falls_back_to_like(self, db):
+        assert search(db, "!!!") == []
+
+    def test_follows_updates_and_deletes(self, db, source):
+        ContractAggregator(db).save_batch([scraped(source, "4", "Road striping")], source)
+        assert search(db, "striping") == ["4"]
+        assert search(db, "support") == []
+
+        db.query(Contract).filter(Contract.external_id == "1").delete()
+        db.commit()
+        assert search(db, "road") == ["2", "3", "4"]
+
+    def test_index_built_for_existing_contracts(self, db):
+        drop_search_index(db.connection())
+        assert not has_search_index(db.get_bind())
+        assert search(db, "road") == ["1", "2", "3"]
+
+        create_search_index(db.connection())
+        db.commit()
+        assert has_search_index(db.get_bind())
+        count = db.execute(text("SELECT count(*) FROM contract_search")).scalar()
+        assert count == 4
+        assert search(db, "highway") == ["1"]
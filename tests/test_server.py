@@ -0,0 +1,19 @@
+"""Tests for the API server launchers."""
+from src.api import server
+from src.config import settings
+
+
+class TestWorkerCount:
+    """Tests for worker_count."""
+
+    def test_explicit_count_wins(self, monkeypatch):
+        monkeypatch.setattr(settings, "api_workers", 3)
+        assert server.worker_count(5) == 5
+        assert server.worker_count() == 3
+
+    def test_defaults_to_cpu_count(self, monkeypatch):
+        monkeypatch.setattr(settings, "api_workers", 0)
+        monkeypatch.setattr(server.os, "cpu_count", lambda: 8)
+        assert server.worker_count() == 8
+        monkeypatch.setattr(server.os, "cpu_count", lambda: None)
+        assert server.worker_count() == 1
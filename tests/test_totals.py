@@ -0,0 +1,137 @@
+"""Tests for search total counting."""
+import pytest
+
+from src.models import Contract, ContractStatus, DataSource, ScrapedContract
+from src.processors import totals
+from src.processors.aggregator import ContractAggregator
+from src.processors.totals import count_total, filter_signature
+from src.utils import cache as cache_module
+from src.utils.cache import TTLCache
+
+
+@pytest.fixture
+def source(db):
+    source = DataSource(name="Texas", base_url="https://tx.gov", scraper_class="TexasScraper")
+    db.add(source)
+    db.commit()
+    return source
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = TTLCache(ttl_seconds=60, max_entries=16)
+    monkeypatch.setattr(totals, "_cache", cache)
+    return cache
+
+
+def scraped(source, external_id, **fields):
+    fields.setdefault("status", ContractStatus.OPEN)
+    return ScrapedContract(
+        external_id=external_id,
+        source_id=source.id,
+        url=f"https://tx.gov/{external_id}",
+        title=f"Contract {external_id}",
+        **fields,
+    )
+
+
+@pytest.fixture
+def contracts(db, source):
+    ContractAggregator(db).save_batch(
+        [
+            scraped(source, "1", state="TX", category="Road Construction"),
+            scraped(source, "2", state="TX", category="IT", status=ContractStatus.CLOSED),
+            scraped(source, "3", state="OK", category="Roads"),
+            scraped(source, "4"),
+        ],
+        source,
+    )
+
+
+class TestTTLCache:
+    """Tests for the TTL/LRU cache behind cached totals."""
+
+    def test_expires_after_ttl(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = TTLCache(ttl_seconds=10, max_entries=4)
+        cache.set("a", 3)
+        now[0] += 10
+        assert cache.get("a") == 3
+        now[0] += 1
+        assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+    def test_delete_where(self):
+        cache = TTLCache(ttl_seconds=60, max_entries=4)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.delete_where(lambda value: value > 1) == 1
+        assert (cache.get("a"), cache.get("b")) == (1, None)
+
+
+class TestFilterSignature:
+    """Tests for cache key normalization."""
+
+    def test_drops_unset_filters_and_ignores_order(self):
+        assert filter_signature({"state": "TX", "keyword": None, "collapse": False}) == (
+            ("state", "TX"),
+        )
+        assert filter_signature({"a": 1, "b": 2}) == filter_signature({"b": 2, "a": 1})
+
+    def test_lowercases_only_case_insensitive_filters(self):
+        assert filter_signature({"keyword": "Road"}) == filter_signature({"keyword": "road"})
+        assert filter_signature({"state": "TX"}) != filter_signature({"state": "tx"})
+
+
+class TestCountTotal:
+    """Tests for count_total."""
+
+    def test_exact_and_none(self, db, contracts, cache):
+        query = db.query(Contract).filter(Contract.state == "TX")
+        assert count_total(db, query, {"state": "TX"}, "exact") == (2, False)
+        assert count_total(db, query, {"state": "TX"}, "none") == (None, False)
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {},
+            {"state": "TX"},
+            {"status": ContractStatus.OPEN},
+            {"category": "road"},
+            {"state": "TX", "status": ContractStatus.CLOSED, "category": None},
+        ],
+    )
+    def test_estimated_from_rollup_matches_exact(self, db, contracts, cache, filters):
+        query = db.query(Contract)
+        if filters.get("state"):
+            query = query.filter(Contract.state == filters["state"])
+        if filters.get("status"):
+            query = query.filter(Contract.status == filters["status"])
+        if filters.get("category"):
+            query = query.filter(Contract.category.ilike(f"%{filters['category']}%"))
+        assert count_total(db, query, filters, "estimated") == (query.count(), False)
+
+    def test_estimated_falls_back_to_cached_count(self, db, contracts, cache):
+        query = db.query(Contract).filter(Contract.title.ilike("%1%"))
+        assert count_total(db, query, {"keyword": "1"}, "estimated") == (1, False)
+        assert len(cache) == 1
+
+    def test_cached_until_contracts_change(self, db, source, contracts, cache):
+        query = db.query(Contract).filter(Contract.state == "TX")
+        assert count_total(db, query, {"state": "TX"}, "cached") == (2, False)
+
+        # A write that bypasses the aggregator is only seen once the entry expires
+        db.add(Contract(external_id="5", source_id=source.id, url="u", title="t", state="TX"))
+        db.commit()
+        assert count_total(db, query, {"state": "TX"}, "cached") == (2, False)
+
+        ContractAggregator(db).save_batch([scraped(source, "6", state="TX")], source)
+        assert count_total(db, query, {"state": "TX"}, "cached") == (4, False)